@@ -0,0 +1,75 @@
+"""
+Move-generation and path-check microbenchmarks comparing `Board` with `BitBoard`.
+
+Both boards generate pawn moves from the same per-cell open-edges table
+(`pawn_move_cells`), so move generation runs at about the same rate on
+either; `BitBoard` only pulls ahead on path checks, which flood-fill the
+whole board with integer shifts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_board
+"""
+import timeit
+
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.utils.types import Position, WallOrientation
+
+# A mid-game position: pawns face to face with a few walls around them.
+PAWN2_PATH = [Position(7, 4), Position(6, 4), Position(5, 4), Position(4, 4)]
+WALLS = [
+    (WallOrientation.HORIZONTAL, Position(4, 3)),
+    (WallOrientation.VERTICAL, Position(2, 5)),
+    (WallOrientation.HORIZONTAL, Position(6, 0)),
+    (WallOrientation.VERTICAL, Position(5, 2)),
+]
+
+
+def build_position(board_class):
+    board = board_class()
+    for position in PAWN2_PATH:
+        board.move_pawn(board.pawn2, position)
+    board.move_pawn(board.pawn1, Position(1, 4))
+    board.move_pawn(board.pawn1, Position(2, 4))
+    board.move_pawn(board.pawn1, Position(3, 4))
+    for orientation, position in WALLS:
+        board.place_wall(orientation, position)
+    return board
+
+
+def move_generation_rate(board_class, number=20000):
+    """Return pawn move generations per second for both pawns of the benchmark position."""
+    board = build_position(board_class)
+
+    def generate():
+        board.get_all_valid_pawn_moves(board.pawn1)
+        board.get_all_valid_pawn_moves(board.pawn2)
+
+    seconds = min(timeit.repeat(generate, number=number, repeat=3))
+    return 2 * number / seconds
+
+
+def path_check_rate(board_class, number=5000):
+    """Return path checks per second for both pawns of the benchmark position."""
+    board = build_position(board_class)
+
+    def check():
+        board.is_path_blocked(board.pawn1.position, 8)
+        board.is_path_blocked(board.pawn2.position, 0)
+
+    seconds = min(timeit.repeat(check, number=number, repeat=3))
+    return 2 * number / seconds
+
+
+def main():
+    for label, measure in (("move generations/s", move_generation_rate), ("path checks/s", path_check_rate)):
+        board_rate = measure(Board)
+        bitboard_rate = measure(BitBoard)
+        print(f"Board     {board_rate:12,.0f} {label}")
+        print(f"BitBoard  {bitboard_rate:12,.0f} {label}")
+        print(f"Speedup   {bitboard_rate / board_rate:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
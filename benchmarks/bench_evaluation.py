@@ -0,0 +1,64 @@
+"""
+Evaluation throughput: each feature on its own, and the default evaluator
+recomputing everything versus updating incrementally.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_evaluation
+"""
+import random
+import time
+import timeit
+
+from quoridor.src.evaluation import FEATURE_CLASSES, Evaluator
+from quoridor.src.game import Game
+
+
+def mid_game(seed=1, plies=16, wall_probability=0.4):
+    """A reproducible mid-game position reached by random pawn moves and walls."""
+    rng = random.Random(seed)
+    game = Game()
+    for _ in range(plies):
+        walls = game.generate_legal_walls()
+        if walls and rng.random() < wall_probability:
+            game.apply(rng.choice(walls))
+        else:
+            game.apply(rng.choice([move for move in game.get_legal_moves() if not move.is_wall()]))
+    return game
+
+
+def feature_rate(feature, number=20000):
+    """Return `compute` calls per second for one feature."""
+    game = mid_game()
+    seconds = min(timeit.repeat(lambda: feature.compute(game), number=number, repeat=3))
+    return number / seconds
+
+
+def search_walk_rate(evaluator, number=20):
+    """
+    Return evaluations per second when scoring every child of the position,
+    as a depth-1 search does. Only the evaluator calls are timed, not the
+    apply/undo around them.
+    """
+    game = mid_game()
+    moves = game.get_legal_moves()
+    seconds = 0.0
+    for _ in range(number):
+        for move in moves:
+            game.apply(move)
+            start = time.perf_counter()
+            evaluator(game, 1)
+            seconds += time.perf_counter() - start
+            game.undo()
+    return number * len(moves) / seconds
+
+
+def main():
+    for name, feature_class in FEATURE_CLASSES.items():
+        print(f"{name:20} {feature_rate(feature_class()):12,.0f} evals/s")
+    print(f"{'combined (fresh)':20} {search_walk_rate(Evaluator(incremental=False)):12,.0f} evals/s")
+    print(f"{'combined (incr.)':20} {search_walk_rate(Evaluator()):12,.0f} evals/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Effect of move ordering on alpha-beta: nodes searched and time to reach a
+fixed depth, with and without a `MoveOrderer`, over seeded mid-game positions.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_move_ordering
+"""
+from benchmarks.bench_evaluation import mid_game
+from quoridor.src.ai_agents import AlphaBetaAgent
+from quoridor.src.move_ordering import MoveOrderer
+
+SEEDS = (1, 2, 3)
+
+
+def search_cost(depth, move_orderer=None, seeds=SEEDS):
+    """Return total (nodes, seconds) of fixed-depth searches over the seeded positions."""
+    nodes = seconds = 0
+    for seed in seeds:
+        agent = AlphaBetaAgent(time_budget_ms=10 ** 7, max_depth=depth, move_orderer=move_orderer)
+        agent.select_move(mid_game(seed))
+        nodes += agent.last_stats.nodes
+        seconds += agent.last_stats.elapsed_seconds
+    return nodes, seconds
+
+
+def main(max_depth=3):
+    print(f"{'depth':>5} {'ordering':>9} {'nodes':>10} {'seconds':>9}")
+    for depth in range(1, max_depth + 1):
+        baseline_nodes, baseline_seconds = search_cost(depth)
+        ordered_nodes, ordered_seconds = search_cost(depth, MoveOrderer())
+        print(f"{depth:>5} {'none':>9} {baseline_nodes:>10,} {baseline_seconds:>9.2f}")
+        print(f"{depth:>5} {'ordered':>9} {ordered_nodes:>10,} {ordered_seconds:>9.2f}")
+        print(f"{depth:>5} {'ratio':>9} {baseline_nodes / ordered_nodes:>10.1f}x {baseline_seconds / ordered_seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Memory and allocation benchmarks for the core value types.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_types
+"""
+import timeit
+import tracemalloc
+
+from benchmarks.bench_board import build_position
+from quoridor.src.board import Board
+from quoridor.src.utils.types import Direction, Position
+
+
+def bytes_per_board(count=200):
+    """Return the memory allocated per freshly built `Board`."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    boards = [Board() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del boards
+    return allocated / count
+
+
+def neighbour_step_rate(number=2000):
+    """Return `Position + Direction` steps per second over every cell and direction."""
+    positions = [Position(row, col) for row in range(9) for col in range(9)]
+    steps = [direction.value for direction in Direction]
+
+    def walk():
+        for position in positions:
+            for step in steps:
+                position + step
+
+    seconds = min(timeit.repeat(walk, number=number, repeat=3))
+    return number * len(positions) * len(steps) / seconds
+
+
+def path_check_rate(number=20000):
+    """Return `Board.is_path_blocked` calls per second, to a goal row and to a middle row."""
+    board = build_position(Board)
+
+    def check():
+        board.is_path_blocked(board.pawn1.position, 8)
+        board.is_path_blocked(board.pawn2.position, 1)
+
+    seconds = min(timeit.repeat(check, number=number, repeat=3))
+    return 2 * number / seconds
+
+
+def main():
+    print(f"Board memory        {bytes_per_board():12,.0f} bytes")
+    print(f"Neighbour steps     {neighbour_step_rate():12,.0f} /s")
+    print(f"Path checks         {path_check_rate():12,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Reproducible benchmark positions, built from a seed so every run and every
+machine measures the same boards.
+"""
+import random
+
+from quoridor.src.game import Game
+from quoridor.src.utils.helpers import WALL_ORIENTATIONS, WALL_POSITIONS
+from quoridor.src.utils.types import Move
+
+
+def empty_position(seed=0) -> Game:
+    """The starting position."""
+    return Game()
+
+
+def mid_game_position(seed=0, plies=24, wall_probability=0.5) -> Game:
+    """Pawns a few steps out and a dozen or so walls, from random legal moves."""
+    rng = random.Random(seed)
+    game = Game()
+    for _ in range(plies):
+        walls = game.generate_legal_walls()
+        if walls and rng.random() < wall_probability:
+            game.apply(rng.choice(walls))
+        else:
+            game.apply(Move.pawn(rng.choice(game.get_valid_moves())))
+    return game
+
+
+def maze_position(seed=0) -> Game:
+    """
+    All 20 walls placed and both pawns on their start cells: long detours and
+    narrow corridors. Walls are drawn at random and kept when legal.
+    """
+    rng = random.Random(seed)
+    game = Game()
+    while game.walls_remaining[game.current_player_id]:
+        game.apply(Move.wall(rng.choice(WALL_ORIENTATIONS), rng.choice(WALL_POSITIONS)))
+    return game
+
+
+POSITIONS = {
+    "empty": empty_position,
+    "mid_game": mid_game_position,
+    "maze": maze_position,
+}
+
+
+def build_positions(seed=0) -> dict:
+    """Build every benchmark position for a seed, keyed by name."""
+    return {name: build(seed) for name, build in POSITIONS.items()}
@@ -0,0 +1,252 @@
+"""
+Benchmark suite for the board, game and agent hot paths.
+
+Every benchmark runs on each seeded position of `benchmarks.positions` and
+reports operations per second plus, from `tracemalloc`, the peak memory one
+operation allocates and the memory blocks it leaves behind. Results can be
+saved as JSON and compared against a saved baseline:
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json --output current.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+from benchmarks.positions import build_positions
+from quoridor.src.game import Game
+from quoridor.src.mcts import rollout
+from quoridor.src.opening_book import OpeningBookBuilder
+from quoridor.src.utils.helpers import WALL_ORIENTATIONS, WALL_POSITIONS
+
+FORMAT_VERSION = 1
+
+
+def _path_checks(game):
+    """Path checks to both goal rows (distance-map lookups) and to the middle row (a search)."""
+    board = game.board
+    pawn1, pawn2 = board.pawn1.position, board.pawn2.position
+
+    def operation():
+        board.is_path_blocked(pawn1, 8)
+        board.is_path_blocked(pawn2, 0)
+        board.is_path_blocked(pawn1, 4)
+    return operation, 3
+
+
+def _pawn_moves(game):
+    board = game.board
+
+    def operation():
+        board.get_all_valid_pawn_moves(board.pawn1)
+        board.get_all_valid_pawn_moves(board.pawn2)
+    return operation, 2
+
+
+def _wall_checks(game):
+    """`can_place_wall_at_position` over every wall anchor of both orientations."""
+    board = game.board
+    walls = [(orientation, position) for orientation in WALL_ORIENTATIONS for position in WALL_POSITIONS]
+
+    def operation():
+        for orientation, position in walls:
+            board.can_place_wall_at_position(orientation, position)
+    return operation, len(walls)
+
+
+def _place_wall(game):
+    """`Game.place_wall` and undo of the first legal walls; walls are handed back if a side is out."""
+    game = game.clone()
+    game.walls_remaining = {1: 10, 2: 10}
+    walls = game.generate_legal_walls()[:16]
+
+    def operation():
+        for move in walls:
+            game.place_wall(move.orientation, move.position)
+            game.undo()
+    return operation, len(walls)
+
+
+def _legal_moves(game):
+    def operation():
+        game.get_legal_moves()
+    return operation, 1
+
+
+def _book_lookup(game):
+    """Opening book lookups of the start position (many book moves) and of the position itself."""
+    rng = random.Random(0)
+    builder = OpeningBookBuilder(max_plies=len(game.get_move_history()) + 1)
+    for _ in range(200):
+        opening = Game()
+        for _ in range(8):
+            opening.apply(rng.choice(opening.get_legal_moves()))
+        builder.add_game(opening)
+    builder.add_game(game)
+    book = builder.build()
+    start = Game()
+
+    def operation():
+        book.lookup(start)
+        book.lookup(game)
+    return operation, 2
+
+
+def _playout(game):
+    """Greedy random playouts to the end of the game, as MCTS runs them."""
+    game = game.clone()
+    rng = random.Random(0)
+
+    def operation():
+        rollout(game, rng)
+    return operation, 1
+
+
+# Benchmark name -> setup(game) returning (operation, number of ops it performs)
+BENCHMARKS = {
+    "is_path_blocked": _path_checks,
+    "get_all_valid_pawn_moves": _pawn_moves,
+    "can_place_wall_at_position": _wall_checks,
+    "place_wall": _place_wall,
+    "get_legal_moves": _legal_moves,
+    "book_lookup": _book_lookup,
+    "playout": _playout,
+}
+
+
+def ops_per_second(operation, ops, min_seconds=0.2, repeat=3):
+    """Time `operation` (performing `ops` operations per call) and return the best rate of `repeat` runs."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_seconds / 0.2))
+    return number * ops / min(timer.repeat(repeat=repeat, number=number))
+
+
+def _traced_allocations(operation, calls):
+    """Return (largest peak of one call, blocks still allocated after all calls) under `tracemalloc`."""
+    tracemalloc.start()
+    try:
+        peak = 0
+        before = tracemalloc.take_snapshot()
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - start)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return peak, sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+def allocations(operation, ops, calls=20):
+    """
+    Return (peak bytes allocated during one operation, blocks retained per
+    operation). The same measurement of an empty call is subtracted, so
+    tracing overhead doesn't count.
+    """
+    operation()  # Warm caches so they don't count
+    empty_peak, empty_retained = _traced_allocations(lambda: None, calls)
+    peak, retained = _traced_allocations(operation, calls)
+    return max(peak - empty_peak, 0) / ops, max(retained - empty_retained, 0) / (calls * ops)
+
+
+def run_suite(seed=0, names=None, min_seconds=0.2) -> dict:
+    """Run the benchmarks (all, or those in `names`) on every position and return the results."""
+    positions = build_positions(seed)
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for position_name, game in positions.items():
+            operation, ops = setup(game)
+            peak_bytes, retained_blocks = allocations(operation, ops)
+            results[f"{name}/{position_name}"] = {
+                "ops_per_second": round(ops_per_second(operation, ops, min_seconds), 1),
+                "peak_bytes_per_op": round(peak_bytes, 1),
+                "retained_blocks_per_op": round(retained_blocks, 3),
+            }
+    return {
+        "version": FORMAT_VERSION,
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold=0.1) -> list[tuple]:
+    """
+    Return (benchmark, baseline ops/s, current ops/s, ratio, verdict) for every
+    benchmark in both runs; verdict is "faster" or "slower" when the ratio is
+    beyond `threshold`, else "same".
+    """
+    rows = []
+    for key, result in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            continue
+        ratio = result["ops_per_second"] / old["ops_per_second"]
+        if ratio > 1 + threshold:
+            verdict = "faster"
+        elif ratio < 1 - threshold:
+            verdict = "slower"
+        else:
+            verdict = "same"
+        rows.append((key, old["ops_per_second"], result["ops_per_second"], ratio, verdict))
+    return rows
+
+
+def format_results(run: dict) -> str:
+    lines = [f"{'benchmark':45} {'ops/s':>14} {'peak B/op':>10} {'blocks/op':>10}"]
+    for key, result in run["results"].items():
+        lines.append(
+            f"{key:45} {result['ops_per_second']:14,.0f} {result['peak_bytes_per_op']:10,.0f} "
+            f"{result['retained_blocks_per_op']:10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows) -> str:
+    lines = [f"{'benchmark':45} {'baseline':>14} {'current':>14} {'ratio':>7}"]
+    for key, old, new, ratio, verdict in rows:
+        lines.append(f"{key:45} {old:14,.0f} {new:14,.0f} {ratio:6.2f}x {verdict if verdict != 'same' else ''}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the board, game and agent hot paths.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="Minimum timing run length")
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against results saved earlier")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative change reported as a difference")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 if anything is slower")
+    args = parser.parse_args(argv)
+
+    run = run_suite(args.seed, args.only, args.min_seconds)
+    print(format_results(run))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(run, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        rows = compare(run, baseline, args.threshold)
+        print()
+        print(format_comparison(rows))
+        if args.fail_on_regression and any(verdict == "slower" for *_, verdict in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
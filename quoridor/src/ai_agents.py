@@ -0,0 +1,249 @@
+import time
+from abc import ABC, abstractmethod
+
+from quoridor.src.game import Game
+from quoridor.src.tablebase import LOSS, WIN
+from quoridor.src.transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from quoridor.src.utils.types import Move
+
+# Score of a won position; wins found sooner score higher (WIN_SCORE - ply).
+WIN_SCORE = 100000
+# Scores beyond this are wins or losses, whose ply offset must be made relative
+# to the node when stored in a transposition table
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+
+class Agent(ABC):
+    """Something that picks a move for the current player of a game."""
+
+    @abstractmethod
+    def select_move(self, game: Game) -> Move:
+        """Return a legal move for `game.current_player_id`. Must leave `game` unchanged."""
+        pass
+
+
+def shortest_path_evaluation(game: Game, player_id: int) -> float:
+    """
+    Score a position for `player_id`: how many steps closer to goal than the
+    opponent the player is, with walls in hand as a tie-breaker.
+    """
+    board = game.board
+    opponent_id = 3 - player_id
+    pawn = board.pawn1 if player_id == 1 else board.pawn2
+    opponent_pawn = board.pawn2 if player_id == 1 else board.pawn1
+    own_distance = board.distance_to_goal(player_id, pawn.position)
+    opponent_distance = board.distance_to_goal(opponent_id, opponent_pawn.position)
+    return (
+        10 * (opponent_distance - own_distance)
+        + game.walls_remaining[player_id]
+        - game.walls_remaining[opponent_id]
+    )
+
+
+class SearchStats:
+    """Counters describing one `select_move` call."""
+
+    def __init__(self):
+        self.nodes = 0
+        self.tt_cutoffs = 0
+        self.depth = 0
+        self.score = None
+        self.best_move = None
+        self.elapsed_seconds = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def __repr__(self):
+        return (
+            f"SearchStats(depth={self.depth}, nodes={self.nodes}, tt_cutoffs={self.tt_cutoffs}, "
+            f"nps={self.nodes_per_second:.0f}, score={self.score}, best_move={self.best_move!r})"
+        )
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class AlphaBetaAgent(Agent):
+    """
+    Negamax search with alpha-beta pruning and iterative deepening.
+
+    Searches depth 1, 2, ... until `max_depth` or until `time_budget_ms` runs
+    out, and plays the best move of the deepest completed iteration. The
+    search walks a single `Game` with `apply`/`undo`, so it never copies the
+    position. Statistics of the last search are kept in `last_stats`.
+
+    Pass a `TranspositionTable` (or `tt_memory_mb`) to reuse results for
+    positions reached through different move orders, within and across moves.
+    Pass an `EndgameTablebase` to play and score positions where neither side
+    has walls left exactly, without searching them, and a `MoveOrderer` to
+    try promising moves first at every node.
+    """
+
+    def __init__(self, time_budget_ms=1000, max_depth=64, evaluate=shortest_path_evaluation,
+                 transposition_table=None, tt_memory_mb=None, tablebase=None, move_orderer=None):
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        self.evaluate = evaluate
+        if transposition_table is None and tt_memory_mb is not None:
+            transposition_table = TranspositionTable(tt_memory_mb)
+        self.transposition_table = transposition_table
+        self.tablebase = tablebase
+        self.move_orderer = move_orderer
+        self.last_stats = SearchStats()
+        self._deadline = None
+        self._root_best = None
+
+    def select_move(self, game: Game) -> Move:
+        stats = SearchStats()
+        self.last_stats = stats
+        start_time = time.perf_counter()
+        self._deadline = start_time + self.time_budget_ms / 1000
+        player_id = game.current_player_id
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+        if self.move_orderer is not None:
+            self.move_orderer.new_search()
+
+        if self.tablebase is not None:
+            move = self.tablebase.best_move(game)
+            if move is not None:
+                stats.score = _tablebase_score(self.tablebase.probe(game), 0)
+                stats.best_move = move
+                stats.elapsed_seconds = time.perf_counter() - start_time
+                return move
+
+        root_moves = game.get_legal_moves()
+        if not root_moves:
+            raise ValueError("No legal moves")
+        if self.move_orderer is not None:
+            root_moves = self.move_orderer.order(game, root_moves, 0)
+        best_move = root_moves[0]
+
+        try:
+            for depth in range(1, self.max_depth + 1):
+                score, move = self._search_root(game, root_moves, depth, player_id, stats)
+                best_move = move
+                stats.depth = depth
+                stats.score = score
+                # Search the previous best move first in the next iteration
+                root_moves.remove(move)
+                root_moves.insert(0, move)
+                if abs(score) >= WIN_SCORE - self.max_depth:
+                    break  # Forced result found, deeper search will not change it
+        except _SearchTimeout:
+            if stats.depth == 0 and self._root_best is not None:
+                # Not even depth 1 finished; the best of the moves it got through beats a blind pick
+                stats.score, best_move = self._root_best
+
+        stats.best_move = best_move
+        stats.elapsed_seconds = time.perf_counter() - start_time
+        return best_move
+
+    def _search_root(self, game, root_moves, depth, player_id, stats):
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move = None
+        self._root_best = None
+        for move in root_moves:
+            game.apply(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1, 3 - player_id, stats)
+            finally:
+                game.undo()
+            if best_move is None or score > alpha:
+                alpha = score
+                best_move = move
+                self._root_best = (alpha, best_move)
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply, player_id, stats):
+        """Return the score of the position for `player_id`, the side to move."""
+        stats.nodes += 1
+        if time.perf_counter() >= self._deadline:
+            raise _SearchTimeout()
+
+        if game.is_game_over():
+            # The side that just moved won
+            return -(WIN_SCORE - ply) if game.get_winner() != player_id else WIN_SCORE - ply
+        if self.tablebase is not None:
+            entry = self.tablebase.probe(game)
+            if entry is not None:
+                return _tablebase_score(entry, ply)
+        if depth == 0:
+            return self.evaluate(game, player_id)
+
+        table = self.transposition_table
+        table_move = None
+        if table is not None:
+            entry = table.probe(game.hash_key)
+            if entry is not None:
+                entry_depth, bound, score, table_move = entry
+                if entry_depth >= depth:
+                    score = _score_from_table(score, ply)
+                    if (bound == EXACT
+                            or (bound == LOWER_BOUND and score >= beta)
+                            or (bound == UPPER_BOUND and score <= alpha)):
+                        stats.tt_cutoffs += 1
+                        return score
+
+        moves = game.get_legal_moves()
+        if not moves:
+            return self.evaluate(game, player_id)  # Pawn boxed in by the other pawn and no walls left
+        if self.move_orderer is not None:
+            moves = self.move_orderer.order(game, moves, ply, table_move)
+        elif table_move is not None and table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        original_alpha = alpha
+        best_move = None
+        for move in moves:
+            game.apply(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1, 3 - player_id, stats)
+            finally:
+                game.undo()
+            if score >= beta:
+                if self.move_orderer is not None:
+                    self.move_orderer.record_cutoff(move, ply, depth, player_id)
+                if table is not None:
+                    table.store(game.hash_key, depth, LOWER_BOUND, _score_to_table(score, ply), move)
+                return score
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        if table is not None:
+            bound = EXACT if alpha > original_alpha else UPPER_BOUND
+            table.store(game.hash_key, depth, bound, _score_to_table(alpha, ply), best_move)
+        return alpha
+
+
+def _tablebase_score(entry, ply):
+    """Turn a tablebase (result, distance) into a search score for the side to move."""
+    result, distance = entry
+    if result == WIN:
+        return WIN_SCORE - (ply + distance)
+    if result == LOSS:
+        return -(WIN_SCORE - (ply + distance))
+    return 0
+
+
+def _score_to_table(score, ply):
+    """Make a win/loss score relative to the node being stored instead of the root."""
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """Make a stored win/loss score relative to the root again."""
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
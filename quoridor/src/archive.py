@@ -0,0 +1,203 @@
+"""
+Memory-mapped archive of finished games with random access by game or position.
+
+Layout (little-endian):
+    header      HEADER_FORMAT: magic, version, game count, position count,
+                offset of the records section, offset of the index
+    positions   POSITION_SIZE bytes per position (see `serialization`); every
+                position of every game in order, the start position included
+    records     the game records (see `serialization`), back to back
+    index       INDEX_FORMAT per game: record offset and length, index of its
+                first position, position count and winner (0 if none)
+
+Reading goes through `mmap`, so looking up a game or a position only slices
+the mapped file; nothing is decoded until the caller asks for a `Game`.
+"""
+import mmap
+import shutil
+import struct
+import tempfile
+
+from quoridor.src.board import Board
+from quoridor.src.serialization import (
+    POSITION_FORMAT, POSITION_SIZE, decode_game, decode_moves, decode_position, encode_game, encode_position,
+)
+from quoridor.src.utils.helpers import decode_move
+
+MAGIC = b"QARC"
+VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sB3xQQQQ")
+INDEX_FORMAT = struct.Struct("<QIQHB")
+
+
+class ArchiveWriter:
+    """
+    Write games to a new archive file. Positions go straight to the file;
+    records are spooled to a temporary file and appended, with the index, by
+    `close()`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(bytes(HEADER_FORMAT.size))
+        self._records = tempfile.TemporaryFile()
+        self._index = bytearray()
+        self.game_count = 0
+        self.position_count = 0
+
+    def add(self, game):
+        """Append a game: its record and every position it went through."""
+        positions = [encode_position(game)]
+        start = game.clone()
+        while start.undo():
+            positions.append(encode_position(start))
+        positions.reverse()
+
+        record = encode_game(game)
+        winner = game.get_winner() or 0
+        self._index += INDEX_FORMAT.pack(self._records.tell(), len(record), self.position_count, len(positions), winner)
+        self._records.write(record)
+        self._file.write(b"".join(positions))
+        self.game_count += 1
+        self.position_count += len(positions)
+
+    def close(self):
+        if self._file.closed:
+            return
+        records_offset = self._file.tell()
+        self._records.seek(0)
+        shutil.copyfileobj(self._records, self._file)
+        self._records.close()
+        index_offset = self._file.tell()
+        self._file.write(self._index)
+        self._file.seek(0)
+        self._file.write(HEADER_FORMAT.pack(
+            MAGIC, VERSION, self.game_count, self.position_count, records_offset, index_offset,
+        ))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameArchive:
+    """
+    Read-only view of an archive file through `mmap`.
+
+    `record`, `position_bytes` and `positions` return zero-copy memoryview
+    slices; `game`, `position` and `replay` decode into `Game` objects only
+    when called. Slices and `position_array` results point into the mapping,
+    so they must be dropped before `close()`.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, self.game_count, self.position_count, records_offset, index_offset = (
+            HEADER_FORMAT.unpack_from(self._view)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Not a game archive")
+        self._positions_offset = HEADER_FORMAT.size
+        self._records_offset = records_offset
+        self._index_offset = index_offset
+
+    def __len__(self):
+        return self.game_count
+
+    def _index_entry(self, game_id):
+        if not 0 <= game_id < self.game_count:
+            raise IndexError("Game id out of range")
+        return INDEX_FORMAT.unpack_from(self._view, self._index_offset + game_id * INDEX_FORMAT.size)
+
+    def record(self, game_id) -> memoryview:
+        """The game record of a game, as a slice of the mapped file."""
+        offset, length, _, _, _ = self._index_entry(game_id)
+        start = self._records_offset + offset
+        return self._view[start:start + length]
+
+    def winner(self, game_id):
+        """The winner of a game, or None, without decoding it."""
+        return self._index_entry(game_id)[4] or None
+
+    def position_range(self, game_id) -> range:
+        """Indices of a game's positions, from its start to its final position."""
+        _, _, first, count, _ = self._index_entry(game_id)
+        return range(first, first + count)
+
+    def position_bytes(self, index) -> memoryview:
+        """One encoded position, as a slice of the mapped file."""
+        if not 0 <= index < self.position_count:
+            raise IndexError("Position index out of range")
+        start = self._positions_offset + index * POSITION_SIZE
+        return self._view[start:start + POSITION_SIZE]
+
+    def positions(self, start=0, stop=None) -> memoryview:
+        """A contiguous run of encoded positions, POSITION_SIZE bytes each."""
+        stop = self.position_count if stop is None else min(stop, self.position_count)
+        return self._view[self._positions_offset + start * POSITION_SIZE:self._positions_offset + stop * POSITION_SIZE]
+
+    def iter_position_fields(self, start=0, stop=None):
+        """
+        Yield the raw fields of each position (see `POSITION_FORMAT`) without
+        building any `Game`.
+        """
+        return POSITION_FORMAT.iter_unpack(self.positions(start, stop))
+
+    def position_array(self):
+        """
+        All positions as a NumPy structured array over the mapped file, for
+        scanning millions of positions without per-record objects.
+        """
+        import numpy as np
+
+        dtype = np.dtype([
+            ("pawn1", "u1"), ("pawn2", "u1"), ("horizontal_walls", "<u8"), ("vertical_walls", "<u8"),
+            ("walls1", "u1"), ("walls2", "u1"), ("status", "u1"),
+        ])
+        return np.frombuffer(self._mmap, dtype=dtype, count=self.position_count, offset=self._positions_offset)
+
+    def position(self, index, board_class=Board):
+        """Decode one position into a `Game` with no history."""
+        return decode_position(self.position_bytes(index), 0, board_class)
+
+    def game(self, game_id, board_class=Board):
+        """Decode a game, history included."""
+        return decode_game(self.record(game_id), board_class)
+
+    def moves(self, game_id):
+        """The moves of a game, without replaying them."""
+        return [decode_move(code) for code in decode_moves(self.record(game_id))[1]]
+
+    def replay(self, game_id, board_class=Board):
+        """
+        Yield one `Game` advanced through a game's moves: first at the start
+        position, then after each move. The same object is yielded every time.
+        """
+        game = self.position(self.position_range(game_id)[0], board_class)
+        yield game
+        for code in decode_moves(self.record(game_id))[1]:
+            game.apply(decode_move(code))
+            yield game
+
+    def __iter__(self):
+        """Lazily decode every game in order."""
+        for game_id in range(self.game_count):
+            yield self.game(game_id)
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
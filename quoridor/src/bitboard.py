@@ -0,0 +1,324 @@
+from quoridor.src.board import BoardBase, Field, Pawn, WallSlot
+from quoridor.src.utils.helpers import (
+    BOARD_WIDTH, CELL_COUNT, DELTAS, DOWN, HORIZONTAL_CONFLICTS, LEFT, POSITIONS, RIGHT, UP,
+    VERTICAL_CONFLICTS, WALL_EDGE_CUTS, WALL_GRID_WIDTH, initial_open_edges, iter_wall_anchors,
+    pawn_move_cells,
+)
+from quoridor.src.utils.types import Position, WallOrientation
+
+# Layout
+#
+# Fields are numbered row-major, cell = row * 9 + col, so a set of fields is an
+# 81-bit integer. Walls are identified by their anchor slot (row, col) in the
+# 8x8 grid of wall centres, bit = row * 8 + col, so each orientation is a
+# 64-bit integer. A horizontal wall anchored at (r, c) separates rows r and
+# r + 1 in columns c and c + 1; a vertical wall anchored at (r, c) separates
+# columns c and c + 1 in rows r and r + 1 (same convention as `Board`).
+
+FULL_MASK = (1 << CELL_COUNT) - 1
+
+ROW_MASKS = [((1 << BOARD_WIDTH) - 1) << (row * BOARD_WIDTH) for row in range(BOARD_WIDTH)]
+COL_MASKS = [
+    sum(1 << (row * BOARD_WIDTH + col) for row in range(BOARD_WIDTH))
+    for col in range(BOARD_WIDTH)
+]
+
+
+# Edges cut by a wall: "can't go down from" cells for horizontal walls and
+# "can't go right from" cells for vertical walls.
+HORIZONTAL_BLOCKS = [
+    0b11 << (row * BOARD_WIDTH + col)
+    for row in range(WALL_GRID_WIDTH)
+    for col in range(WALL_GRID_WIDTH)
+]
+VERTICAL_BLOCKS = [
+    (1 << (row * BOARD_WIDTH + col)) | (1 << ((row + 1) * BOARD_WIDTH + col))
+    for row in range(WALL_GRID_WIDTH)
+    for col in range(WALL_GRID_WIDTH)
+]
+
+
+def wall_index(position) -> int:
+    """Return the bit index of a wall anchor, raising IndexError outside the 8x8 grid."""
+    row, col = position
+    if not (0 <= row < WALL_GRID_WIDTH and 0 <= col < WALL_GRID_WIDTH):
+        raise IndexError("Position out of bounds")
+    return row * WALL_GRID_WIDTH + col
+
+
+class _FieldsView:
+    """Read-only `Matrix`-like view of the pawn masks, for code written against `Board.fields`."""
+
+    def __init__(self, board):
+        self._board = board
+        self.rows = BOARD_WIDTH
+        self.cols = BOARD_WIDTH
+
+    def is_in_bounds(self, position):
+        row, col = position
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def __getitem__(self, position):
+        if not self.is_in_bounds(position):
+            raise IndexError("Position out of bounds")
+        row, col = position
+        return Field(self._board.pawn_at_cell(row * BOARD_WIDTH + col))
+
+
+class _WallSlotsView:
+    """Read-only `Matrix`-like view of one wall mask, shaped like `Board`'s wall slot matrices."""
+
+    def __init__(self, board, orientation):
+        self._board = board
+        self.orientation = orientation
+        if orientation == WallOrientation.HORIZONTAL:
+            self.rows, self.cols = WALL_GRID_WIDTH, BOARD_WIDTH
+        else:
+            self.rows, self.cols = BOARD_WIDTH, WALL_GRID_WIDTH
+
+    def is_in_bounds(self, position):
+        row, col = position
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def __getitem__(self, position):
+        if not self.is_in_bounds(position):
+            raise IndexError("Position out of bounds")
+        row, col = position
+        board = self._board
+        if self.orientation == WallOrientation.HORIZONTAL:
+            occupied = board.has_wall(WallOrientation.HORIZONTAL, row, col)
+            can_be_occupied = not (
+                board.has_wall(WallOrientation.HORIZONTAL, row, col - 1)
+                or board.has_wall(WallOrientation.VERTICAL, row, col)
+            )
+        else:
+            occupied = board.has_wall(WallOrientation.VERTICAL, row, col)
+            can_be_occupied = not (
+                board.has_wall(WallOrientation.VERTICAL, row - 1, col)
+                or board.has_wall(WallOrientation.HORIZONTAL, row, col)
+            )
+        return WallSlot(occupied=occupied, can_be_occupied=can_be_occupied)
+
+
+class BitBoard(BoardBase):
+    """
+    Board backed by packed integers instead of `Field`/`WallSlot` matrices.
+
+    Exposes the same public interface as `Board` and produces the same results;
+    `fields`, `horizontal_wall_slots` and `vertical_wall_slots` are read-only
+    views built on demand for callers that inspect the board that way.
+    """
+
+    def __init__(self):
+        self.board_width = BOARD_WIDTH
+
+        self.pawn1 = Pawn(1, POSITIONS[4])
+        self.pawn2 = Pawn(2, POSITIONS[76])
+        self._pawn_cells = [None, 4, 76]
+        self._occupied = (1 << 4) | (1 << 76)
+
+        self._horizontal_walls = 0
+        self._vertical_walls = 0
+        self._blocked_down = 0
+        self._blocked_right = 0
+        self._open = [0, 0, 0, 0]
+        self._update_open_masks()
+        # Same per-cell table `Board` keeps, for algorithms shared between boards
+        self.open_edges = initial_open_edges()
+        self._init_distance_maps()
+        self._init_wall_masks()
+
+        self.fields = _FieldsView(self)
+        self.horizontal_wall_slots = _WallSlotsView(self, WallOrientation.HORIZONTAL)
+        self.vertical_wall_slots = _WallSlotsView(self, WallOrientation.VERTICAL)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build an independent board from a snapshot."""
+        board = cls.__new__(cls)
+        board.board_width = BOARD_WIDTH
+        cell1, cell2 = snapshot.pawn_cells
+        board.pawn1 = Pawn(1, POSITIONS[cell1])
+        board.pawn2 = Pawn(2, POSITIONS[cell2])
+        board._pawn_cells = [None, cell1, cell2]
+        board._occupied = (1 << cell1) | (1 << cell2)
+
+        board._horizontal_walls, board._vertical_walls = snapshot.placed_walls
+        board._blocked_down = 0
+        for index in iter_wall_anchors(board._horizontal_walls):
+            board._blocked_down |= HORIZONTAL_BLOCKS[index]
+        board._blocked_right = 0
+        for index in iter_wall_anchors(board._vertical_walls):
+            board._blocked_right |= VERTICAL_BLOCKS[index]
+        board._open = [0, 0, 0, 0]
+        board._update_open_masks()
+        board._restore_shared_state(snapshot)
+
+        board.fields = _FieldsView(board)
+        board.horizontal_wall_slots = _WallSlotsView(board, WallOrientation.HORIZONTAL)
+        board.vertical_wall_slots = _WallSlotsView(board, WallOrientation.VERTICAL)
+        return board
+
+    def _update_open_masks(self):
+        """Recompute, per direction, the mask of cells a pawn can leave in that direction."""
+        blocked_down = self._blocked_down
+        blocked_right = self._blocked_right
+        self._open[UP] = ~((blocked_down << BOARD_WIDTH) | ROW_MASKS[0]) & FULL_MASK
+        self._open[DOWN] = ~(blocked_down | ROW_MASKS[BOARD_WIDTH - 1]) & FULL_MASK
+        self._open[LEFT] = ~((blocked_right << 1) | COL_MASKS[0]) & FULL_MASK
+        self._open[RIGHT] = ~(blocked_right | COL_MASKS[BOARD_WIDTH - 1]) & FULL_MASK
+
+    def pawn_at_cell(self, cell):
+        """Return the pawn standing on a cell index, or None."""
+        if self._pawn_cells[1] == cell:
+            return self.pawn1
+        if self._pawn_cells[2] == cell:
+            return self.pawn2
+        return None
+
+    def has_wall(self, orientation, row, col) -> bool:
+        """Check if a wall is anchored at (row, col); anchors outside the grid have none."""
+        if not (0 <= row < WALL_GRID_WIDTH and 0 <= col < WALL_GRID_WIDTH):
+            return False
+        walls = (
+            self._horizontal_walls
+            if orientation == WallOrientation.HORIZONTAL
+            else self._vertical_walls
+        )
+        return bool((walls >> (row * WALL_GRID_WIDTH + col)) & 1)
+
+    def move_pawn(self, pawn, new_position):
+        """Move a pawn to a new position."""
+        row, col = new_position
+        if not (0 <= row < BOARD_WIDTH and 0 <= col < BOARD_WIDTH):
+            raise ValueError("Invalid move")
+        new_cell = row * BOARD_WIDTH + col
+        old_cell = self._pawn_cells[pawn.id]
+        if new_cell not in self.get_pawn_move_cells(old_cell):
+            raise ValueError("Invalid move")
+
+        self._occupied ^= (1 << old_cell) | (1 << new_cell)
+        self._pawn_cells[pawn.id] = new_cell
+        pawn.position = POSITIONS[new_cell]
+
+    def set_pawn_position(self, pawn, position):
+        """Put a pawn on a position without checking move rules (used to take moves back)."""
+        old_cell = self._pawn_cells[pawn.id]
+        new_cell = position.row * BOARD_WIDTH + position.col
+        self._occupied ^= (1 << old_cell) | (1 << new_cell)
+        self._pawn_cells[pawn.id] = new_cell
+        pawn.position = POSITIONS[new_cell]
+
+    def can_pass_between_adjacent_positions(self, start_position: Position, end_position: Position) -> bool:
+        """Check if there are walls between two adjacent positions - Must be adjacent positions, otherwise will raise an error."""
+        d_row = end_position.row - start_position.row
+        d_col = end_position.col - start_position.col
+        if abs(d_row) + abs(d_col) != 1:
+            raise ValueError("Positions are not directly adjacent")
+        direction = DELTAS.index(d_row * BOARD_WIDTH + d_col)
+        cell = start_position.row * BOARD_WIDTH + start_position.col
+        return bool((self._open[direction] >> cell) & 1)
+
+    def get_pawn_move_cells(self, cell):
+        """Get the cell indices a pawn standing on `cell` can move to."""
+        other_cell = self._pawn_cells[2] if self._pawn_cells[1] == cell else self._pawn_cells[1]
+        return pawn_move_cells(self.open_edges, cell, other_cell)
+
+    def get_all_valid_pawn_moves(self, pawn):
+        """Get all valid moves for a pawn."""
+        return [POSITIONS[cell] for cell in self.get_pawn_move_cells(self._pawn_cells[pawn.id])]
+
+    def place_wall(self, orientation, position):
+        """Place a wall at a given position."""
+        if not self.can_place_wall_at_position(orientation, position):
+            raise ValueError("Cannot place wall at this position")
+        index = wall_index(position)
+        if orientation == WallOrientation.HORIZONTAL:
+            self._horizontal_walls |= 1 << index
+            self._blocked_down |= HORIZONTAL_BLOCKS[index]
+        else:
+            self._vertical_walls |= 1 << index
+            self._blocked_right |= VERTICAL_BLOCKS[index]
+        self._update_open_masks()
+        open_edges = self.open_edges
+        cuts = WALL_EDGE_CUTS[orientation][index]
+        for cell, bit in cuts:
+            open_edges[cell] &= ~bit
+        for distance_map in self.distance_maps.values():
+            distance_map.edges_closed(cuts)
+        self._toggle_wall_masks(orientation, position)
+
+    def remove_wall(self, orientation, position):
+        """Remove a previously placed wall, restoring the edges it blocked."""
+        index = wall_index(position)
+        if orientation == WallOrientation.HORIZONTAL:
+            if not (self._horizontal_walls >> index) & 1:
+                raise ValueError("No wall at this position")
+            self._horizontal_walls &= ~(1 << index)
+            self._blocked_down &= ~HORIZONTAL_BLOCKS[index]
+        else:
+            if not (self._vertical_walls >> index) & 1:
+                raise ValueError("No wall at this position")
+            self._vertical_walls &= ~(1 << index)
+            self._blocked_right &= ~VERTICAL_BLOCKS[index]
+        self._update_open_masks()
+        open_edges = self.open_edges
+        cuts = WALL_EDGE_CUTS[orientation][index]
+        for cell, bit in cuts:
+            open_edges[cell] |= bit
+        for distance_map in self.distance_maps.values():
+            distance_map.edges_opened(cuts)
+        self._toggle_wall_masks(orientation, position)
+
+    def can_place_wall_at_position(self, orientation, position):
+        """Check if a wall can be placed at a given position."""
+        index = wall_index(position)
+        if orientation == WallOrientation.HORIZONTAL:
+            return not (
+                self._horizontal_walls & HORIZONTAL_CONFLICTS[index]
+                or (self._vertical_walls >> index) & 1
+            )
+        elif orientation == WallOrientation.VERTICAL:
+            return not (
+                self._vertical_walls & VERTICAL_CONFLICTS[index]
+                or (self._horizontal_walls >> index) & 1
+            )
+
+    def is_path_blocked(self, start_position, target_row):
+        """
+        Check if a path exists from start_position to the target row.
+
+        Floods the reachable set one step in every direction at a time using
+        whole-board shifts, instead of visiting cells one by one.
+
+        Args:
+            start_position (Position): Starting position
+            target_row (int): Target row to reach
+
+        Returns:
+            bool: True if path is blocked, False if path exists
+        """
+        start = start_position.row * BOARD_WIDTH + start_position.col
+        known = self._known_path_blocked(start, target_row)
+        if known is not None:
+            return known
+
+        up, down, left, right = self._open
+        target = ROW_MASKS[target_row]
+        reached = 1 << start
+        while not reached & target:
+            expanded = (
+                reached
+                | ((reached & up) >> BOARD_WIDTH)
+                | ((reached & down) << BOARD_WIDTH)
+                | ((reached & left) >> 1)
+                | ((reached & right) << 1)
+            )
+            if expanded == reached:
+                return True  # No path exists
+            reached = expanded
+        return False  # Path exists
+
+    def get_occupied_fields(self) -> list[Position]:
+        """Return a list of positions occupied by pawns."""
+        return [POSITIONS[cell] for cell in range(CELL_COUNT) if (self._occupied >> cell) & 1]
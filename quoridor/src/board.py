@@ -1,11 +1,20 @@
 from enum import Enum
-from quoridor.src.utils.types import Direction, Position, Matrix, WallOrientation, WallSlotPosition
+from quoridor.src.utils.types import Direction, Position, Matrix, WallOrientation, WallSlotPosition, position_at
+from quoridor.src.distance_map import UNREACHABLE, DistanceMap
+from quoridor.src.utils.helpers import (
+    ALL_WALLS, BOARD_WIDTH, BORDER_VERTICES, DELTAS, DIRECTION_BITS, GOAL_ROWS,
+    HORIZONTAL_CONFLICTS, POSITIONS, VERTICAL_CONFLICTS, WALL_EDGE_CUTS, WALL_GRID_WIDTH,
+    WALL_VERTICES, cell_index, initial_open_edges, iter_wall_anchors, pawn_move_cells,
+)
+from quoridor.src.pathfinding import find_path, path_length
 from abc import ABC, abstractmethod
-from collections import deque
+from typing import NamedTuple
 
 # Types
 
 class Pawn:
+    __slots__ = ("id", "position")
+
     def __init__(self, id, position):
         self.id = id
         self.position = position
@@ -14,11 +23,15 @@ class Pawn:
         return Direction.UP if self.id == 1 else Direction.DOWN
 
 class Wall:
+    __slots__ = ("orientation", "position")
+
     def __init__(self, orientation, position):
         self.orientation = orientation
         self.position = position
 
 class Field:
+    __slots__ = ("pawn",)
+
     def __init__(self, pawn=None):
         self.pawn = pawn
     
@@ -26,12 +39,26 @@ class Field:
         return self.pawn is not None
 
 class WallSlot:
+    __slots__ = ("occupied", "can_be_occupied", "wall")
+
     def __init__(self, occupied=False, can_be_occupied=True):
         self.occupied = occupied
         self.can_be_occupied = can_be_occupied
         self.wall = None
 
 
+class BoardSnapshot(NamedTuple):
+    """
+    Immutable copy of a board's state made of flat tuples of ints, so it can be
+    shared between threads and pickled to other processes cheaply.
+    """
+    pawn_cells: tuple  # (pawn 1 cell, pawn 2 cell)
+    placed_walls: tuple  # (horizontal mask, vertical mask)
+    placeable_walls: tuple  # (horizontal mask, vertical mask)
+    open_edges: tuple
+    distances: tuple  # (player 1 distance map, player 2 distance map)
+
+
 # Board class
 
 class BoardBase(ABC):
@@ -43,21 +70,192 @@ class BoardBase(ABC):
     def place_wall(self, orientation, position: Position):
         pass
 
+    @abstractmethod
+    def remove_wall(self, orientation, position: Position):
+        pass
+
+    @abstractmethod
+    def set_pawn_position(self, pawn, position: Position):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_snapshot(cls, snapshot: BoardSnapshot):
+        """Build an independent board from a snapshot."""
+        pass
+
+    def snapshot(self) -> BoardSnapshot:
+        """Capture the board's state as a `BoardSnapshot`."""
+        return BoardSnapshot(
+            (cell_index(self.pawn1.position), cell_index(self.pawn2.position)),
+            (self.placed_walls[WallOrientation.HORIZONTAL], self.placed_walls[WallOrientation.VERTICAL]),
+            (self.placeable_walls[WallOrientation.HORIZONTAL], self.placeable_walls[WallOrientation.VERTICAL]),
+            tuple(self.open_edges),
+            (tuple(self.distance_maps[1].distances), tuple(self.distance_maps[2].distances)),
+        )
+
+    def clone(self):
+        """Return an independent copy of the board."""
+        return type(self).from_snapshot(self.snapshot())
+
+    def _restore_shared_state(self, snapshot):
+        """Copy the open edges, distance maps and wall masks common to every board out of a snapshot."""
+        self.open_edges = list(snapshot.open_edges)
+        self.distance_maps = {
+            player_id: DistanceMap.from_distances(self.open_edges, GOAL_ROWS[player_id], distances)
+            for player_id, distances in zip((1, 2), snapshot.distances)
+        }
+        self._maps_by_goal_row = {
+            distance_map.goal_row: distance_map for distance_map in self.distance_maps.values()
+        }
+        horizontal, vertical = snapshot.placed_walls
+        self.placed_walls = {WallOrientation.HORIZONTAL: horizontal, WallOrientation.VERTICAL: vertical}
+        horizontal, vertical = snapshot.placeable_walls
+        self.placeable_walls = {WallOrientation.HORIZONTAL: horizontal, WallOrientation.VERTICAL: vertical}
+
+    def _init_distance_maps(self):
+        """Create the per-player distance-to-goal maps over the board's open-edges table."""
+        self.distance_maps = {
+            player_id: DistanceMap(self.open_edges, goal_row)
+            for player_id, goal_row in GOAL_ROWS.items()
+        }
+        self._maps_by_goal_row = {
+            distance_map.goal_row: distance_map for distance_map in self.distance_maps.values()
+        }
+
+    def distance_to_goal(self, player_id: int, position: Position):
+        """
+        Get the number of steps from a position to a player's goal row, ignoring
+        pawns. Returns None if walls cut the position off from the goal row.
+        """
+        distance = self.distance_maps[player_id].distances[cell_index(position)]
+        return None if distance == UNREACHABLE else distance
+
+    def distance_to_row(self, start_position: Position, target_row: int):
+        """
+        Get the number of steps from a position to any row, ignoring pawns, or
+        None if walls cut it off. Goal rows are read from the distance maps.
+        """
+        start = cell_index(start_position)
+        distance_map = self._maps_by_goal_row.get(target_row)
+        if distance_map is None:
+            return path_length(self.open_edges, start, target_row)
+        distance = distance_map.distances[start]
+        return None if distance == UNREACHABLE else distance
+
+    def shortest_path(self, start_position: Position, target_row: int) -> list[Position]:
+        """
+        Get one shortest route from a position to a row, both ends included and
+        ignoring pawns, or an empty list if walls cut it off. Goal rows are
+        read from the distance maps, other rows are searched with A*.
+        """
+        start = cell_index(start_position)
+        distance_map = self._maps_by_goal_row.get(target_row)
+        if distance_map is None:
+            cells = find_path(self.open_edges, start, target_row)
+        else:
+            cells = distance_map.shortest_path(start)
+        return [POSITIONS[cell] for cell in cells]
+
+    def _init_wall_masks(self):
+        """Create the masks of placed and geometrically placeable walls, one bit per anchor."""
+        self.placed_walls = {WallOrientation.HORIZONTAL: 0, WallOrientation.VERTICAL: 0}
+        self.placeable_walls = {WallOrientation.HORIZONTAL: ALL_WALLS, WallOrientation.VERTICAL: ALL_WALLS}
+
+    def _toggle_wall_masks(self, orientation, position):
+        """Flip a wall in the placed masks and refresh placeability of the anchors it overlaps."""
+        anchor = position.row * WALL_GRID_WIDTH + position.col
+        self.placed_walls[orientation] ^= 1 << anchor
+        horizontal = self.placed_walls[WallOrientation.HORIZONTAL]
+        vertical = self.placed_walls[WallOrientation.VERTICAL]
+
+        # Overlap is symmetric, so the anchors to refresh are the wall's own conflicts
+        placeable_horizontal = self.placeable_walls[WallOrientation.HORIZONTAL]
+        placeable_vertical = self.placeable_walls[WallOrientation.VERTICAL]
+        if orientation == WallOrientation.HORIZONTAL:
+            horizontal_anchors, vertical_anchors = HORIZONTAL_CONFLICTS[anchor], 1 << anchor
+        else:
+            horizontal_anchors, vertical_anchors = 1 << anchor, VERTICAL_CONFLICTS[anchor]
+        for other in iter_wall_anchors(horizontal_anchors):
+            if horizontal & HORIZONTAL_CONFLICTS[other] or (vertical >> other) & 1:
+                placeable_horizontal &= ~(1 << other)
+            else:
+                placeable_horizontal |= 1 << other
+        for other in iter_wall_anchors(vertical_anchors):
+            if vertical & VERTICAL_CONFLICTS[other] or (horizontal >> other) & 1:
+                placeable_vertical &= ~(1 << other)
+            else:
+                placeable_vertical |= 1 << other
+        self.placeable_walls[WallOrientation.HORIZONTAL] = placeable_horizontal
+        self.placeable_walls[WallOrientation.VERTICAL] = placeable_vertical
+
+    def obstacle_vertices(self) -> set:
+        """Grid-line crossings touched by a placed wall or lying on the board's edge."""
+        vertices = set(BORDER_VERTICES)
+        for orientation, placed in self.placed_walls.items():
+            for anchor in iter_wall_anchors(placed):
+                vertices.update(WALL_VERTICES[orientation][anchor])
+        return vertices
+
+    def _known_path_blocked(self, start_cell, target_row):
+        """Answer is_path_blocked from a maintained distance map, or None if no map covers the row."""
+        distance_map = self._maps_by_goal_row.get(target_row)
+        if distance_map is None:
+            return None
+        return distance_map.distances[start_cell] == UNREACHABLE
+
 class Board(BoardBase):
     def __init__(self):
         self.board_width = 9
 
-        self.pawn1 = Pawn(1, Position(0, 4))
-        self.pawn2 = Pawn(2, Position(8, 4))
+        self.pawn1 = Pawn(1, position_at(0, 4))
+        self.pawn2 = Pawn(2, position_at(8, 4))
 
         self.fields = Matrix(self.board_width, self.board_width, lambda: Field())
         self.horizontal_wall_slots = Matrix(self.board_width - 1, self.board_width, lambda: WallSlot())
         self.vertical_wall_slots = Matrix(self.board_width, self.board_width - 1, lambda: WallSlot())
 
+        # Per-cell 4-bit mask of the directions a pawn can step in, kept in sync by
+        # place_wall/remove_wall so passability checks are a single lookup
+        self.open_edges = initial_open_edges()
+        self._init_distance_maps()
+        self._init_wall_masks()
+
         # Initialize the fields with the initial pawn positions
         self.fields[self.pawn1.position].pawn = self.pawn1
         self.fields[self.pawn2.position].pawn = self.pawn2
 
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build an independent board from a snapshot."""
+        board = cls.__new__(cls)
+        board.board_width = BOARD_WIDTH
+        board.pawn1 = Pawn(1, POSITIONS[snapshot.pawn_cells[0]])
+        board.pawn2 = Pawn(2, POSITIONS[snapshot.pawn_cells[1]])
+        board.fields = Matrix(BOARD_WIDTH, BOARD_WIDTH, Field)
+        board.horizontal_wall_slots = Matrix(WALL_GRID_WIDTH, BOARD_WIDTH, WallSlot)
+        board.vertical_wall_slots = Matrix(BOARD_WIDTH, WALL_GRID_WIDTH, WallSlot)
+        board._restore_shared_state(snapshot)
+
+        board.fields[board.pawn1.position].pawn = board.pawn1
+        board.fields[board.pawn2.position].pawn = board.pawn2
+        # A slot can't be occupied while the previous slot of its orientation or the
+        # crossing slot holds a wall, as place_wall/remove_wall maintain it
+        horizontal_slots = board.horizontal_wall_slots.data
+        vertical_slots = board.vertical_wall_slots.data
+        horizontal, vertical = snapshot.placed_walls
+        for anchor in iter_wall_anchors(horizontal):
+            row, col = divmod(anchor, WALL_GRID_WIDTH)
+            horizontal_slots[row][col].occupied = True
+            horizontal_slots[row][col + 1].can_be_occupied = False
+            vertical_slots[row][col].can_be_occupied = False
+        for anchor in iter_wall_anchors(vertical):
+            row, col = divmod(anchor, WALL_GRID_WIDTH)
+            vertical_slots[row][col].occupied = True
+            vertical_slots[row + 1][col].can_be_occupied = False
+            horizontal_slots[row][col].can_be_occupied = False
+        return board
+
 
     def move_pawn(self, pawn, new_position):
         """Move a pawn to a new position."""
@@ -71,52 +269,27 @@ class Board(BoardBase):
         # Move the pawn to the new position
         self.fields[new_position].pawn = pawn
         pawn.position = new_position
-        
+
+    def set_pawn_position(self, pawn, position):
+        """Put a pawn on a position without checking move rules (used to take moves back)."""
+        self.fields[pawn.position].pawn = None
+        self.fields[position].pawn = pawn
+        pawn.position = position
+
     def can_pass_between_adjacent_positions(self, start_position: Position, end_position: Position) -> bool:
         """Check if there are walls between two adjacent positions - Must be adjacent positions, otherwise will raise an error."""
-        direction = Direction.from_positions(start_position, end_position)
-        wall_orientation = WallOrientation.from_direction(direction)
-        wall_slot_positions = direction.wall_slot_positions()
-        wall_slots = self.get_surrounding_wall_slots(start_position, wall_orientation, wall_slot_positions)
-        return not any([wall_slot.occupied for wall_slot in wall_slots if wall_slot is not None])
+        d_row = end_position.row - start_position.row
+        d_col = end_position.col - start_position.col
+        if abs(d_row) + abs(d_col) != 1:
+            raise ValueError("Positions are not directly adjacent")
+        direction = DELTAS.index(d_row * BOARD_WIDTH + d_col)
+        return bool(self.open_edges[cell_index(start_position)] & DIRECTION_BITS[direction])
 
-        
     def get_all_valid_pawn_moves(self, pawn):
         """Get all valid moves for a pawn."""
-        valid_moves = []
-
-        for direction in Direction.all_directions():
-            new_position = pawn.position + direction.value
-            if self.fields.is_in_bounds(new_position):
-                if self.can_pass_between_adjacent_positions(pawn.position, new_position):
-                    if not self.fields[new_position].is_occupied():
-                        valid_moves.append(new_position)
-                    else:
-                        jump_over_position = new_position + direction.value
-                        # Check if we can jump over or need to move sideways
-                        if self.fields.is_in_bounds(jump_over_position):
-                            if self.can_pass_between_adjacent_positions(new_position, jump_over_position):
-                                valid_moves.append(jump_over_position)
-                            else:
-                                # Add perpendicular moves if can't jump over
-                                for perpendicular_direction in direction.perpendicular_directions():
-                                    perpendicular_position = new_position + perpendicular_direction.value
-                                    if (self.fields.is_in_bounds(perpendicular_position) and 
-                                        self.can_pass_between_adjacent_positions(new_position, perpendicular_position) and
-                                        not self.fields[perpendicular_position].is_occupied()):
-                                        valid_moves.append(perpendicular_position)
-                        else:
-                            # If jump over position is out of bounds, check perpendicular moves
-                            for perpendicular_direction in direction.perpendicular_directions():
-                                perpendicular_position = new_position + perpendicular_direction.value
-                                if (self.fields.is_in_bounds(perpendicular_position) and 
-                                    self.can_pass_between_adjacent_positions(new_position, perpendicular_position) and
-                                    not self.fields[perpendicular_position].is_occupied()):
-                                    valid_moves.append(perpendicular_position)
-        
-        return valid_moves
-
-        
+        other_pawn = self.pawn2 if pawn is self.pawn1 else self.pawn1
+        cells = pawn_move_cells(self.open_edges, cell_index(pawn.position), cell_index(other_pawn.position))
+        return [POSITIONS[cell] for cell in cells]
 
     def place_wall(self, orientation, position):
         """Place a wall at a given position."""
@@ -124,22 +297,89 @@ class Board(BoardBase):
             raise ValueError("Cannot place wall at this position")
         if orientation == WallOrientation.HORIZONTAL:
             self.horizontal_wall_slots[position].occupied = True
-            next_adjacent_position = Position(position.row, position.col + 1)
+            next_adjacent_position = position_at(position.row, position.col + 1)
             if self.horizontal_wall_slots.is_in_bounds(next_adjacent_position):
                 self.horizontal_wall_slots[next_adjacent_position].can_be_occupied = False
             self.vertical_wall_slots[position].can_be_occupied = False
 
         elif orientation == WallOrientation.VERTICAL:
             self.vertical_wall_slots[position].occupied = True
-            next_adjacent_position = Position(position.row + 1, position.col)
+            next_adjacent_position = position_at(position.row + 1, position.col)
             if self.vertical_wall_slots.is_in_bounds(next_adjacent_position):
                 self.vertical_wall_slots[next_adjacent_position].can_be_occupied = False
             self.horizontal_wall_slots[position].can_be_occupied = False
 
+        self._close_wall_edges(orientation, position)
+        self._toggle_wall_masks(orientation, position)
+
+    def remove_wall(self, orientation, position):
+        """Remove a previously placed wall, restoring the slots and edges it blocked."""
+        slots = self.horizontal_wall_slots if orientation == WallOrientation.HORIZONTAL else self.vertical_wall_slots
+        if not slots[position].occupied:
+            raise ValueError("No wall at this position")
+        slots[position].occupied = False
+
+        # can_be_occupied only depends on the walls around a slot, so recompute it for
+        # the slots this wall disabled
+        if orientation == WallOrientation.HORIZONTAL:
+            next_adjacent_position = position_at(position.row, position.col + 1)
+            if self.horizontal_wall_slots.is_in_bounds(next_adjacent_position):
+                self._update_can_be_occupied(WallOrientation.HORIZONTAL, next_adjacent_position)
+            self._update_can_be_occupied(WallOrientation.VERTICAL, position)
+        else:
+            next_adjacent_position = position_at(position.row + 1, position.col)
+            if self.vertical_wall_slots.is_in_bounds(next_adjacent_position):
+                self._update_can_be_occupied(WallOrientation.VERTICAL, next_adjacent_position)
+            self._update_can_be_occupied(WallOrientation.HORIZONTAL, position)
+
+        self._open_wall_edges(orientation, position)
+        self._toggle_wall_masks(orientation, position)
+
+    def _update_can_be_occupied(self, orientation, position):
+        """Recompute whether a slot is free of overlapping walls."""
+        if orientation == WallOrientation.HORIZONTAL:
+            previous_position = position_at(position.row, position.col - 1)
+            overlapped = (
+                self.horizontal_wall_slots.is_in_bounds(previous_position)
+                and self.horizontal_wall_slots[previous_position].occupied
+            ) or (
+                self.vertical_wall_slots.is_in_bounds(position)
+                and self.vertical_wall_slots[position].occupied
+            )
+            self.horizontal_wall_slots[position].can_be_occupied = not overlapped
+        else:
+            previous_position = position_at(position.row - 1, position.col)
+            overlapped = (
+                self.vertical_wall_slots.is_in_bounds(previous_position)
+                and self.vertical_wall_slots[previous_position].occupied
+            ) or (
+                self.horizontal_wall_slots.is_in_bounds(position)
+                and self.horizontal_wall_slots[position].occupied
+            )
+            self.vertical_wall_slots[position].can_be_occupied = not overlapped
+
+    def _close_wall_edges(self, orientation, position):
+        """Clear the open-edge bits crossed by a wall."""
+        open_edges = self.open_edges
+        cuts = WALL_EDGE_CUTS[orientation][position.row * WALL_GRID_WIDTH + position.col]
+        for cell, bit in cuts:
+            open_edges[cell] &= ~bit
+        for distance_map in self.distance_maps.values():
+            distance_map.edges_closed(cuts)
+
+    def _open_wall_edges(self, orientation, position):
+        """Set the open-edge bits crossed by a removed wall."""
+        open_edges = self.open_edges
+        cuts = WALL_EDGE_CUTS[orientation][position.row * WALL_GRID_WIDTH + position.col]
+        for cell, bit in cuts:
+            open_edges[cell] |= bit
+        for distance_map in self.distance_maps.values():
+            distance_map.edges_opened(cuts)
+
     def can_place_wall_at_position(self, orientation, position):
         """Check if a wall can be placed at a given position."""
         if orientation == WallOrientation.HORIZONTAL:
-            adjacent_horizontal_slot_position = Position(position.row, position.col + 1)
+            adjacent_horizontal_slot_position = position_at(position.row, position.col + 1)
             return (
                 not self.horizontal_wall_slots[position].occupied
                 and self.horizontal_wall_slots[position].can_be_occupied
@@ -148,7 +388,7 @@ class Board(BoardBase):
             )
         
         elif orientation == WallOrientation.VERTICAL:
-            adjacent_vertical_slot_position = Position(position.row + 1, position.col)
+            adjacent_vertical_slot_position = position_at(position.row + 1, position.col)
             return (
                 not self.vertical_wall_slots[position].occupied
                 and self.vertical_wall_slots[position].can_be_occupied
@@ -167,38 +407,15 @@ class Board(BoardBase):
         Returns:
             bool: True if path is blocked, False if path exists
         """
-        directions = [
-            (0, 1),   # right
-            (1, 0),   # down
-            (0, -1),  # left
-            (-1, 0)   # up
-        ]
-
-        visited = set()
-        queue = deque([start_position])
-        visited.add(start_position)
-
-        while queue:
-            current_position = queue.popleft()
-            
-            # Check if we've reached the target row
-            if current_position.row == target_row:
-                return False  # Path exists
-
-            for direction in directions:
-                new_row = current_position.row + direction[0]
-                new_col = current_position.col + direction[1]
-                new_position = Position(new_row, new_col)
-
-                if (not self.fields.is_in_bounds(new_position) or 
-                    new_position in visited or 
-                    not self.can_pass_between_adjacent_positions(current_position, new_position)):
-                    continue
+        if not self.fields.is_in_bounds(start_position):
+            raise IndexError("Position out of bounds")
 
-                visited.add(new_position)
-                queue.append(new_position)
+        start = cell_index(start_position)
+        known = self._known_path_blocked(start, target_row)
+        if known is not None:
+            return known
 
-        return True  # No path exists
+        return not find_path(self.open_edges, start, target_row)
     
     def get_surrounding_wall_slots(self, position, orientation, wall_slot_positions: list[WallSlotPosition]):
         wall_slots = []
@@ -208,7 +425,7 @@ class Board(BoardBase):
     
     def get_surrounding_wall_slot(self, position, orientation, wall_slot_position: WallSlotPosition):
         if wall_slot_position == WallSlotPosition.UP_LEFT:
-            wsp = Position(row=position.row - 1, col=position.col - 1)
+            wsp = position_at(position.row - 1, position.col - 1)
             if orientation == WallOrientation.HORIZONTAL and self.horizontal_wall_slots.is_in_bounds(wsp):
                 return self.horizontal_wall_slots[wsp]
             elif orientation == WallOrientation.VERTICAL and self.vertical_wall_slots.is_in_bounds(wsp):
@@ -217,7 +434,7 @@ class Board(BoardBase):
                 return None
         
         if wall_slot_position == WallSlotPosition.UP_RIGHT:
-            wsp = Position(row=position.row - 1, col=position.col)
+            wsp = position_at(position.row - 1, position.col)
             if orientation == WallOrientation.HORIZONTAL and self.horizontal_wall_slots.is_in_bounds(wsp):
                 return self.horizontal_wall_slots[wsp]
             elif orientation == WallOrientation.VERTICAL and self.vertical_wall_slots.is_in_bounds(wsp):
@@ -226,7 +443,7 @@ class Board(BoardBase):
                 return None
         
         if wall_slot_position == WallSlotPosition.DOWN_LEFT:
-            wsp = Position(row=position.row, col=position.col - 1)
+            wsp = position_at(position.row, position.col - 1)
             if orientation == WallOrientation.HORIZONTAL and self.horizontal_wall_slots.is_in_bounds(wsp):
                 return self.horizontal_wall_slots[wsp]
             elif orientation == WallOrientation.VERTICAL and self.vertical_wall_slots.is_in_bounds(wsp):
@@ -235,7 +452,7 @@ class Board(BoardBase):
                 return None
         
         if wall_slot_position == WallSlotPosition.DOWN_RIGHT:
-            wsp = Position(row=position.row, col=position.col)
+            wsp = position_at(position.row, position.col)
             if orientation == WallOrientation.HORIZONTAL and self.horizontal_wall_slots.is_in_bounds(wsp):
                 return self.horizontal_wall_slots[wsp]
             elif orientation == WallOrientation.VERTICAL and self.vertical_wall_slots.is_in_bounds(wsp):
@@ -248,7 +465,7 @@ class Board(BoardBase):
         occupied_fields = []
         for row in range(self.board_width):
             for col in range(self.board_width):
-                position = Position(row, col)
+                position = position_at(row, col)
                 field = self.fields[position]
                 if field is not None and field.pawn is not None:
                     occupied_fields.append(position)
@@ -0,0 +1,230 @@
+import numpy as np
+
+from quoridor.src.distance_map import UNREACHABLE
+from quoridor.src.utils.helpers import BOARD_WIDTH, GOAL_ROWS, WALL_GRID_WIDTH
+from quoridor.src.utils.types import WallOrientation
+
+# Row and column steps in `Direction` order (UP, DOWN, LEFT, RIGHT)
+STEPS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+PERPENDICULAR_STEPS = ((2, 3), (2, 3), (0, 1), (0, 1))
+
+
+def _mask_to_grid(mask):
+    """Unpack a wall mask (bit row * 8 + col) into an 8x8 boolean grid."""
+    bits = np.unpackbits(np.frombuffer(mask.to_bytes(8, "little"), dtype=np.uint8), bitorder="little")
+    return bits.reshape(WALL_GRID_WIDTH, WALL_GRID_WIDTH).astype(bool)
+
+
+def open_edges(horizontal_walls, vertical_walls):
+    """
+    Return a (K, 9, 9, 4) boolean array: whether a pawn can step from each
+    cell in each direction, for K pairs of (K, 8, 8) wall grids.
+    """
+    count = horizontal_walls.shape[0]
+    # A horizontal wall at (r, c) cuts the edge below cells (r, c) and (r, c + 1)
+    blocked_down = np.zeros((count, WALL_GRID_WIDTH, BOARD_WIDTH), dtype=bool)
+    blocked_down[:, :, :-1] |= horizontal_walls
+    blocked_down[:, :, 1:] |= horizontal_walls
+    # A vertical wall at (r, c) cuts the edge right of cells (r, c) and (r + 1, c)
+    blocked_right = np.zeros((count, BOARD_WIDTH, WALL_GRID_WIDTH), dtype=bool)
+    blocked_right[:, :-1, :] |= vertical_walls
+    blocked_right[:, 1:, :] |= vertical_walls
+
+    edges = np.zeros((count, BOARD_WIDTH, BOARD_WIDTH, 4), dtype=bool)
+    edges[:, :-1, :, 1] = ~blocked_down
+    edges[:, 1:, :, 0] = ~blocked_down
+    edges[:, :, :-1, 3] = ~blocked_right
+    edges[:, :, 1:, 2] = ~blocked_right
+    return edges
+
+
+def distance_grids(edges, goal_row):
+    """
+    Breadth-first distance from every cell to `goal_row` for a whole batch of
+    (K, 9, 9, 4) open-edge arrays at once, expanding all K frontiers together
+    one step per iteration. Unreachable cells get `UNREACHABLE`.
+    """
+    count = edges.shape[0]
+    distances = np.full((count, BOARD_WIDTH, BOARD_WIDTH), UNREACHABLE, dtype=np.int16)
+    frontier = np.zeros((count, BOARD_WIDTH, BOARD_WIDTH), dtype=bool)
+    frontier[:, goal_row, :] = True
+    visited = frontier.copy()
+    distance = 0
+    while frontier.any():
+        distances[frontier] = distance
+        distance += 1
+        # A cell joins the next frontier if it has an open edge into the current one
+        reached = np.zeros_like(frontier)
+        reached[:, :-1, :] |= frontier[:, 1:, :] & edges[:, :-1, :, 1]
+        reached[:, 1:, :] |= frontier[:, :-1, :] & edges[:, 1:, :, 0]
+        reached[:, :, :-1] |= frontier[:, :, 1:] & edges[:, :, :-1, 3]
+        reached[:, :, 1:] |= frontier[:, :, :-1] & edges[:, :, 1:, 2]
+        frontier = reached & ~visited
+        visited |= frontier
+    return distances
+
+
+class BoardBatch:
+    """
+    K board positions stored as NumPy arrays, for evaluating whole batches per call.
+
+    `pawns[k, player_id - 1]` holds a pawn's (row, col); `horizontal_walls`
+    and `vertical_walls` are (K, 8, 8) boolean grids indexed by wall anchor.
+    The arrays are public and may be edited in place; every query derives
+    what it needs from them.
+    """
+
+    def __init__(self, pawns, horizontal_walls, vertical_walls):
+        self.pawns = np.asarray(pawns, dtype=np.int8)
+        self.horizontal_walls = np.asarray(horizontal_walls, dtype=bool)
+        self.vertical_walls = np.asarray(vertical_walls, dtype=bool)
+
+    @classmethod
+    def empty(cls, count):
+        """A batch of `count` starting positions."""
+        pawns = np.zeros((count, 2, 2), dtype=np.int8)
+        pawns[:, 0] = (0, BOARD_WIDTH // 2)
+        pawns[:, 1] = (BOARD_WIDTH - 1, BOARD_WIDTH // 2)
+        walls = np.zeros((count, WALL_GRID_WIDTH, WALL_GRID_WIDTH), dtype=bool)
+        return cls(pawns, walls, walls.copy())
+
+    @classmethod
+    def from_boards(cls, boards):
+        """Copy the pawns and walls of `Board` or `BitBoard` instances into a batch."""
+        pawns = [
+            [
+                (board.pawn1.position.row, board.pawn1.position.col),
+                (board.pawn2.position.row, board.pawn2.position.col),
+            ]
+            for board in boards
+        ]
+        horizontal = [_mask_to_grid(board.placed_walls[WallOrientation.HORIZONTAL]) for board in boards]
+        vertical = [_mask_to_grid(board.placed_walls[WallOrientation.VERTICAL]) for board in boards]
+        return cls(
+            np.array(pawns, dtype=np.int8).reshape(-1, 2, 2),
+            np.array(horizontal, dtype=bool).reshape(-1, WALL_GRID_WIDTH, WALL_GRID_WIDTH),
+            np.array(vertical, dtype=bool).reshape(-1, WALL_GRID_WIDTH, WALL_GRID_WIDTH),
+        )
+
+    def __len__(self):
+        return self.pawns.shape[0]
+
+    def open_edges(self):
+        """(K, 9, 9, 4) array of open edges in `Direction` order."""
+        return open_edges(self.horizontal_walls, self.vertical_walls)
+
+    def distances_to_goal(self, player_id):
+        """(K, 9, 9) distance from every cell to `player_id`'s goal row, ignoring pawns."""
+        return distance_grids(self.open_edges(), GOAL_ROWS[player_id])
+
+    def pawn_distances(self):
+        """(K, 2) distance of each player's pawn to its goal row."""
+        edges = self.open_edges()
+        index = np.arange(len(self))
+        result = np.empty((len(self), 2), dtype=np.int16)
+        for player_index in range(2):
+            distances = distance_grids(edges, GOAL_ROWS[player_index + 1])
+            rows, cols = self.pawns[:, player_index, 0], self.pawns[:, player_index, 1]
+            result[:, player_index] = distances[index, rows, cols]
+        return result
+
+    def pawn_move_masks(self, player_id, edges=None):
+        """
+        (K, 9, 9) boolean mask of the cells `player_id`'s pawn can move to,
+        with jumps and sideways steps around the other pawn.
+        """
+        if edges is None:
+            edges = self.open_edges()
+        count = len(self)
+        index = np.arange(count)
+        rows = self.pawns[:, player_id - 1, 0].astype(np.intp)
+        cols = self.pawns[:, player_id - 1, 1].astype(np.intp)
+        other_rows = self.pawns[:, 2 - player_id, 0].astype(np.intp)
+        other_cols = self.pawns[:, 2 - player_id, 1].astype(np.intp)
+        pawn_edges = edges[index, rows, cols]
+        other_edges = edges[index, other_rows, other_cols]
+        moves = np.zeros((count, BOARD_WIDTH, BOARD_WIDTH), dtype=bool)
+
+        for direction, (d_row, d_col) in enumerate(STEPS):
+            step_rows, step_cols = rows + d_row, cols + d_col
+            open_step = pawn_edges[:, direction]
+            onto_other = open_step & (step_rows == other_rows) & (step_cols == other_cols)
+
+            plain = open_step & ~onto_other
+            moves[index[plain], step_rows[plain], step_cols[plain]] = True
+
+            jump = onto_other & other_edges[:, direction]
+            moves[index[jump], step_rows[jump] + d_row, step_cols[jump] + d_col] = True
+
+            # Can't jump over the other pawn, so try stepping around it
+            blocked = onto_other & ~other_edges[:, direction]
+            for side in PERPENDICULAR_STEPS[direction]:
+                side_row, side_col = STEPS[side]
+                around = blocked & other_edges[:, side]
+                moves[index[around], step_rows[around] + side_row, step_cols[around] + side_col] = True
+        return moves
+
+    def wall_masks(self):
+        """
+        (K, 8, 8) horizontal and vertical masks of the anchors where a wall
+        fits without overlapping or crossing another one. Paths are not checked.
+        """
+        horizontal, vertical = self.horizontal_walls, self.vertical_walls
+        horizontal_taken = horizontal | vertical
+        horizontal_taken[:, :, 1:] |= horizontal[:, :, :-1]
+        horizontal_taken[:, :, :-1] |= horizontal[:, :, 1:]
+        vertical_taken = horizontal | vertical
+        vertical_taken[:, 1:, :] |= vertical[:, :-1, :]
+        vertical_taken[:, :-1, :] |= vertical[:, 1:, :]
+        return ~horizontal_taken, ~vertical_taken
+
+    def obstacle_vertices(self):
+        """
+        (K, 10, 10) mask of the grid-line crossings touched by a wall or lying
+        on the board edge, numbered like `wall_vertices`.
+        """
+        vertices = np.zeros((len(self), BOARD_WIDTH + 1, BOARD_WIDTH + 1), dtype=bool)
+        vertices[:, [0, -1], :] = True
+        vertices[:, :, [0, -1]] = True
+        for offset in range(3):
+            vertices[:, 1:-1, offset:offset + WALL_GRID_WIDTH] |= self.horizontal_walls
+            vertices[:, offset:offset + WALL_GRID_WIDTH, 1:-1] |= self.vertical_walls
+        return vertices
+
+    def legal_wall_masks(self):
+        """
+        Like `wall_masks`, but also drop every wall that would leave either
+        pawn without a path to its goal row.
+
+        Only candidates touching obstacles at two or more of their crossings
+        can close off a region; those of all K positions get checked together
+        in one batched search per player.
+        """
+        masks = self.wall_masks()
+        vertices = self.obstacle_vertices().astype(np.int8)
+        contacts = (
+            vertices[:, 1:-1, :-2] + vertices[:, 1:-1, 1:-1] + vertices[:, 1:-1, 2:],
+            vertices[:, :-2, 1:-1] + vertices[:, 1:-1, 1:-1] + vertices[:, 2:, 1:-1],
+        )
+        candidates = [np.nonzero(mask & (touching >= 2)) for mask, touching in zip(masks, contacts)]
+        boards = np.concatenate([candidate[0] for candidate in candidates])
+        if boards.size == 0:
+            return masks
+
+        horizontal = self.horizontal_walls[boards]
+        vertical = self.vertical_walls[boards]
+        split = candidates[0][0].size
+        slots = np.arange(boards.size)
+        horizontal[slots[:split], candidates[0][1], candidates[0][2]] = True
+        vertical[slots[split:], candidates[1][1], candidates[1][2]] = True
+
+        edges = open_edges(horizontal, vertical)
+        keeps_paths = np.ones(boards.size, dtype=bool)
+        for player_index in range(2):
+            distances = distance_grids(edges, GOAL_ROWS[player_index + 1])
+            rows, cols = self.pawns[boards, player_index, 0], self.pawns[boards, player_index, 1]
+            keeps_paths &= distances[slots, rows, cols] < UNREACHABLE
+
+        for mask, candidate, kept in zip(masks, candidates, (keeps_paths[:split], keeps_paths[split:])):
+            mask[candidate[0][~kept], candidate[1][~kept], candidate[2][~kept]] = False
+        return masks
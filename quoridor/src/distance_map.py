@@ -0,0 +1,166 @@
+from collections import deque
+from heapq import heapify, heappop, heappush
+
+from quoridor.src.utils.helpers import BOARD_WIDTH, CELL_COUNT, DELTAS, DIRECTION_BITS
+
+# Stored for cells with no path to the goal row; more than one step away from
+# any real distance.
+UNREACHABLE = 2 * CELL_COUNT
+
+# Cell offset of the neighbour across an edge, keyed by the edge's direction bit
+BIT_DELTAS = {bit: delta for bit, delta in zip(DIRECTION_BITS, DELTAS)}
+
+
+class DistanceMap:
+    """
+    Shortest distance from every cell to one goal row, ignoring pawns.
+
+    The map reads the board's live open-edges table and has to be told which
+    edges changed. Closing edges only re-derives the cells whose every
+    shortest route used one of them; opening edges only relaxes outwards from
+    the cells that got closer. Either way the rest of the map is untouched.
+    """
+
+    def __init__(self, open_edges, goal_row):
+        self.open_edges = open_edges
+        self.goal_row = goal_row
+        self.distances = [UNREACHABLE] * CELL_COUNT
+        self.rebuild()
+
+    @classmethod
+    def from_distances(cls, open_edges, goal_row, distances):
+        """Create a map over `open_edges` from already computed distances, without a search."""
+        distance_map = cls.__new__(cls)
+        distance_map.open_edges = open_edges
+        distance_map.goal_row = goal_row
+        distance_map.distances = list(distances)
+        return distance_map
+
+    def rebuild(self):
+        """Recompute the whole map with a breadth-first flood fill from the goal row."""
+        distances = self.distances
+        open_edges = self.open_edges
+        for cell in range(CELL_COUNT):
+            distances[cell] = UNREACHABLE
+        first_goal_cell = self.goal_row * BOARD_WIDTH
+        queue = deque(range(first_goal_cell, first_goal_cell + BOARD_WIDTH))
+        for cell in queue:
+            distances[cell] = 0
+
+        while queue:
+            cell = queue.popleft()
+            next_distance = distances[cell] + 1
+            edges = open_edges[cell]
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if distances[neighbour] == UNREACHABLE:
+                        distances[neighbour] = next_distance
+                        queue.append(neighbour)
+
+    def shortest_path(self, cell) -> list[int]:
+        """
+        Return the cells of one shortest route from `cell` to the goal row,
+        both ends included, or an empty list if the goal row is unreachable.
+        """
+        distances = self.distances
+        open_edges = self.open_edges
+        if distances[cell] == UNREACHABLE:
+            return []
+        path = [cell]
+        while distances[cell]:
+            edges = open_edges[cell]
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if distances[neighbour] == distances[cell] - 1:
+                        break
+            cell = neighbour
+            path.append(cell)
+        return path
+
+    def edges_closed(self, cuts):
+        """Update the map after the (cell, direction bit) edges in `cuts` were closed."""
+        distances = self.distances
+        open_edges = self.open_edges
+
+        # A cell whose parent (a neighbour one step closer) was across a cut edge
+        # may have lost its only shortest route
+        stack = [
+            cell for cell, bit in cuts
+            if distances[cell] == distances[cell + BIT_DELTAS[bit]] + 1
+        ]
+        if not stack:
+            return
+
+        # Invalidate cells left without any parent, then re-check their children
+        invalid = set()
+        while stack:
+            cell = stack.pop()
+            if cell in invalid:
+                continue
+            distance = distances[cell]
+            edges = open_edges[cell]
+            has_parent = False
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if distances[neighbour] == distance - 1 and neighbour not in invalid:
+                        has_parent = True
+                        break
+            if has_parent:
+                continue
+            invalid.add(cell)
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if distances[neighbour] == distance + 1 and neighbour not in invalid:
+                        stack.append(neighbour)
+
+        if not invalid:
+            return
+
+        # Seed the invalidated region from its still-valid border, then settle it in
+        # order of distance
+        heap = []
+        for cell in invalid:
+            best = UNREACHABLE
+            edges = open_edges[cell]
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if neighbour not in invalid and distances[neighbour] + 1 < best:
+                        best = distances[neighbour] + 1
+            distances[cell] = best
+            if best < UNREACHABLE:
+                heap.append((best, cell))
+        heapify(heap)
+        self._relax(heap)
+
+    def edges_opened(self, cuts):
+        """Update the map after the (cell, direction bit) edges in `cuts` were reopened."""
+        distances = self.distances
+        heap = []
+        for cell, bit in cuts:
+            neighbour = cell + BIT_DELTAS[bit]
+            if distances[cell] + 1 < distances[neighbour]:
+                distances[neighbour] = distances[cell] + 1
+                heappush(heap, (distances[neighbour], neighbour))
+        self._relax(heap)
+
+    def _relax(self, heap):
+        """Propagate shorter distances outwards from the cells queued in `heap`."""
+        distances = self.distances
+        open_edges = self.open_edges
+        while heap:
+            distance, cell = heappop(heap)
+            if distance != distances[cell]:
+                continue
+            next_distance = distance + 1
+            edges = open_edges[cell]
+            for direction in range(4):
+                if edges & DIRECTION_BITS[direction]:
+                    neighbour = cell + DELTAS[direction]
+                    if next_distance < distances[neighbour]:
+                        distances[neighbour] = next_distance
+                        heappush(heap, (next_distance, neighbour))
@@ -0,0 +1,158 @@
+"""
+Static evaluation built from weighted position features.
+
+Every feature scores a position from player 1's side as an integer, so an
+`Evaluator` adds up weight * value once and negates the total for player 2.
+An `Evaluator` is a drop-in `evaluate` for `AlphaBetaAgent`.
+
+Evaluation is incremental. Shortest-path lengths come from the distance
+maps the board already updates on every wall. Features that cost more to
+compute remember the few inputs their last value depended on, so after a
+move or wall that leaves those inputs alone `update` hands back the last
+value instead of recomputing it.
+"""
+from abc import ABC, abstractmethod
+
+from quoridor.src.utils.helpers import GOAL_ROWS, cell_index, pawn_move_cells
+
+
+def _pawn_cells(game):
+    board = game.board
+    return cell_index(board.pawn1.position), cell_index(board.pawn2.position)
+
+
+class Feature(ABC):
+    """A position feature, scored from player 1's side: positive is good for player 1."""
+
+    name = "feature"
+
+    @abstractmethod
+    def compute(self, game) -> int:
+        """Score `game` from scratch."""
+        pass
+
+    def update(self, game, value) -> int:
+        """
+        Return the feature for `game`, given its `value` for the last position
+        this feature scored. Recomputes by default.
+        """
+        return self.compute(game)
+
+
+class PathDifference(Feature):
+    """
+    Steps player 2 needs to reach its goal row minus the steps player 1
+    needs, ignoring pawns. Read from the boards' incrementally maintained
+    distance maps, so computing it is two lookups.
+    """
+
+    name = "path_difference"
+
+    def compute(self, game) -> int:
+        distance_maps = game.board.distance_maps
+        cell1, cell2 = _pawn_cells(game)
+        return distance_maps[2].distances[cell2] - distance_maps[1].distances[cell1]
+
+
+class WallDifference(Feature):
+    """Walls player 1 has left minus walls player 2 has left."""
+
+    name = "wall_difference"
+
+    def compute(self, game) -> int:
+        return game.walls_remaining[1] - game.walls_remaining[2]
+
+
+class Mobility(Feature):
+    """
+    Pawn moves player 1 has minus pawn moves player 2 has. Pawn moves only
+    depend on the two pawn cells and their open edges, so the value carries
+    over until a pawn moves or a wall cuts an edge of either pawn's cell.
+    """
+
+    name = "mobility"
+
+    def __init__(self):
+        self._inputs = None
+
+    def compute(self, game) -> int:
+        open_edges = game.board.open_edges
+        cell1, cell2 = _pawn_cells(game)
+        self._inputs = (cell1, cell2, open_edges[cell1], open_edges[cell2])
+        return len(pawn_move_cells(open_edges, cell1, cell2)) - len(pawn_move_cells(open_edges, cell2, cell1))
+
+    def update(self, game, value) -> int:
+        open_edges = game.board.open_edges
+        cell1, cell2 = _pawn_cells(game)
+        if self._inputs == (cell1, cell2, open_edges[cell1], open_edges[cell2]):
+            return value
+        return self.compute(game)
+
+
+class GoalRowProgress(Feature):
+    """Rows player 2 is from its goal row minus rows player 1 is from its own, ignoring walls."""
+
+    name = "goal_row_progress"
+
+    def compute(self, game) -> int:
+        board = game.board
+        return abs(board.pawn2.position.row - GOAL_ROWS[2]) - abs(board.pawn1.position.row - GOAL_ROWS[1])
+
+
+FEATURE_CLASSES = {
+    feature_class.name: feature_class
+    for feature_class in (PathDifference, WallDifference, Mobility, GoalRowProgress)
+}
+
+# Shortest-path race first, walls in hand and mobility as tie-breakers
+DEFAULT_WEIGHTS = {"path_difference": 10, "wall_difference": 1, "mobility": 1}
+
+
+class Evaluator:
+    """
+    Weighted sum of features, called as `evaluator(game, player_id)`.
+
+    `features` is a list of (feature, weight) pairs; the default is
+    `DEFAULT_WEIGHTS`. Weights must be integers, so scores stay integers as
+    search and its transposition table expect. Features with weight 0 are
+    skipped. With `incremental` off every feature is recomputed on every
+    call. Features keep state between calls, so don't share them between
+    evaluators.
+    """
+
+    def __init__(self, features=None, incremental=True):
+        if features is None:
+            features = [(FEATURE_CLASSES[name](), weight) for name, weight in DEFAULT_WEIGHTS.items()]
+        for feature, weight in features:
+            if not isinstance(weight, int):
+                raise ValueError(f"Weight of {feature.name} must be an integer, got {weight!r}")
+        self.features = [(feature, weight) for feature, weight in features if weight]
+        self.incremental = incremental
+        self._values = None
+
+    @classmethod
+    def from_weights(cls, weights: dict, incremental=True) -> "Evaluator":
+        """Build an evaluator from feature names and weights."""
+        return cls([(FEATURE_CLASSES[name](), weight) for name, weight in weights.items()], incremental)
+
+    def feature_values(self, game) -> list[int]:
+        """The value of every feature for `game`, in `features` order."""
+        if self.incremental and self._values is not None:
+            values = [feature.update(game, value) for (feature, _), value in zip(self.features, self._values)]
+        else:
+            values = [feature.compute(game) for feature, _ in self.features]
+        self._values = values
+        return values
+
+    def __call__(self, game, player_id: int) -> int:
+        score = 0
+        for (_, weight), value in zip(self.features, self.feature_values(game)):
+            score += weight * value
+        return score if player_id == 1 else -score
+
+
+def feature_breakdown(game, evaluator=None) -> dict:
+    """Map each feature name of an evaluator (the default one if None) to its value for `game`."""
+    evaluator = Evaluator(incremental=False) if evaluator is None else evaluator
+    return {feature.name: value for (feature, _), value in zip(evaluator.features, evaluator.feature_values(game))}
+
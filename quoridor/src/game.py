@@ -1,6 +1,12 @@
 from enum import Enum
-from quoridor.src.board import Board
-from quoridor.src.utils.types import Position, WallOrientation
+from typing import NamedTuple
+from quoridor.src import zobrist
+from quoridor.src.board import Board, BoardSnapshot
+from quoridor.src.utils.helpers import (
+    GOAL_ROWS, WALL_EDGE_CUTS, WALL_ORIENTATIONS, WALL_POSITIONS, WALL_VERTICES, cell_index,
+    iter_wall_anchors, path_edges, reaches_row,
+)
+from quoridor.src.utils.types import Move, MoveType, Position, WallOrientation
 
 class GameState(Enum):
     """Game state enumeration."""
@@ -8,6 +14,19 @@ class GameState(Enum):
     PLAYER1_WIN = "player1_wins"  # Player 1 reached row 8
     PLAYER2_WIN = "player2_wins"  # Player 2 reached row 0
 
+class GameSnapshot(NamedTuple):
+    """
+    Immutable copy of a game's state, including its move history. Safe to
+    share between threads and cheap to pickle to other processes.
+    """
+    board: BoardSnapshot
+    current_player_id: int
+    walls_remaining: tuple  # (player 1, player 2)
+    game_state: GameState
+    path_blocked: bool
+    hash_key: int
+    undo_stack: tuple  # Records are immutable, so they are shared rather than copied
+
 class Game:
     def __init__(self):
         """Initialize a new game."""
@@ -16,6 +35,59 @@ class Game:
         self.walls_remaining = {1: 10, 2: 10}  # Each player starts with 10 walls
         self.game_state = GameState.ONGOING
         self.path_blocked = False  # Add flag for blocked path
+        # One (move, player_id, previous_position, previous_game_state, previous_hash_key)
+        # record per applied move; previous_position is None for walls
+        self.undo_stack = []
+        # 64-bit Zobrist key of the position, updated incrementally by every move
+        self.hash_key = zobrist.compute_hash(self)
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture the game's state as a `GameSnapshot`."""
+        return GameSnapshot(
+            self.board.snapshot(),
+            self.current_player_id,
+            (self.walls_remaining[1], self.walls_remaining[2]),
+            self.game_state,
+            self.path_blocked,
+            self.hash_key,
+            tuple(self.undo_stack),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, board_class=Board) -> "Game":
+        """Build an independent game from a snapshot, on a board of `board_class`."""
+        game = cls.__new__(cls)
+        game.board = board_class.from_snapshot(snapshot.board)
+        game.current_player_id = snapshot.current_player_id
+        game.walls_remaining = {1: snapshot.walls_remaining[0], 2: snapshot.walls_remaining[1]}
+        game.game_state = snapshot.game_state
+        game.path_blocked = snapshot.path_blocked
+        game.undo_stack = list(snapshot.undo_stack)
+        game.hash_key = snapshot.hash_key
+        return game
+
+    def clone(self) -> "Game":
+        """Return an independent copy of the game, on the same kind of board."""
+        game = Game.__new__(type(self))
+        game.board = self.board.clone()
+        game.current_player_id = self.current_player_id
+        game.walls_remaining = dict(self.walls_remaining)
+        game.game_state = self.game_state
+        game.path_blocked = self.path_blocked
+        game.undo_stack = list(self.undo_stack)
+        game.hash_key = self.hash_key
+        return game
+
+    def to_bytes(self) -> bytes:
+        """Encode the game as a compact binary game record (see `serialization`)."""
+        from quoridor.src.serialization import encode_game
+        return encode_game(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, board_class=Board) -> "Game":
+        """Rebuild a game, history included, from `to_bytes` output."""
+        from quoridor.src.serialization import decode_game
+        return decode_game(data, board_class)
 
     def is_game_over(self) -> bool:
         """Check if the game is over."""
@@ -48,12 +120,22 @@ class Game:
             return False
 
         current_pawn = self.board.pawn1 if self.current_player_id == 1 else self.board.pawn2
+        previous_position = current_pawn.position
 
         try:
             self.board.move_pawn(current_pawn, target_position)
+            self.undo_stack.append(
+                (Move.pawn(target_position), self.current_player_id, previous_position, self.game_state,
+                 self.hash_key)
+            )
+            self.hash_key ^= (
+                zobrist.pawn_key(self.current_player_id, previous_position)
+                ^ zobrist.pawn_key(self.current_player_id, target_position)
+            )
             if self._check_win_condition(current_pawn):
                 return True
             self.current_player_id = 3 - self.current_player_id  # Switch between 1 and 2
+            self.hash_key ^= zobrist.PLAYER2_TO_MOVE_KEY
             return True
         except ValueError:
             return False
@@ -85,13 +167,22 @@ class Game:
                 # Set path blocked flag
                 self.path_blocked = True
                 # Remove the wall if it blocks either player
-                if orientation == WallOrientation.HORIZONTAL:
-                    self.board.horizontal_wall_slots[position].occupied = False
-                else:
-                    self.board.vertical_wall_slots[position].occupied = False
+                self.board.remove_wall(orientation, position)
                 return False
             
             # Wall placement successful, update game state
+            self.undo_stack.append(
+                (Move.wall(orientation, position), self.current_player_id, None, self.game_state,
+                 self.hash_key)
+            )
+            walls_remaining_keys = zobrist.WALLS_REMAINING_KEYS[self.current_player_id]
+            walls_left = self.walls_remaining[self.current_player_id]
+            self.hash_key ^= (
+                zobrist.wall_key(orientation, position)
+                ^ walls_remaining_keys[walls_left]
+                ^ walls_remaining_keys[walls_left - 1]
+                ^ zobrist.PLAYER2_TO_MOVE_KEY
+            )
             self.walls_remaining[self.current_player_id] -= 1
             self.current_player_id = 3 - self.current_player_id  # Switch between 1 and 2
             return True
@@ -99,6 +190,40 @@ class Game:
         except ValueError:
             return False
 
+    def apply(self, move: Move) -> bool:
+        """
+        Play a pawn move or wall placement for the current player.
+        Returns True if the move was played, False if it was illegal.
+        """
+        if move.move_type == MoveType.PAWN:
+            return self.move_pawn(move.position)
+        return self.place_wall(move.orientation, move.position)
+
+    def undo(self) -> bool:
+        """
+        Take back the last successful move, restoring the pawn or wall slots,
+        walls remaining, current player, game state and hash key.
+        Returns True if a move was undone, False if there was nothing to undo.
+        """
+        if not self.undo_stack:
+            return False
+
+        move, player_id, previous_position, previous_game_state, previous_hash_key = self.undo_stack.pop()
+        if move.move_type == MoveType.PAWN:
+            pawn = self.board.pawn1 if player_id == 1 else self.board.pawn2
+            self.board.set_pawn_position(pawn, previous_position)
+        else:
+            self.board.remove_wall(move.orientation, move.position)
+            self.walls_remaining[player_id] += 1
+        self.current_player_id = player_id
+        self.game_state = previous_game_state
+        self.hash_key = previous_hash_key
+        return True
+
+    def get_move_history(self) -> list[Move]:
+        """Get the moves played so far, oldest first."""
+        return [record[0] for record in self.undo_stack]
+
     def get_valid_moves(self) -> list[Position]:
         """Get all valid moves for the current player's pawn."""
         if self.is_game_over():
@@ -110,6 +235,64 @@ class Game:
         except ValueError:
             return []
 
+    def generate_legal_walls(self) -> list[Move]:
+        """
+        Get every wall the current player can place without cutting off either pawn.
+
+        Candidates come from the board's maintained mask of geometrically free
+        anchors. A candidate can only cut a pawn off if it crosses that pawn's
+        current shortest path and touches existing walls or the board edge at two
+        points (closing a loop); only those candidates get a path search.
+        """
+        if self.is_game_over() or self.walls_remaining[self.current_player_id] <= 0:
+            return []
+
+        board = self.board
+        open_edges = board.open_edges
+        pawn_cells = {1: cell_index(board.pawn1.position), 2: cell_index(board.pawn2.position)}
+        edges_on_paths = {
+            player_id: path_edges(board.distance_maps[player_id].shortest_path(pawn_cells[player_id]))
+            for player_id in (1, 2)
+        }
+        obstacle_vertices = None
+
+        walls = []
+        for orientation in WALL_ORIENTATIONS:
+            edge_cuts = WALL_EDGE_CUTS[orientation]
+            vertices = WALL_VERTICES[orientation]
+            for anchor in iter_wall_anchors(board.placeable_walls[orientation]):
+                cuts = edge_cuts[anchor]
+                crossed = [
+                    player_id for player_id in (1, 2)
+                    if any(cut in edges_on_paths[player_id] for cut in cuts)
+                ]
+                if crossed:
+                    if obstacle_vertices is None:
+                        obstacle_vertices = board.obstacle_vertices()
+                    contacts = sum(1 for vertex in vertices[anchor] if vertex in obstacle_vertices)
+                    if contacts >= 2 and not self._keeps_paths(open_edges, cuts, crossed, pawn_cells):
+                        continue
+                walls.append(Move.wall(orientation, WALL_POSITIONS[anchor]))
+        return walls
+
+    @staticmethod
+    def _keeps_paths(open_edges, cuts, player_ids, pawn_cells) -> bool:
+        """Check if the given pawns still reach their goal rows with the `cuts` edges closed."""
+        for cell, bit in cuts:
+            open_edges[cell] &= ~bit
+        try:
+            return all(
+                reaches_row(open_edges, pawn_cells[player_id], GOAL_ROWS[player_id])
+                for player_id in player_ids
+            )
+        finally:
+            for cell, bit in cuts:
+                open_edges[cell] |= bit
+
+    def get_legal_moves(self) -> list[Move]:
+        """Get every legal move for the current player: pawn moves first, then walls."""
+        return [Move.pawn(position) for position in self.get_valid_moves()] + self.generate_legal_walls()
+
     def get_current_player(self) -> int:
         """Get the ID of the current player."""
         return self.current_player_id
@@ -0,0 +1,190 @@
+"""
+Opt-in counters and timers for the board and game hot paths.
+
+Nothing is instrumented until a profile is recording. `start` swaps timing
+wrappers in for the hot methods and functions listed in `TARGETS`, and `stop`
+puts the originals back, so code runs at full speed whenever no profile is
+active. The only permanent hook is a `None` check at the end of each path
+search, which reports the cells it visited.
+
+    with profiling() as profile:
+        agent.select_move(game)
+    print(profile.table())
+
+Times are inclusive: `Game.get_legal_moves` includes the
+`Game.generate_legal_walls` call it makes.
+"""
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+from quoridor.src import board, game, pathfinding
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.distance_map import DistanceMap
+from quoridor.src.utils import helpers
+
+# (owner, attribute, counter name) of everything timed while a profile records.
+# Functions imported by name into other modules are patched there too.
+TARGETS = (
+    # Path searches
+    (helpers, "reaches_row", "path_search.reaches_row"),
+    (game, "reaches_row", "path_search.reaches_row"),
+    (pathfinding, "find_path", "path_search.find_path"),
+    (board, "find_path", "path_search.find_path"),
+    (board.Board, "is_path_blocked", "path_check.Board.is_path_blocked"),
+    (BitBoard, "is_path_blocked", "path_check.BitBoard.is_path_blocked"),
+    (DistanceMap, "rebuild", "distance_map.rebuild"),
+    (DistanceMap, "edges_closed", "distance_map.edges_closed"),
+    (DistanceMap, "edges_opened", "distance_map.edges_opened"),
+    # Wall legality
+    (board.Board, "can_place_wall_at_position", "wall_check.Board.can_place_wall_at_position"),
+    (BitBoard, "can_place_wall_at_position", "wall_check.BitBoard.can_place_wall_at_position"),
+    (game.Game, "_keeps_paths", "wall_check.Game._keeps_paths"),
+    # Move generation
+    (board.Board, "get_all_valid_pawn_moves", "move_generation.Board.get_all_valid_pawn_moves"),
+    (BitBoard, "get_all_valid_pawn_moves", "move_generation.BitBoard.get_all_valid_pawn_moves"),
+    (game.Game, "generate_legal_walls", "move_generation.Game.generate_legal_walls"),
+    (game.Game, "get_legal_moves", "move_generation.Game.get_legal_moves"),
+    # Moves
+    (game.Game, "place_wall", "move.Game.place_wall"),
+    (game.Game, "move_pawn", "move.Game.move_pawn"),
+    (game.Game, "undo", "move.Game.undo"),
+)
+
+
+class Profile:
+    """Calls and seconds per instrumented target, plus event counts."""
+
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+        self.counts = {}
+        self.seconds_recorded = 0.0
+
+    def record(self, name, seconds):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def to_dict(self) -> dict:
+        """The profile as plain data: per-target calls, seconds and mean microseconds, and counts."""
+        return {
+            "seconds": round(self.seconds_recorded, 6),
+            "targets": {
+                name: {
+                    "calls": calls,
+                    "seconds": round(self.seconds[name], 6),
+                    "mean_us": round(self.seconds[name] / calls * 1e6, 3),
+                }
+                for name, calls in sorted(self.calls.items())
+            },
+            "counts": dict(sorted(self.counts.items())),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def table(self) -> str:
+        """The profile as a text table, slowest targets first."""
+        lines = [f"{'target':55} {'calls':>10} {'seconds':>10} {'mean us':>10}"]
+        for name in sorted(self.calls, key=lambda name: -self.seconds[name]):
+            calls, seconds = self.calls[name], self.seconds[name]
+            lines.append(f"{name:55} {calls:10,} {seconds:10.4f} {seconds / calls * 1e6:10.2f}")
+        for name, amount in sorted(self.counts.items()):
+            lines.append(f"{name:55} {amount:10,}")
+        return "\n".join(lines)
+
+
+_active = None
+_originals = []
+
+
+def _timed(name, function):
+    """Wrap `function` to add its calls and time to the active profile under `name`."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _active.record(name, time.perf_counter() - start_time)
+    return wrapper
+
+
+def _observe_search(name, cells_visited):
+    _active.count(f"path_search.{name}.cells_visited", cells_visited)
+
+
+def _place_wall_wrapper(timed_place_wall):
+    """Count walls `Game.place_wall` refused because they would cut a pawn off its goal."""
+    @functools.wraps(timed_place_wall)
+    def place_wall(self, orientation, position):
+        placed = timed_place_wall(self, orientation, position)
+        if not placed and self.path_blocked:
+            _active.count("move.Game.place_wall.rejected_path_blocked")
+        return placed
+    return place_wall
+
+
+def _keeps_paths_wrapper(timed_keeps_paths):
+    """Count wall candidates `generate_legal_walls` dropped because they cut a pawn off."""
+    @functools.wraps(timed_keeps_paths)
+    def keeps_paths(*args):
+        kept = timed_keeps_paths(*args)
+        if not kept:
+            _active.count("wall_check.Game._keeps_paths.rejected_path_blocked")
+        return kept
+    return keeps_paths
+
+
+def start(profile=None) -> Profile:
+    """Start recording into `profile` (a new one if None) and return it."""
+    global _active
+    if _active is not None:
+        raise RuntimeError("A profile is already recording")
+    _active = profile if profile is not None else Profile()
+    for owner, attribute, name in TARGETS:
+        original = owner.__dict__[attribute]
+        is_static = isinstance(original, staticmethod)
+        function = original.__func__ if is_static else original
+        wrapper = _timed(name, function)
+        if attribute == "place_wall":
+            wrapper = _place_wall_wrapper(wrapper)
+        elif attribute == "_keeps_paths":
+            wrapper = _keeps_paths_wrapper(wrapper)
+        _originals.append((owner, attribute, original))
+        setattr(owner, attribute, staticmethod(wrapper) if is_static else wrapper)
+    helpers.search_observer = _observe_search
+    _active.seconds_recorded -= time.perf_counter()
+    return _active
+
+
+def stop() -> Profile:
+    """Stop recording, restore the uninstrumented code and return the profile."""
+    global _active
+    if _active is None:
+        raise RuntimeError("No profile is recording")
+    helpers.search_observer = None
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+    profile, _active = _active, None
+    profile.seconds_recorded += time.perf_counter()
+    return profile
+
+
+def is_recording() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def profiling(profile=None):
+    """Record a profile for the duration of the `with` block, e.g. one game or one search."""
+    profile = start(profile)
+    try:
+        yield profile
+    finally:
+        stop()
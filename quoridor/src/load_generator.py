@@ -0,0 +1,149 @@
+"""
+Load generator for the game server: many concurrent clients playing games.
+
+Each client opens its own connection and plays hot-seat games (both sides)
+with random legal moves, picked from a local copy of the game so the server
+only validates and records them. Reports requests per second and latency
+percentiles over all requests.
+
+    python -m quoridor.src.server --port 8765 &
+    python -m quoridor.src.load_generator --port 8765 --clients 1000 --seconds 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from quoridor.src.game import Game
+from quoridor.src.utils.helpers import encode_move
+
+
+class LoadStats:
+    """Latency of every request, and how many moves and games were played."""
+
+    def __init__(self):
+        self.latencies = []
+        self.moves = 0
+        self.games = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def percentile(self, fraction) -> float:
+        """Latency in seconds below which `fraction` of the requests finished."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        seconds = self.seconds or 1e-9
+        return {
+            "requests": len(self.latencies),
+            "moves": self.moves,
+            "games": self.games,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "moves_per_second": round(self.moves / seconds, 1),
+            "requests_per_second": round(len(self.latencies) / seconds, 1),
+            "p50_ms": round(self.percentile(0.5) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(max(self.latencies, default=0.0) * 1000, 3),
+        }
+
+
+class Client:
+    """One connection speaking the server's JSON-lines protocol, timing every request."""
+
+    def __init__(self, reader, writer, stats):
+        self.reader = reader
+        self.writer = writer
+        self.stats = stats
+        self._next_id = 0
+
+    async def request(self, op, **fields) -> dict:
+        self._next_id += 1
+        message = {"id": self._next_id, "op": op, **fields}
+        start_time = time.perf_counter()
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        self.stats.latencies.append(time.perf_counter() - start_time)
+        if not response["ok"]:
+            self.stats.errors += 1
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_games(client, rng, deadline, max_plies=200):
+    """Play hot-seat games with random legal moves until `deadline` (loop time)."""
+    loop = asyncio.get_running_loop()
+    while loop.time() < deadline:
+        response = await client.request("new_game")
+        game_id = response["game"]["game_id"]
+        game = Game()
+        for _ in range(max_plies):
+            if game.is_game_over() or loop.time() >= deadline:
+                break
+            move = rng.choice(game.get_legal_moves())
+            response = await client.request("move", game_id=game_id, move=encode_move(move))
+            if not response["ok"] or response["game"]["status"] != "ongoing":
+                break
+            game.apply(move)
+            client.stats.moves += 1
+        await client.request("close", game_id=game_id)
+        client.stats.games += 1
+
+
+async def run_load(connect, clients=100, seconds=10.0, seed=0) -> LoadStats:
+    """
+    Run `clients` concurrent clients for `seconds`; `connect` is a coroutine
+    function returning a (reader, writer) pair to the server.
+    """
+    stats = LoadStats()
+    connections = [Client(*await connect(), stats) for _ in range(clients)]
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    deadline = start_time + seconds
+    try:
+        await asyncio.gather(*(
+            play_games(client, random.Random(seed * 100003 + index), deadline)
+            for index, client in enumerate(connections)
+        ))
+    finally:
+        stats.seconds = loop.time() - start_time
+        for client in connections:
+            await client.close()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test a Quoridor game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Connect to this Unix socket path instead of TCP")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.unix:
+        def connect():
+            return asyncio.open_unix_connection(args.unix)
+    else:
+        def connect():
+            return asyncio.open_connection(args.host, args.port)
+    report = asyncio.run(run_load(connect, args.clients, args.seconds, args.seed)).to_dict()
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print(f"{key:20} {value:>14,}")
+
+
+if __name__ == "__main__":
+    main()
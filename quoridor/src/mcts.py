@@ -0,0 +1,328 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from quoridor.src.ai_agents import Agent
+from quoridor.src.game import Game
+from quoridor.src.utils.helpers import WALL_ORIENTATIONS, WALL_POSITIONS, decode_move, encode_move
+from quoridor.src.utils.types import Move
+
+
+class MCTSNode:
+    """A node of the search tree: the position reached by playing `move` from the parent."""
+
+    __slots__ = (
+        "move", "parent", "player_just_moved", "children", "untried_moves", "winning_child", "visits", "wins",
+    )
+
+    def __init__(self, move, parent, player_just_moved):
+        self.move = move
+        self.parent = parent
+        self.player_just_moved = player_just_moved
+        self.children = []
+        self.untried_moves = None  # Filled with the legal moves on first visit
+        self.winning_child = None  # A child whose move wins the game outright
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """Pick the child with the highest UCT score, or the immediate win if there is one."""
+        if self.winning_child is not None:
+            return self.winning_child
+        log_visits = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def find_child(self, move):
+        for child in self.children:
+            if child.move == move:
+                return child
+        return None
+
+
+class MCTSStats:
+    """Counters describing one `select_move` call."""
+
+    def __init__(self):
+        self.playouts = 0
+        self.worker_playouts = []
+        self.worker_seconds = []
+        self.elapsed_seconds = 0.0
+        self.reused_visits = 0
+        self.best_move = None
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def playouts_per_second_per_worker(self) -> list[float]:
+        return [
+            playouts / seconds if seconds > 0 else 0.0
+            for playouts, seconds in zip(self.worker_playouts, self.worker_seconds)
+        ]
+
+    def __repr__(self):
+        per_worker = ", ".join(f"{rate:.0f}" for rate in self.playouts_per_second_per_worker)
+        return (
+            f"MCTSStats(playouts={self.playouts}, reused_visits={self.reused_visits}, "
+            f"playouts/s per worker=[{per_worker}], best_move={self.best_move!r})"
+        )
+
+
+def rollout(game: Game, rng, max_plies=200, wall_probability=0.05, greedy=True) -> int:
+    """
+    Play the game out from its current position and return the winner's id.
+    `game` is restored before returning.
+
+    Each ply, with probability `wall_probability` the side to move tries one
+    random wall; otherwise it moves its pawn, preferring (if `greedy`) the step
+    that gets closest to its goal row. Games still running after `max_plies`
+    are scored for the player closer to goal, the side to move winning ties.
+    """
+    board = game.board
+    played = 0
+    try:
+        while not game.is_game_over() and played < max_plies:
+            player_id = game.current_player_id
+            if game.walls_remaining[player_id] and rng.random() < wall_probability:
+                wall = Move.wall(rng.choice(WALL_ORIENTATIONS), rng.choice(WALL_POSITIONS))
+                if game.apply(wall):
+                    played += 1
+                    continue
+            moves = game.get_valid_moves()
+            if not moves:
+                break
+            if greedy:
+                best = min(board.distance_to_goal(player_id, move) for move in moves)
+                moves = [move for move in moves if board.distance_to_goal(player_id, move) == best]
+            game.move_pawn(rng.choice(moves))
+            played += 1
+
+        if game.is_game_over():
+            return game.get_winner()
+        player_id = game.current_player_id
+        opponent_id = 3 - player_id
+        own = board.distance_to_goal(player_id, (board.pawn1 if player_id == 1 else board.pawn2).position)
+        other = board.distance_to_goal(opponent_id, (board.pawn2 if player_id == 1 else board.pawn1).position)
+        return player_id if own <= other else opponent_id
+    finally:
+        for _ in range(played):
+            game.undo()
+
+
+def search(game: Game, root: MCTSNode, rng, iterations=None, deadline=None, exploration=1.4,
+           rollout_options=None) -> int:
+    """
+    Grow the tree under `root` (which must match `game`'s position) until
+    `iterations` playouts are done or `deadline` (a `time.perf_counter` value)
+    passes. Returns the number of playouts. `game` is restored before returning.
+    """
+    rollout_options = rollout_options or {}
+    playouts = 0
+    while (iterations is None or playouts < iterations) and (deadline is None or time.perf_counter() < deadline):
+        node = root
+        depth = 0
+        try:
+            # Selection: descend through fully expanded nodes and known wins
+            while node.untried_moves is not None and (
+                    node.winning_child is not None or (not node.untried_moves and node.children)):
+                node = node.select_child(exploration)
+                game.apply(node.move)
+                depth += 1
+
+            # Expansion: add one untried child
+            if node.untried_moves is None:
+                node.untried_moves = [] if game.is_game_over() else game.get_legal_moves()
+                rng.shuffle(node.untried_moves)
+            if node.untried_moves:
+                move = node.untried_moves.pop()
+                player_id = game.current_player_id
+                game.apply(move)
+                depth += 1
+                child = MCTSNode(move, node, player_id)
+                node.children.append(child)
+                if game.is_game_over():
+                    node.winning_child = child
+                node = child
+
+            # Simulation
+            winner = game.get_winner() if game.is_game_over() else rollout(game, rng, **rollout_options)
+        finally:
+            for _ in range(depth):
+                game.undo()
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if node.player_just_moved == winner:
+                node.wins += 1
+            node = node.parent
+        playouts += 1
+    return playouts
+
+
+def _reuse_subtree(root, root_history, history):
+    """
+    Return the node of an existing tree that matches `history`, detached from its
+    parent, or None if the tree does not lead to that position.
+    """
+    if root is None or history[:len(root_history)] != root_history:
+        return None
+    node = root
+    for code in history[len(root_history):]:
+        node = node.find_child(decode_move(code))
+        if node is None:
+            return None
+    node.parent = None
+    return node
+
+
+def _winning_code(root):
+    return encode_move(root.winning_child.move) if root.winning_child is not None else None
+
+
+# Trees kept by each worker process between tasks, as slot -> (history codes, root)
+_worker_trees = {}
+
+
+def _worker_search(snapshot, iterations, time_budget_ms, exploration, rollout_options, seed, reuse_tree, slot):
+    """
+    Run one root-parallel search in a worker process and report root child
+    statistics. Trees are kept per `slot`, the task's index in its batch, so
+    a process that runs two tasks of one batch doesn't grow one tree twice.
+    """
+    start_time = time.perf_counter()
+    deadline = start_time + time_budget_ms / 1000 if time_budget_ms is not None else None
+    game = Game.from_snapshot(snapshot)
+    history = [encode_move(move) for move in game.get_move_history()]
+    cached_history, cached_root = _worker_trees.get(slot, (None, None))
+    root = _reuse_subtree(cached_root, cached_history, history) if reuse_tree else None
+    if root is None:
+        root = MCTSNode(None, None, 3 - game.current_player_id)
+    reused_visits = root.visits
+    playouts = search(game, root, random.Random(seed), iterations, deadline, exploration, rollout_options)
+    if reuse_tree:
+        _worker_trees[slot] = (history, root)
+    else:
+        _worker_trees.pop(slot, None)
+    children = {encode_move(child.move): (child.visits, child.wins) for child in root.children}
+    return children, _winning_code(root), reused_visits, playouts, time.perf_counter() - start_time
+
+
+class MCTSAgent(Agent):
+    """
+    Monte Carlo Tree Search with UCT selection and fast rollouts.
+
+    The search stops after `iterations` playouts or `time_budget_ms`,
+    whichever comes first (at least one must be given), and plays the most
+    visited root move. With `workers` > 1 the search is root-parallel: every
+    worker process grows its own tree over the budget (iterations are split
+    between workers) and the root statistics are summed. With `reuse_tree`
+    the tree under the position actually reached is kept for the next move,
+    in-process, or per worker process on a best-effort basis.
+
+    Call `close()` (or use the agent as a context manager) to shut the
+    process pool down.
+    """
+
+    def __init__(self, iterations=None, time_budget_ms=None, workers=1, exploration=1.4,
+                 reuse_tree=True, seed=None, rollout_max_plies=200, rollout_wall_probability=0.05,
+                 greedy_rollouts=True):
+        if iterations is None and time_budget_ms is None:
+            raise ValueError("Give an iteration or time budget")
+        self.iterations = iterations
+        self.time_budget_ms = time_budget_ms
+        self.workers = workers
+        self.exploration = exploration
+        self.reuse_tree = reuse_tree
+        self.rollout_options = {
+            "max_plies": rollout_max_plies,
+            "wall_probability": rollout_wall_probability,
+            "greedy": greedy_rollouts,
+        }
+        self._rng = random.Random(seed)
+        self._pool = None
+        self._root = None
+        self._root_history = None
+        self.last_stats = MCTSStats()
+
+    def select_move(self, game: Game) -> Move:
+        if game.is_game_over():
+            raise ValueError("No legal moves")
+        stats = MCTSStats()
+        self.last_stats = stats
+        start_time = time.perf_counter()
+        history = [encode_move(move) for move in game.get_move_history()]
+
+        if self.workers <= 1:
+            root_visits, winning_code = self._search_in_process(game, history, stats)
+        else:
+            root_visits, winning_code = self._search_in_pool(game.snapshot(), stats)
+        if not root_visits:
+            raise ValueError("No legal moves")
+
+        best_code = max(root_visits, key=lambda code: root_visits[code])
+        if winning_code is not None:
+            best_code = winning_code
+        stats.best_move = decode_move(best_code)
+        stats.playouts = sum(stats.worker_playouts)
+        stats.elapsed_seconds = time.perf_counter() - start_time
+        return stats.best_move
+
+    def _search_in_process(self, game, history, stats):
+        start_time = time.perf_counter()
+        deadline = start_time + self.time_budget_ms / 1000 if self.time_budget_ms is not None else None
+        root = _reuse_subtree(self._root, self._root_history, history) if self.reuse_tree else None
+        if root is None:
+            root = MCTSNode(None, None, 3 - game.current_player_id)
+        stats.reused_visits = root.visits
+        playouts = search(game, root, self._rng, self.iterations, deadline, self.exploration,
+                          self.rollout_options)
+        stats.worker_playouts.append(playouts)
+        stats.worker_seconds.append(time.perf_counter() - start_time)
+        if self.reuse_tree:
+            self._root, self._root_history = root, history
+        root_visits = {encode_move(child.move): child.visits for child in root.children}
+        return root_visits, _winning_code(root)
+
+    def _search_in_pool(self, snapshot, stats):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        iterations = None
+        if self.iterations is not None:
+            iterations = max(1, self.iterations // self.workers)
+        futures = [
+            self._pool.submit(
+                _worker_search, snapshot, iterations, self.time_budget_ms, self.exploration,
+                self.rollout_options, self._rng.getrandbits(64), self.reuse_tree, slot,
+            )
+            for slot in range(self.workers)
+        ]
+        root_visits = {}
+        winning_code = None
+        for future in futures:
+            children, worker_winning_code, reused_visits, playouts, seconds = future.result()
+            stats.reused_visits += reused_visits
+            if worker_winning_code is not None:
+                winning_code = worker_winning_code
+            stats.worker_playouts.append(playouts)
+            stats.worker_seconds.append(seconds)
+            for code, (visits, _wins) in children.items():
+                root_visits[code] = root_visits.get(code, 0) + visits
+        return root_visits, winning_code
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,96 @@
+"""
+Move ordering for alpha-beta search.
+
+Alpha-beta prunes the most when the best move is tried first. `MoveOrderer`
+ranks a node's moves in tiers, best first:
+
+    the transposition-table move, killer moves of the ply, pawn steps that
+    shorten the mover's own path, walls that cut the opponent's current
+    shortest path, walls that touch a cell of that path, everything else
+
+and breaks ties inside a tier with a history table: how much each move has
+caused beta cutoffs for the side to move, weighted by depth squared. Most
+of the 100+ wall candidates fall in the last tier and are tried last.
+"""
+from quoridor.src.utils.helpers import (
+    MOVE_CODE_COUNT, WALL_CODE_BASE, WALL_EDGE_CUTS, WALL_ORIENTATIONS, cell_index, encode_move, path_edges,
+)
+
+TABLE_MOVE, KILLER, PAWN_ADVANCE, WALL_ON_PATH, WALL_NEAR_PATH, QUIET = 5, 4, 3, 2, 1, 0
+
+# Edges each wall cuts, indexed by move code minus WALL_CODE_BASE
+_WALL_CUTS = tuple(cuts for orientation in WALL_ORIENTATIONS for cuts in WALL_EDGE_CUTS[orientation])
+
+# History scores stay below this, so they never lift a move out of its tier
+HISTORY_LIMIT = 1 << 20
+
+
+class MoveOrderer:
+    """
+    Killer moves per ply and a history table per player, kept across the
+    iterations of a search. Call `new_search` before each search.
+    """
+
+    def __init__(self, max_ply=128, killers_per_ply=2):
+        self.max_ply = max_ply
+        self.killers_per_ply = killers_per_ply
+        self.killers = [[] for _ in range(max_ply)]
+        self.history = {1: [0] * MOVE_CODE_COUNT, 2: [0] * MOVE_CODE_COUNT}
+
+    def new_search(self):
+        """Forget the killers and age the history, so older searches count for less."""
+        for killers in self.killers:
+            killers.clear()
+        for table in self.history.values():
+            for code in range(MOVE_CODE_COUNT):
+                table[code] >>= 1
+
+    def order(self, game, moves, ply, first_move=None) -> list:
+        """Return `moves` sorted best first; `first_move` (e.g. from the transposition table) leads."""
+        board = game.board
+        player_id = game.current_player_id
+        own_pawn, opponent_pawn = (board.pawn1, board.pawn2) if player_id == 1 else (board.pawn2, board.pawn1)
+        own_distances = board.distance_maps[player_id].distances
+        own_distance = own_distances[cell_index(own_pawn.position)]
+        opponent_path = board.distance_maps[3 - player_id].shortest_path(cell_index(opponent_pawn.position))
+        opponent_cells = set(opponent_path)
+        opponent_edges = path_edges(opponent_path)
+        first_code = encode_move(first_move) if first_move is not None else None
+        killers = self.killers[ply] if ply < self.max_ply else ()
+        history = self.history[player_id]
+
+        keyed = []
+        for index, move in enumerate(moves):
+            code = encode_move(move)
+            if code == first_code:
+                tier = TABLE_MOVE
+            elif code in killers:
+                tier = KILLER
+            elif code < WALL_CODE_BASE:
+                tier = PAWN_ADVANCE if own_distances[code] < own_distance else QUIET
+            else:
+                cuts = _WALL_CUTS[code - WALL_CODE_BASE]
+                if any(cut in opponent_edges for cut in cuts):
+                    tier = WALL_ON_PATH
+                elif any(cell in opponent_cells for cell, _ in cuts):
+                    tier = WALL_NEAR_PATH
+                else:
+                    tier = QUIET
+            # Negated so that an ascending sort puts the best first; the index keeps it stable
+            keyed.append((-(tier * HISTORY_LIMIT + history[code]), index, move))
+        keyed.sort()
+        return [move for _, _, move in keyed]
+
+    def record_cutoff(self, move, ply, depth, player_id):
+        """Note that `move` by `player_id` caused a beta cutoff at `ply` with `depth` plies left."""
+        code = encode_move(move)
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if code not in killers:
+                killers.insert(0, code)
+                del killers[self.killers_per_ply:]
+        table = self.history[player_id]
+        table[code] += depth * depth
+        if table[code] >= HISTORY_LIMIT:
+            for other in range(MOVE_CODE_COUNT):
+                table[other] >>= 1
@@ -0,0 +1,152 @@
+"""
+Opening book: how often each move was played, and won, from positions seen
+early in recorded games, keyed by the position's Zobrist hash.
+
+On disk the book is a column table sorted by key (little-endian):
+    BOOK_MAGIC, entry count (u32), keys (u64 each), move codes (u8 each),
+    games (u32 each), wins (u32 each)
+Loading reads each column straight into an `array`, and lookups bisect the
+key column, so a query costs a few microseconds.
+"""
+import random
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from quoridor.src.ai_agents import Agent
+from quoridor.src.game import Game
+from quoridor.src.utils.helpers import decode_move, encode_move
+from quoridor.src.utils.types import Move
+
+BOOK_MAGIC = b"QBK\x01"
+COUNT_FORMAT = struct.Struct("<I")
+
+
+class OpeningBookBuilder:
+    """Collect per-position move statistics from the first `max_plies` of games."""
+
+    def __init__(self, max_plies=12):
+        self.max_plies = max_plies
+        self.stats = {}  # (hash key, move code) -> [games, wins]
+
+    def add_game(self, game: Game):
+        """Add a game from its move history; the game must have started at the initial position."""
+        self.add_moves([encode_move(move) for move in game.get_move_history()], game.get_winner())
+
+    def add_moves(self, codes, winner=None):
+        """Add a game given as move codes from the initial position, and its winner (or None)."""
+        game = Game()
+        for code in codes[:self.max_plies]:
+            key = (game.hash_key, code)
+            player_id = game.current_player_id
+            if not game.apply(decode_move(code)):
+                raise ValueError(f"Illegal move in game: {decode_move(code)!r}")
+            entry = self.stats.get(key)
+            if entry is None:
+                entry = self.stats[key] = [0, 0]
+            entry[0] += 1
+            if winner == player_id:
+                entry[1] += 1
+
+    def build(self, min_games=1) -> "OpeningBook":
+        """Freeze the statistics of moves played at least `min_games` times into a book."""
+        book = OpeningBook()
+        for (key, code), (games, wins) in sorted(self.stats.items()):
+            if games >= min_games:
+                book.keys.append(key)
+                book.moves.append(code)
+                book.games.append(games)
+                book.wins.append(wins)
+        return book
+
+
+class OpeningBook:
+    """Sorted columns of (hash key, move code, games, wins) entries."""
+
+    def __init__(self):
+        self.keys = array("Q")
+        self.moves = array("B")
+        self.games = array("I")
+        self.wins = array("I")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, game):
+        index = bisect_left(self.keys, game.hash_key)
+        return index < len(self.keys) and self.keys[index] == game.hash_key
+
+    def lookup(self, game: Game) -> list[tuple]:
+        """Return (move, games, wins) for every book move of the position, most played first."""
+        key = game.hash_key
+        keys = self.keys
+        index = bisect_left(keys, key)
+        entries = []
+        while index < len(keys) and keys[index] == key:
+            entries.append((decode_move(self.moves[index]), self.games[index], self.wins[index]))
+            index += 1
+        entries.sort(key=lambda entry: -entry[1])
+        return entries
+
+    def choose(self, game: Game, rng=None, min_games=1):
+        """
+        Pick a book move for the position, or None if it is not in the book.
+        Plays the most played move, or with `rng` a random one weighted by
+        games. Moves that aren't legal (a hash collision) are skipped.
+        """
+        entries = [entry for entry in self.lookup(game) if entry[1] >= min_games]
+        while entries:
+            if rng is None:
+                move = entries[0][0]
+            else:
+                move = rng.choices(entries, weights=[entry[1] for entry in entries])[0][0]
+            if game.apply(move):
+                game.undo()
+                return move
+            entries = [entry for entry in entries if entry[0] != move]
+        return None
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(BOOK_MAGIC)
+            file.write(COUNT_FORMAT.pack(len(self)))
+            for column in (self.keys, self.moves, self.games, self.wins):
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(file)
+
+    @classmethod
+    def load(cls, path) -> "OpeningBook":
+        book = cls()
+        with open(path, "rb") as file:
+            if file.read(len(BOOK_MAGIC)) != BOOK_MAGIC:
+                raise ValueError("Not an opening book")
+            (count,) = COUNT_FORMAT.unpack(file.read(COUNT_FORMAT.size))
+            for column in (book.keys, book.moves, book.games, book.wins):
+                column.fromfile(file, count)
+                if sys.byteorder == "big":
+                    column.byteswap()
+        return book
+
+
+class BookAgent(Agent):
+    """
+    Play book moves while the position is in the book and hand over to
+    `fallback` once it is not. `last_from_book` tells which happened.
+    """
+
+    def __init__(self, book: OpeningBook, fallback: Agent, min_games=1, seed=None, randomize=False):
+        self.book = book
+        self.fallback = fallback
+        self.min_games = min_games
+        self._rng = random.Random(seed) if randomize else None
+        self.last_from_book = False
+
+    def select_move(self, game: Game) -> Move:
+        move = self.book.choose(game, self._rng, self.min_games)
+        self.last_from_book = move is not None
+        if move is None:
+            move = self.fallback.select_move(game)
+        return move
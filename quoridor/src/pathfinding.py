@@ -0,0 +1,77 @@
+"""
+Shortest paths from a cell to a target row over an open-edges table.
+
+`find_path` is an A* search whose heuristic is the number of rows left to the
+target row. That never overestimates and drops by at most one per step, so
+the first target cell taken off the frontier ends a shortest path. Step costs
+are all one, so a step changes a cell's estimate f = steps + rows left by 0
+(towards the target), 1 (sideways) or 2 (away), and the frontier is kept as
+three buckets instead of a heap. Each bucket is popped last-in first-out, so
+while a straight run towards the row is open the search just follows it.
+"""
+from quoridor.src.utils import helpers
+from quoridor.src.utils.helpers import BOARD_WIDTH, CELL_COUNT, DELTAS, DIRECTION_BITS
+
+# Step count stored for cells the search has not reached
+_UNSEEN = 2 * CELL_COUNT
+
+# Estimate increase of a step in each `Direction` order direction, for cells
+# above (lower row numbers than) and below the target row
+_ESTIMATE_COSTS_ABOVE = (2, 0, 1, 1)
+_ESTIMATE_COSTS_BELOW = (0, 2, 1, 1)
+
+
+def find_path(open_edges, start, target_row) -> list[int]:
+    """
+    Return the cells of one shortest route from cell `start` to `target_row`,
+    both ends included, or an empty list if the row is unreachable.
+    """
+    first_target = target_row * BOARD_WIDTH
+    last_target = first_target + BOARD_WIDTH - 1
+    steps = [_UNSEEN] * CELL_COUNT
+    parents = [-1] * CELL_COUNT
+    steps[start] = 0
+    # Frontier buckets for estimates f, f + 1 and f + 2, rotated as f grows
+    buckets = [[start], [], []]
+    base = 0
+    # How much a step in each direction raises the estimate, above and below the target row
+    costs_above, costs_below = _ESTIMATE_COSTS_ABOVE, _ESTIMATE_COSTS_BELOW
+    pending = 1
+
+    while pending:
+        current = buckets[base]
+        if not current:
+            base = (base + 1) % 3
+            continue
+        cell = current.pop()
+        pending -= 1
+        if first_target <= cell <= last_target:
+            path = [cell]
+            while cell != start:
+                cell = parents[cell]
+                path.append(cell)
+            path.reverse()
+            break
+
+        next_steps = steps[cell] + 1
+        edges = open_edges[cell]
+        costs = costs_above if cell < first_target else costs_below
+        for direction in range(4):
+            if edges & DIRECTION_BITS[direction]:
+                neighbour = cell + DELTAS[direction]
+                if next_steps < steps[neighbour]:
+                    steps[neighbour] = next_steps
+                    parents[neighbour] = cell
+                    buckets[(base + costs[direction]) % 3].append(neighbour)
+                    pending += 1
+    else:
+        path = []
+    if helpers.search_observer is not None:
+        helpers.search_observer("find_path", CELL_COUNT - steps.count(_UNSEEN))
+    return path
+
+
+def path_length(open_edges, start, target_row):
+    """Return the number of steps from cell `start` to `target_row`, or None if it is unreachable."""
+    path = find_path(open_edges, start, target_row)
+    return len(path) - 1 if path else None
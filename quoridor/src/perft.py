@@ -0,0 +1,112 @@
+"""
+Perft: count every legal move sequence of a given length from a position.
+
+The counts pin down the move generator exactly (pawn steps, jumps and
+side-steps, and every wall that is free and leaves both pawns a path), so
+any faster board engine must reproduce them, and the time they take is the
+generator's throughput.
+
+    python -m quoridor.src.perft --position start --depth 3 --divide
+"""
+import argparse
+import time
+
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.game import Game
+from quoridor.src.serialization import POSITION_FORMAT, decode_position
+from quoridor.src.utils.helpers import decode_move, encode_move
+
+# Standard positions, as move codes played from the start
+STANDARD_MOVES = {
+    "start": [],
+    # Pawns face to face in column 4, so both have jumps; a few walls around them
+    "face_to_face": [13, 67, 22, 58, 31, 49, 40, 81 + 3 * 8 + 2, 81 + 64 + 4 * 8 + 5],
+    # A wall-heavy middle game with both pawns off their start column
+    "walled": [
+        81 + 1 * 8 + 3, 81 + 6 * 8 + 4, 3, 81 + 64 + 3 * 8 + 1, 81 + 4 * 8 + 5, 75,
+        81 + 64 + 5 * 8 + 6, 66, 12, 81 + 2 * 8 + 0,
+    ],
+}
+
+# Positions that can't be reached by a short move list: (pawn 1 cell, pawn 2 cell,
+# horizontal walls mask, vertical walls mask, player 1 walls, player 2 walls, status)
+STANDARD_FIELDS = {
+    # Neither side has walls left: only pawn moves remain
+    "no_walls_left": (4, 76, 0b10101 << 24, 0b101 << 40, 0, 0, 1),
+}
+
+STANDARD_POSITIONS = tuple(STANDARD_MOVES) + tuple(STANDARD_FIELDS)
+
+
+def standard_position(name, board_class=Board) -> Game:
+    """Build one of the `STANDARD_POSITIONS`."""
+    if name in STANDARD_FIELDS:
+        return decode_position(POSITION_FORMAT.pack(*STANDARD_FIELDS[name]), 0, board_class)
+    game = Game.from_snapshot(Game().snapshot(), board_class)
+    for code in STANDARD_MOVES[name]:
+        if not game.apply(decode_move(code)):
+            raise ValueError(f"Illegal move in standard position {name}: {decode_move(code)!r}")
+    return game
+
+
+def perft(game: Game, depth: int) -> int:
+    """Count the legal move sequences of `depth` moves from `game`'s position; games that end stop early."""
+    if depth == 0:
+        return 1
+    moves = game.get_legal_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.apply(move)
+        try:
+            nodes += perft(game, depth - 1)
+        finally:
+            game.undo()
+    return nodes
+
+
+def divide(game: Game, depth: int) -> list[tuple]:
+    """Return (move, count) for every root move, in generation order; counts sum to `perft`."""
+    counts = []
+    for move in game.get_legal_moves():
+        game.apply(move)
+        try:
+            counts.append((move, perft(game, depth - 1)))
+        finally:
+            game.undo()
+    return counts
+
+
+def timed_perft(game: Game, depth: int) -> tuple:
+    """Return (nodes, seconds) of a perft run."""
+    start_time = time.perf_counter()
+    nodes = perft(game, depth)
+    return nodes, time.perf_counter() - start_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count legal move sequences from a Quoridor position.")
+    parser.add_argument("--position", choices=STANDARD_POSITIONS, default="start")
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--divide", action="store_true", help="Print the count under every root move")
+    parser.add_argument("--board", choices=("board", "bitboard"), default="board")
+    args = parser.parse_args(argv)
+
+    board_class = BitBoard if args.board == "bitboard" else Board
+    game = standard_position(args.position, board_class)
+    start_time = time.perf_counter()
+    if args.divide:
+        counts = divide(game, args.depth)
+        for move, count in counts:
+            print(f"{encode_move(move):4} {move!r:50} {count:12,}")
+        nodes = sum(count for _, count in counts)
+    else:
+        nodes = perft(game, args.depth)
+    seconds = time.perf_counter() - start_time
+    print(f"perft({args.position}, {args.depth}) = {nodes:,} in {seconds:.2f} s, {nodes / seconds:,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Headless self-play: play many games between two agents and stream the results
+to a JSON-lines file, one game per line, as the games finish.
+
+    python -m quoridor.src.self_play --games 1000 --workers 8 --output games.jsonl \
+        --agent alphabeta:time_budget_ms=20,max_depth=2 --agent mcts:iterations=200
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from quoridor.src.ai_agents import AlphaBetaAgent
+from quoridor.src.game import Game
+from quoridor.src.mcts import MCTSAgent
+from quoridor.src.utils.helpers import encode_move
+from quoridor.src.utils.types import Move
+
+# Agents that can be named on the command line
+AGENT_CLASSES = {
+    "alphabeta": AlphaBetaAgent,
+    "mcts": MCTSAgent,
+}
+
+
+def play_game(agents, seed=None, opening_plies=0, max_plies=400) -> dict:
+    """
+    Play one game between `agents` (player 1's agent first) and return its record.
+
+    The first `opening_plies` moves are uniformly random pawn moves drawn from
+    `seed`, so deterministic agents still produce distinct games. Games not
+    decided after `max_plies` moves are recorded with no winner.
+    """
+    game = Game()
+    rng = random.Random(seed)
+    moves = []
+    move_times_ms = []
+    start_time = time.perf_counter()
+    while not game.is_game_over() and len(moves) < max_plies:
+        move_start = time.perf_counter()
+        if len(moves) < opening_plies:
+            move = Move.pawn(rng.choice(game.get_valid_moves()))
+        else:
+            move = agents[game.current_player_id - 1].select_move(game)
+        move_times_ms.append(round((time.perf_counter() - move_start) * 1000, 3))
+        if not game.apply(move):
+            raise ValueError(f"Agent chose an illegal move: {move!r}")
+        moves.append(encode_move(move))
+    return {
+        "seed": seed,
+        "moves": moves,
+        "winner": game.get_winner(),
+        "length": len(moves),
+        "move_times_ms": move_times_ms,
+        "seconds": round(time.perf_counter() - start_time, 6),
+    }
+
+
+class SelfPlayStats:
+    """Throughput of one `run_self_play` call."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.games = 0
+        self.wins = {1: 0, 2: 0, None: 0}
+        self.plies = 0
+        self.game_seconds = 0.0
+        self.elapsed_seconds = 0.0
+
+    def add(self, record):
+        self.games += 1
+        self.wins[record["winner"]] += 1
+        self.plies += record["length"]
+        self.game_seconds += record["seconds"]
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def games_per_second_per_core(self) -> float:
+        """Games per second of time spent inside games, i.e. what one core sustains."""
+        return self.games / self.game_seconds if self.game_seconds > 0 else 0.0
+
+    def __repr__(self):
+        return (
+            f"SelfPlayStats(games={self.games}, workers={self.workers}, wins={self.wins}, "
+            f"games/s={self.games_per_second:.2f}, games/s per core={self.games_per_second_per_core:.2f})"
+        )
+
+
+# Agents built once per worker process by `_init_worker`
+_worker_agents = None
+
+
+def _init_worker(agent_factories):
+    global _worker_agents
+    _worker_agents = [factory() for factory in agent_factories]
+
+
+def _play_task(task):
+    """Play game `index`, swapping which agent moves first on odd games if asked."""
+    index, seed, alternate_colors, opening_plies, max_plies = task
+    swapped = alternate_colors and index % 2 == 1
+    agents = _worker_agents[::-1] if swapped else _worker_agents
+    record = play_game(agents, seed, opening_plies, max_plies)
+    record["game"] = index
+    record["player1_agent"] = 1 if swapped else 0
+    return record
+
+
+def run_self_play(agent_factories, games, output_path, workers=None, seed=0, alternate_colors=True,
+                  opening_plies=0, max_plies=400, progress=None) -> SelfPlayStats:
+    """
+    Play `games` games between the agents built by the two `agent_factories`
+    and append one JSON record per game to `output_path` as each one finishes,
+    so memory use does not grow with the number of games.
+
+    Factories are called once in every worker process, so they must be
+    picklable (a class or a `functools.partial` of one) and the agents they
+    build must not start process pools of their own. Game `i` uses seed
+    `seed + i`; records come out in completion order and carry their index.
+    `progress`, if given, is called with the stats after every game.
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = SelfPlayStats(workers)
+    tasks = ((index, seed + index, alternate_colors, opening_plies, max_plies) for index in range(games))
+    start_time = time.perf_counter()
+
+    with open(output_path, "a") as output:
+        if workers == 1:
+            _init_worker(agent_factories)
+            results = map(_play_task, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(agent_factories,))
+            results = pool.imap_unordered(_play_task, tasks, chunksize=4)
+        try:
+            for record in results:
+                output.write(json.dumps(record, separators=(",", ":")) + "\n")
+                output.flush()
+                stats.add(record)
+                stats.elapsed_seconds = time.perf_counter() - start_time
+                if progress is not None:
+                    progress(stats)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    stats.elapsed_seconds = time.perf_counter() - start_time
+    return stats
+
+
+class AgentFactory:
+    """Picklable factory for an agent class named in `AGENT_CLASSES`."""
+
+    def __init__(self, name, **kwargs):
+        if name not in AGENT_CLASSES:
+            raise ValueError(f"Unknown agent {name!r}, expected one of {sorted(AGENT_CLASSES)}")
+        self.name = name
+        self.kwargs = kwargs
+
+    def __call__(self):
+        return AGENT_CLASSES[self.name](**self.kwargs)
+
+    @classmethod
+    def parse(cls, spec):
+        """Build a factory from a "name:key=value,key=value" command-line spec."""
+        name, _, options = spec.partition(":")
+        kwargs = {}
+        for option in filter(None, options.split(",")):
+            key, _, value = option.partition("=")
+            try:
+                kwargs[key] = json.loads(value)
+            except json.JSONDecodeError:
+                kwargs[key] = value
+        return cls(name, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Quoridor games between two agents.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="self_play.jsonl")
+    parser.add_argument("--agent", action="append", default=[],
+                        help='Agent spec such as "alphabeta:time_budget_ms=50"; give two (default: two alphabeta)')
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--opening-plies", type=int, default=2)
+    parser.add_argument("--max-plies", type=int, default=400)
+    args = parser.parse_args(argv)
+
+    specs = args.agent or ["alphabeta:time_budget_ms=20,max_depth=2"]
+    if len(specs) == 1:
+        specs = specs * 2
+    if len(specs) != 2:
+        parser.error("Give one or two --agent specs")
+    factories = [AgentFactory.parse(spec) for spec in specs]
+
+    stats = run_self_play(
+        factories, args.games, args.output, workers=args.workers, seed=args.seed,
+        opening_plies=args.opening_plies, max_plies=args.max_plies,
+    )
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Binary encodings of positions and game records.
+
+Position (21 bytes, little-endian):
+    pawn 1 cell (u8), pawn 2 cell (u8),
+    horizontal wall mask (u64), vertical wall mask (u64), bit row * 8 + col per anchor,
+    player 1 walls remaining (u8), player 2 walls remaining (u8),
+    status (u8): side to move in bits 0-1, `GameState` index in bits 2-3.
+
+Game record:
+    kind (u8): RECORD_FROM_START, or RECORD_FROM_POSITION followed by a position,
+    move count (varint), then one byte per move code (codes stop at 208).
+
+Record stream:
+    STREAM_MAGIC, then per record its length (varint) and the record bytes.
+"""
+import struct
+
+from quoridor.src import zobrist
+from quoridor.src.board import Board
+from quoridor.src.game import Game, GameSnapshot, GameState
+from quoridor.src.utils.helpers import (
+    BOARD_WIDTH, POSITIONS, WALL_GRID_WIDTH, decode_move, encode_move, iter_wall_anchors,
+)
+from quoridor.src.utils.types import WallOrientation
+
+POSITION_FORMAT = struct.Struct("<BBQQBBB")
+POSITION_SIZE = POSITION_FORMAT.size
+
+RECORD_FROM_START = 0
+RECORD_FROM_POSITION = 1
+
+STREAM_MAGIC = b"QGR\x01"
+
+GAME_STATES = list(GameState)
+
+
+def encode_varint(value) -> bytes:
+    """Encode a non-negative integer in 7-bit groups, low group first."""
+    if value < 0:
+        raise ValueError("Varints must not be negative")
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data, offset=0):
+    """Decode a varint at `offset`; returns (value, offset just past it)."""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_position(game) -> bytes:
+    """Encode a game's current position (not its history) in `POSITION_SIZE` bytes."""
+    board = game.board
+    pawn1, pawn2 = board.pawn1.position, board.pawn2.position
+    status = game.current_player_id | GAME_STATES.index(game.game_state) << 2
+    return POSITION_FORMAT.pack(
+        pawn1.row * BOARD_WIDTH + pawn1.col,
+        pawn2.row * BOARD_WIDTH + pawn2.col,
+        board.placed_walls[WallOrientation.HORIZONTAL],
+        board.placed_walls[WallOrientation.VERTICAL],
+        game.walls_remaining[1],
+        game.walls_remaining[2],
+        status,
+    )
+
+
+def decode_position(data, offset=0, board_class=Board) -> Game:
+    """Build a game, with no move history, from a position encoded at `offset`."""
+    if len(data) - offset < POSITION_SIZE:
+        raise ValueError("Truncated position")
+    cell1, cell2, horizontal, vertical, walls1, walls2, status = POSITION_FORMAT.unpack_from(data, offset)
+
+    # Pawns don't affect walls or distances, so place the walls on a fresh board
+    # and swap the pawn cells into its snapshot
+    board = board_class()
+    for orientation, mask in ((WallOrientation.HORIZONTAL, horizontal), (WallOrientation.VERTICAL, vertical)):
+        for anchor in iter_wall_anchors(mask):
+            row, col = divmod(anchor, WALL_GRID_WIDTH)
+            board.place_wall(orientation, POSITIONS[row * BOARD_WIDTH + col])
+    board_snapshot = board.snapshot()._replace(pawn_cells=(cell1, cell2))
+
+    snapshot = GameSnapshot(
+        board_snapshot, status & 0b11, (walls1, walls2), GAME_STATES[status >> 2], False, 0, (),
+    )
+    game = Game.from_snapshot(snapshot, board_class)
+    game.hash_key = zobrist.compute_hash(game)
+    return game
+
+
+# The starting position; its hash tells which records begin there
+INITIAL_SNAPSHOT = Game().snapshot()
+
+
+def encode_game(game) -> bytes:
+    """
+    Encode a game record: the moves played, and the position they started from
+    if that was not the initial one.
+    """
+    moves = bytes(encode_move(move) for move in game.get_move_history())
+    start_hash_key = game.undo_stack[0][4] if game.undo_stack else game.hash_key
+    if start_hash_key == INITIAL_SNAPSHOT.hash_key:
+        header = bytes((RECORD_FROM_START,))
+    else:
+        start = game.clone()
+        while start.undo():
+            pass
+        header = bytes((RECORD_FROM_POSITION,)) + encode_position(start)
+    return header + encode_varint(len(moves)) + moves
+
+
+def decode_moves(data):
+    """
+    Split a game record without replaying it: returns the encoded start
+    position (None for the initial position) and the move codes.
+    """
+    if not data:
+        raise ValueError("Empty game record")
+    kind = data[0]
+    if kind == RECORD_FROM_START:
+        start, offset = None, 1
+    elif kind == RECORD_FROM_POSITION:
+        start, offset = bytes(data[1:1 + POSITION_SIZE]), 1 + POSITION_SIZE
+    else:
+        raise ValueError(f"Unknown game record kind {kind}")
+
+    count, offset = decode_varint(data, offset)
+    if len(data) - offset != count:
+        raise ValueError("Game record length does not match its move count")
+    return start, bytes(data[offset:])
+
+
+def decode_game(data, board_class=Board) -> Game:
+    """Rebuild a game, history included, by replaying a game record."""
+    start, codes = decode_moves(data)
+    if start is None:
+        game = Game.from_snapshot(INITIAL_SNAPSHOT, board_class)
+    else:
+        game = decode_position(start, 0, board_class)
+    for code in codes:
+        if not game.apply(decode_move(code)):
+            raise ValueError(f"Illegal move in game record: {decode_move(code)!r}")
+    return game
+
+
+class RecordWriter:
+    """Append length-prefixed game records to a binary stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+        if stream.tell() == 0:
+            stream.write(STREAM_MAGIC)
+
+    def write(self, game):
+        self.write_record(encode_game(game))
+
+    def write_record(self, record: bytes):
+        self.stream.write(encode_varint(len(record)))
+        self.stream.write(record)
+        self.count += 1
+
+
+class RecordReader:
+    """Iterate over the game records of a binary stream written by `RecordWriter`."""
+
+    def __init__(self, stream, chunk_size=1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        if stream.read(len(STREAM_MAGIC)) != STREAM_MAGIC:
+            raise ValueError("Not a game record stream")
+
+    def __iter__(self):
+        """Yield each record's bytes, reading the stream in chunks."""
+        buffer = b""
+        offset = 0
+        while True:
+            try:
+                length, start = decode_varint(buffer, offset)
+            except ValueError:
+                start = None
+            if start is not None and len(buffer) - start >= length:
+                yield buffer[start:start + length]
+                offset = start + length
+                continue
+
+            chunk = self.stream.read(self.chunk_size)
+            if not chunk:
+                if offset != len(buffer):
+                    raise ValueError("Truncated record at the end of the stream")
+                return
+            buffer = buffer[offset:] + chunk
+            offset = 0
+
+    def games(self, board_class=Board):
+        """Yield each record decoded into a `Game`."""
+        for record in self:
+            yield decode_game(record, board_class)
@@ -0,0 +1,394 @@
+"""
+Headless game server: many concurrent games over a JSON-lines protocol.
+
+Clients connect over TCP or a Unix socket and send one JSON object per line;
+each gets one JSON object back, carrying the request's "id" if it had one.
+Moves are move codes (see `encode_move`).
+
+    {"op": "new_game", "opponent": "alphabeta:time_budget_ms=200", "ai_player": 2,
+     "clock_ms": 300000, "increment_ms": 2000}
+        -> {"ok": true, "game": {...}}; without "opponent" the client plays both sides
+    {"op": "move", "game_id": 1, "move": 13}   -> {"ok": true, "game": {...}, "played": [13, 67]}
+    {"op": "state", "game_id": 1}              -> {"ok": true, "game": {...}}
+    {"op": "legal_moves", "game_id": 1}        -> {"ok": true, "moves": [...]}
+    {"op": "resign", "game_id": 1}             -> {"ok": true, "game": {...}}
+    {"op": "close", "game_id": 1}              -> {"ok": true}
+    errors                                     -> {"ok": false, "error": "..."}
+
+Every game has a clock per player, charged from the moment a turn starts to
+the moment its move arrives; running out loses the game. AI turns run in a
+process pool, so a long search never stalls the event loop or other games.
+A game belongs to the connection that created it: other connections can't
+see it, and it is dropped when that connection closes. Clients choose an AI
+opponent's strength only through `OPPONENT_OPTIONS`, and the AI never
+searches longer than its clock allows.
+
+    python -m quoridor.src.server --port 8765
+    python -m quoridor.src.server --unix /tmp/quoridor.sock --workers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from quoridor.src.game import Game
+from quoridor.src.self_play import AgentFactory
+from quoridor.src.utils.helpers import MOVE_CODE_COUNT, cell_index, decode_move, encode_move
+
+DEFAULT_CLOCK_MS = 10 * 60 * 1000
+
+# Opponent options a client may set, with their (min, max) values. Anything
+# else (transposition table size, worker processes, ...) stays server-side.
+MAX_AI_TIME_MS = 10000
+OPPONENT_OPTIONS = {
+    "alphabeta": {"time_budget_ms": (1, MAX_AI_TIME_MS), "max_depth": (1, 64)},
+    "mcts": {"time_budget_ms": (1, MAX_AI_TIME_MS), "iterations": (1, 100000)},
+}
+# Time kept back from the AI's remaining clock when capping its search
+AI_CLOCK_MARGIN_MS = 20
+# Agents kept per executor thread or process
+AGENT_CACHE_SIZE = 8
+
+
+class ProtocolError(Exception):
+    """A request the server refuses; its message is sent back to the client."""
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _non_negative_int(request, field, default) -> int:
+    value = request.get(field, default)
+    if not _is_int(value) or value < 0:
+        raise ProtocolError(f"{field} must be a non-negative integer")
+    return value
+
+
+def parse_opponent(spec) -> AgentFactory:
+    """Build the factory for an opponent spec, allowing only `OPPONENT_OPTIONS` within their limits."""
+    if not isinstance(spec, str):
+        raise ProtocolError("opponent must be an agent spec string")
+    try:
+        factory = AgentFactory.parse(spec)
+    except ValueError as error:
+        raise ProtocolError(str(error)) from None
+    allowed = OPPONENT_OPTIONS.get(factory.name, {})
+    for key, value in factory.kwargs.items():
+        if key not in allowed:
+            raise ProtocolError(f"Option {key!r} is not allowed for {factory.name} opponents")
+        low, high = allowed[key]
+        if not _is_int(value) or not low <= value <= high:
+            raise ProtocolError(f"{key} must be an integer from {low} to {high}")
+    try:
+        factory()
+    except (TypeError, ValueError) as error:
+        raise ProtocolError(f"Invalid opponent {spec!r}: {error}") from None
+    return factory
+
+
+# Agents built by `_select_move`, per executor thread (so no two games share
+# one at the same time), least recently used first
+_worker_agents = threading.local()
+
+
+def _select_move(factory, snapshot, time_budget_ms) -> int:
+    """Executor task: pick a move for a game snapshot, searching at most `time_budget_ms`."""
+    agents = getattr(_worker_agents, "agents", None)
+    if agents is None:
+        agents = _worker_agents.agents = OrderedDict()
+    key = (factory.name, tuple(sorted(factory.kwargs.items())))
+    entry = agents.pop(key, None)
+    if entry is None:
+        agent = factory()
+        entry = (agent, agent.time_budget_ms)
+    agents[key] = entry
+    while len(agents) > AGENT_CACHE_SIZE:
+        agents.popitem(last=False)
+    agent, configured_budget_ms = entry
+    agent.time_budget_ms = min(time_budget_ms, configured_budget_ms or time_budget_ms)
+    return encode_move(agent.select_move(Game.from_snapshot(snapshot)))
+
+
+class GameSession:
+    """One hosted game: the position, both clocks and, optionally, an AI opponent."""
+
+    def __init__(self, game_id, clock_ms, increment_ms, agent_factory, ai_player, now):
+        self.game_id = game_id
+        self.game = Game()
+        self.clocks_ms = {1: clock_ms, 2: clock_ms}
+        self.increment_ms = increment_ms
+        self.agent_factory = agent_factory
+        self.ai_player = ai_player if agent_factory else None
+        self.turn_started = now
+        self.result = None  # How the game ended: "goal", "time" or "resign"
+        self.winner = None
+        self.lock = asyncio.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.result is not None
+
+    def remaining_ms(self, now) -> float:
+        """Time left on the clock of the side to move."""
+        return self.clocks_ms[self.game.current_player_id] - (now - self.turn_started) * 1000
+
+    def check_clock(self, now):
+        """End the game if the side to move has run out of time."""
+        if self.finished:
+            return
+        player_id = self.game.current_player_id
+        if self.remaining_ms(now) <= 0:
+            self.clocks_ms[player_id] = 0
+            self._finish("time", 3 - player_id)
+
+    def play(self, code, now):
+        """Play a move code for the side to move, charging its clock."""
+        self.check_clock(now)
+        if self.finished:
+            raise ProtocolError("Game is over")
+        if not 0 <= code < MOVE_CODE_COUNT:
+            raise ProtocolError(f"Invalid move code {code}")
+        player_id = self.game.current_player_id
+        if not self.game.apply(decode_move(code)):
+            raise ProtocolError(f"Illegal move {code}")
+        self.clocks_ms[player_id] += self.increment_ms - (now - self.turn_started) * 1000
+        self.turn_started = now
+        if self.game.is_game_over():
+            self._finish("goal", self.game.get_winner())
+
+    def resign(self, player_id):
+        if self.finished:
+            raise ProtocolError("Game is over")
+        self._finish("resign", 3 - player_id)
+
+    def _finish(self, result, winner):
+        self.result = result
+        self.winner = winner
+
+    def state(self, now) -> dict:
+        self.check_clock(now)
+        game = self.game
+        board = game.board
+        clocks = dict(self.clocks_ms)
+        if not self.finished:
+            clocks[game.current_player_id] -= (now - self.turn_started) * 1000
+        return {
+            "game_id": self.game_id,
+            "to_move": game.current_player_id,
+            "pawns": [cell_index(board.pawn1.position), cell_index(board.pawn2.position)],
+            "walls_remaining": [game.walls_remaining[1], game.walls_remaining[2]],
+            "moves": [encode_move(move) for move in game.get_move_history()],
+            "clocks_ms": [max(0, round(clocks[1])), max(0, round(clocks[2]))],
+            "status": "ongoing" if not self.finished else self.result,
+            "winner": self.winner,
+            "ai_player": self.ai_player,
+        }
+
+
+class GameServer:
+    """
+    Hosts games for any number of connections. `executor` runs AI turns
+    (a process pool of `workers` processes by default).
+    """
+
+    def __init__(self, executor=None, workers=None, max_games=100000, default_clock_ms=DEFAULT_CLOCK_MS):
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(workers or os.cpu_count() or 1)
+        self.max_games = max_games
+        self.default_clock_ms = default_clock_ms
+        self.sessions = {}
+        self._starting_games = 0  # Games counted against `max_games` while the AI makes their opening move
+        self._next_game_id = 1
+        self.requests = 0
+        self._servers = []
+
+    def _now(self):
+        return asyncio.get_running_loop().time()
+
+    def _session(self, request, owned) -> GameSession:
+        """The requested game; only the connection that created a game can see it."""
+        game_id = request.get("game_id")
+        session = self.sessions.get(game_id) if _is_int(game_id) and game_id in owned else None
+        if session is None:
+            raise ProtocolError(f"Unknown game {game_id!r}")
+        return session
+
+    async def handle_request(self, request: dict, owned: set) -> dict:
+        """
+        Serve one decoded request and return the response (without its "id").
+        `owned` is the set of game ids of the requesting connection: games it
+        creates are added and games it closes removed.
+        """
+        self.requests += 1
+        op = request.get("op")
+        handler = getattr(self, f"_op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            raise ProtocolError(f"Unknown op {op!r}")
+        return await handler(request, owned)
+
+    async def _op_new_game(self, request, owned):
+        if len(self.sessions) + self._starting_games >= self.max_games:
+            raise ProtocolError("Server is full")
+        agent_spec = request.get("opponent")
+        agent_factory = parse_opponent(agent_spec) if agent_spec is not None else None
+        ai_player = request.get("ai_player", 2)
+        if ai_player not in (1, 2):
+            raise ProtocolError("ai_player must be 1 or 2")
+        clock_ms = _non_negative_int(request, "clock_ms", self.default_clock_ms)
+        increment_ms = _non_negative_int(request, "increment_ms", 0)
+        session = GameSession(self._next_game_id, clock_ms, increment_ms, agent_factory, ai_player, self._now())
+        self._next_game_id += 1
+        self._starting_games += 1
+        try:
+            played = await self._play_ai_turns(session)
+        finally:
+            self._starting_games -= 1
+        # Registered only once the AI's opening move is in, so a failed request leaves no game behind
+        self.sessions[session.game_id] = session
+        owned.add(session.game_id)
+        return {"game": session.state(self._now()), "played": played}
+
+    async def _op_move(self, request, owned):
+        session = self._session(request, owned)
+        move = request.get("move")
+        if not _is_int(move):
+            raise ProtocolError("move must be a move code")
+        if session.lock.locked() or session.game.current_player_id == session.ai_player:
+            raise ProtocolError("Not your turn")
+        async with session.lock:
+            session.play(move, self._now())
+            played = [move] + await self._play_ai_turns(session)
+        return {"game": session.state(self._now()), "played": played}
+
+    async def _play_ai_turns(self, session):
+        """
+        Let the AI move while it is its turn; returns the codes it played. Its
+        search is capped to its remaining clock, less `AI_CLOCK_MARGIN_MS`.
+        """
+        played = []
+        loop = asyncio.get_running_loop()
+        while not session.finished and session.game.current_player_id == session.ai_player:
+            session.check_clock(self._now())
+            if session.finished:
+                break
+            time_budget_ms = max(1, int(session.remaining_ms(self._now())) - AI_CLOCK_MARGIN_MS)
+            code = await loop.run_in_executor(
+                self.executor, _select_move, session.agent_factory, session.game.snapshot(), time_budget_ms,
+            )
+            session.check_clock(self._now())
+            if session.finished:  # The AI ran out of time thinking
+                break
+            session.play(code, self._now())
+            played.append(code)
+        return played
+
+    async def _op_state(self, request, owned):
+        return {"game": self._session(request, owned).state(self._now())}
+
+    async def _op_legal_moves(self, request, owned):
+        session = self._session(request, owned)
+        moves = [] if session.finished else [encode_move(move) for move in session.game.get_legal_moves()]
+        return {"moves": moves}
+
+    async def _op_resign(self, request, owned):
+        session = self._session(request, owned)
+        player_id = session.game.current_player_id if session.ai_player is None else 3 - session.ai_player
+        session.resign(player_id)
+        return {"game": session.state(self._now())}
+
+    async def _op_close(self, request, owned):
+        game_id = self._session(request, owned).game_id
+        del self.sessions[game_id]
+        owned.discard(game_id)
+        return {}
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve JSON-lines requests from one client until it disconnects; the
+        games it created and didn't close are dropped then.
+        """
+        owned = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._respond(line, owned)
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in owned:
+                self.sessions.pop(game_id, None)
+            writer.close()
+
+    async def _respond(self, line, owned) -> dict:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            return {"ok": False, "error": "Invalid JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Requests must be JSON objects"}
+        response = {"id": request["id"]} if "id" in request else {}
+        try:
+            response.update(await self.handle_request(request, owned))
+            response["ok"] = True
+        except ProtocolError as error:
+            response.update(ok=False, error=str(error))
+        except Exception as error:  # A failed request must not take the connection down with it
+            response.update(ok=False, error=f"Internal error: {type(error).__name__}: {error}")
+        return response
+
+    async def start_tcp(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=1 << 20)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path):
+        server = await asyncio.start_unix_server(self.handle_connection, path, limit=1 << 20)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if self._own_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+
+async def _serve(args):
+    server = GameServer(workers=args.workers, max_games=args.max_games)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+    print(f"Serving on {', '.join(str(socket.getsockname()) for socket in listener.sockets)}")
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host Quoridor games over a JSON-lines socket protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="AI worker processes")
+    parser.add_argument("--max-games", type=int, default=100000)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
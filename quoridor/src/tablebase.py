@@ -0,0 +1,172 @@
+"""
+Endgame tablebase for positions where neither player has walls left.
+
+With the walls fixed the game is a pawn race over 81 x 81 pawn cells and two
+sides to move. `solve_layout` settles every such state by retrograde
+analysis: states one move from the goal row are wins, and results are
+propagated backwards one ply at a time. States neither side can force are
+draws: both pawns shuffle forever, or the side to move is boxed in by walls
+and the other pawn and the game cannot go on.
+"""
+from collections import OrderedDict, deque
+
+from quoridor.src.utils.helpers import (
+    BOARD_WIDTH, CELL_COUNT, GOAL_ROWS, POSITIONS, cell_index, pawn_move_cells,
+)
+from quoridor.src.utils.types import Move, WallOrientation
+
+# Results, from the point of view of the side to move
+DRAW, WIN, LOSS = 0, 1, 2
+
+_STATE_COUNT = 2 * CELL_COUNT * CELL_COUNT
+
+
+def _state(side_index, own_cell, other_cell):
+    """State index; `side_index` is 0 when player 1 is to move."""
+    return (side_index * CELL_COUNT + own_cell) * CELL_COUNT + other_cell
+
+
+def _is_goal(player_id, cell):
+    return cell // BOARD_WIDTH == GOAL_ROWS[player_id]
+
+
+class EndgameTable:
+    """Result and distance (in plies, to the end of the game) of every pawn state of one wall layout."""
+
+    def __init__(self, open_edges, results, distances):
+        self.open_edges = open_edges
+        self.results = results
+        self.distances = distances
+
+    def probe(self, player_id, pawn_cells):
+        """
+        Return (result, distance) for `player_id` to move, with `pawn_cells`
+        indexed by player id minus one.
+        """
+        own_cell, other_cell = pawn_cells[player_id - 1], pawn_cells[2 - player_id]
+        state = _state(player_id - 1, own_cell, other_cell)
+        return self.results[state], self.distances[state]
+
+    def best_move_cell(self, player_id, pawn_cells):
+        """
+        The cell the side to move should step to: the fastest win, the
+        slowest loss, or a move that keeps a draw. None if it has no move.
+        """
+        own_cell, other_cell = pawn_cells[player_id - 1], pawn_cells[2 - player_id]
+        result, _ = self.probe(player_id, pawn_cells)
+        opponent_index = 2 - player_id
+        best_cell, best_key = None, None
+        for cell in pawn_move_cells(self.open_edges, own_cell, other_cell):
+            if _is_goal(player_id, cell):
+                return cell
+            state = _state(opponent_index, other_cell, cell)
+            reply_result, reply_distance = self.results[state], self.distances[state]
+            if result == WIN and reply_result == LOSS:
+                key = -reply_distance
+            elif result == LOSS and reply_result == WIN:
+                key = reply_distance
+            elif result == DRAW and reply_result == DRAW:
+                key = 0
+            else:
+                continue
+            if best_key is None or key > best_key:
+                best_cell, best_key = cell, key
+        return best_cell
+
+
+def solve_layout(open_edges) -> EndgameTable:
+    """Solve every pawn state over a fixed open-edges table by retrograde analysis."""
+    open_edges = list(open_edges)
+    results = bytearray(_STATE_COUNT)
+    distances = [0] * _STATE_COUNT
+    remaining = [0] * _STATE_COUNT
+    predecessors = [[] for _ in range(_STATE_COUNT)]
+    queue = deque()
+
+    for side_index, player_id in enumerate((1, 2)):
+        opponent_id = 3 - player_id
+        for own_cell in range(CELL_COUNT):
+            if _is_goal(player_id, own_cell):
+                continue  # The side to move already won last turn
+            for other_cell in range(CELL_COUNT):
+                if other_cell == own_cell or _is_goal(opponent_id, other_cell):
+                    continue
+                state = _state(side_index, own_cell, other_cell)
+                moves = pawn_move_cells(open_edges, own_cell, other_cell)
+                if any(_is_goal(player_id, cell) for cell in moves):
+                    results[state] = WIN
+                    distances[state] = 1
+                    queue.append(state)
+                    continue
+                remaining[state] = len(moves)
+                for cell in moves:
+                    predecessors[_state(1 - side_index, other_cell, cell)].append(state)
+
+    while queue:
+        state = queue.popleft()
+        distance = distances[state] + 1
+        if results[state] == LOSS:
+            for previous in predecessors[state]:
+                if not results[previous]:
+                    results[previous] = WIN
+                    distances[previous] = distance
+                    queue.append(previous)
+        else:
+            for previous in predecessors[state]:
+                if not results[previous]:
+                    remaining[previous] -= 1
+                    if not remaining[previous]:
+                        results[previous] = LOSS
+                        distances[previous] = distance
+                        queue.append(previous)
+
+    return EndgameTable(open_edges, results, distances)
+
+
+class EndgameTablebase:
+    """
+    Solves wall layouts on demand and keeps the `max_layouts` most recently
+    used tables, keyed by the placed wall masks.
+    """
+
+    def __init__(self, max_layouts=64):
+        self.max_layouts = max_layouts
+        self._tables = OrderedDict()
+        self.hits = 0
+        self.solves = 0
+
+    def covers(self, game) -> bool:
+        """Check if the game is an ongoing position with no walls left on either side."""
+        return not game.is_game_over() and not game.walls_remaining[1] and not game.walls_remaining[2]
+
+    def table(self, board) -> EndgameTable:
+        """The solved table of a board's wall layout, solving it if needed."""
+        key = (board.placed_walls[WallOrientation.HORIZONTAL], board.placed_walls[WallOrientation.VERTICAL])
+        table = self._tables.get(key)
+        if table is not None:
+            self._tables.move_to_end(key)
+            self.hits += 1
+            return table
+        table = solve_layout(board.open_edges)
+        self.solves += 1
+        self._tables[key] = table
+        if len(self._tables) > self.max_layouts:
+            self._tables.popitem(last=False)
+        return table
+
+    def probe(self, game):
+        """Return (result, distance) for the side to move, or None if the position isn't covered."""
+        if not self.covers(game):
+            return None
+        board = game.board
+        pawn_cells = (cell_index(board.pawn1.position), cell_index(board.pawn2.position))
+        return self.table(board).probe(game.current_player_id, pawn_cells)
+
+    def best_move(self, game):
+        """The perfect move for the side to move, or None if the position isn't covered."""
+        if not self.covers(game):
+            return None
+        board = game.board
+        pawn_cells = (cell_index(board.pawn1.position), cell_index(board.pawn2.position))
+        cell = self.table(board).best_move_cell(game.current_player_id, pawn_cells)
+        return None if cell is None else Move.pawn(POSITIONS[cell])
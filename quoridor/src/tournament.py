@@ -0,0 +1,438 @@
+"""
+Tournaments between agents: round robin or gauntlet over a process pool,
+with Elo estimates, SPRT early stopping and a resumable checkpoint.
+
+Every pairing plays games in pairs from the same seeded opening, once with
+each agent moving first. With an SPRT, a pairing stops getting new games as
+soon as the test decides, so CPU goes to the pairings still undecided.
+Finished games are appended to the checkpoint file as they come in; running
+again with the same file skips them and carries on.
+
+    python -m quoridor.src.tournament --games 200 --workers 8 --checkpoint run.jsonl \
+        --agent ab2=alphabeta:max_depth=2 --agent ab3=alphabeta:max_depth=3 \
+        --agent mcts=mcts:iterations=400 --sprt 0,30
+"""
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+
+from quoridor.src.self_play import AgentFactory, play_game
+
+CHECKPOINT_VERSION = 1
+
+
+def score_from_elo(elo) -> float:
+    """Expected score of a player `elo` points stronger than its opponent."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def elo_from_score(score) -> float:
+    """Elo difference that gives an expected `score`; infinite for a perfect score."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def round_robin(names) -> list[tuple]:
+    """Every pair of `names` once."""
+    return [(first, second) for index, first in enumerate(names) for second in names[index + 1:]]
+
+
+def gauntlet(challenger, names) -> list[tuple]:
+    """`challenger` against every other name."""
+    return [(challenger, name) for name in names if name != challenger]
+
+
+class SPRT:
+    """
+    Sequential probability ratio test of H0: elo = `elo0` against H1: elo =
+    `elo1`, with false positive rate `alpha` and false negative rate `beta`.
+    Uses the normal approximation of the log-likelihood ratio on the mean
+    and variance of the game scores.
+    """
+
+    def __init__(self, elo0=0.0, elo1=20.0, alpha=0.05, beta=0.05):
+        if elo0 >= elo1:
+            raise ValueError("elo0 must be below elo1")
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+        self.lower_bound = math.log(beta / (1 - alpha))
+        self.upper_bound = math.log((1 - beta) / alpha)
+
+    def llr(self, wins, draws, losses) -> float:
+        """
+        Log-likelihood ratio of the results. One virtual win and one virtual
+        loss are added, so a short streak can't end a match on its own.
+        """
+        wins, losses = wins + 1, losses + 1
+        games = wins + draws + losses
+        score = (wins + draws / 2) / games
+        variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+        score0, score1 = score_from_elo(self.elo0), score_from_elo(self.elo1)
+        return games * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance)
+
+    def decide(self, wins, draws, losses):
+        """Return "H1" or "H0" once the test accepts one, else None."""
+        llr = self.llr(wins, draws, losses)
+        if llr >= self.upper_bound:
+            return "H1"
+        if llr <= self.lower_bound:
+            return "H0"
+        return None
+
+    def to_dict(self) -> dict:
+        return {"elo0": self.elo0, "elo1": self.elo1, "alpha": self.alpha, "beta": self.beta}
+
+
+class MatchStats:
+    """Results of one pairing, from the point of view of its `first` agent."""
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.decision = None  # SPRT verdict, once reached
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def add(self, score):
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def elo(self) -> float:
+        return elo_from_score(self.score)
+
+    def elo_interval(self, confidence=0.95) -> tuple:
+        """
+        (low, high) bounds of the Elo difference at `confidence`, from the
+        Wilson interval of the score. Draws are counted as half a win, which
+        overstates the variance, so the interval is slightly conservative. It
+        stays meaningful after a clean sweep, when only the upper bound is infinite.
+        """
+        if not self.games:
+            return -math.inf, math.inf
+        games, score = self.games, self.score
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        denominator = 1 + z * z / games
+        center = (score + z * z / (2 * games)) / denominator
+        margin = z * math.sqrt(score * (1 - score) / games + z * z / (4 * games * games)) / denominator
+        return elo_from_score(center - margin), elo_from_score(center + margin)
+
+    def to_dict(self, confidence=0.95) -> dict:
+        low, high = self.elo_interval(confidence)
+        return {
+            "first": self.first, "second": self.second, "games": self.games,
+            "wins": self.wins, "draws": self.draws, "losses": self.losses,
+            "elo": self.elo(), "elo_low": low, "elo_high": high, "sprt": self.decision,
+        }
+
+
+def fit_ratings(matches, confidence=0.95, iterations=1000) -> dict:
+    """
+    Fit one Elo rating per agent to all `matches` (Bradley-Terry, draws
+    counting half a win each way) and return {name: (elo, margin)}, ratings
+    averaging zero. Every pairing counts one virtual draw, so an unbeaten
+    agent still gets a finite rating. The margin treats the other ratings as
+    exact, so it is a little narrow.
+    """
+    names = sorted({name for match in matches for name in (match.first, match.second)})
+    points = {name: 0.0 for name in names}
+    games = {}
+    for match in matches:
+        points[match.first] += match.wins + match.draws / 2 + 0.5
+        points[match.second] += match.losses + match.draws / 2 + 0.5
+        for first, second in ((match.first, match.second), (match.second, match.first)):
+            games[first, second] = games.get((first, second), 0) + match.games + 1
+    strengths = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        updated = {
+            name: points[name] / sum(
+                count / (strengths[name] + strengths[other])
+                for (first, other), count in games.items() if first == name
+            )
+            for name in names
+        }
+        scale = math.exp(sum(math.log(strength) for strength in updated.values()) / len(names))
+        updated = {name: strength / scale for name, strength in updated.items()}
+        converged = all(abs(updated[name] - strengths[name]) < 1e-10 * strengths[name] for name in names)
+        strengths = updated
+        if converged:
+            break
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    ratings = {}
+    for name in names:
+        information = 0.0
+        for (first, other), count in games.items():
+            if first == name:
+                expected = strengths[name] / (strengths[name] + strengths[other])
+                information += count * expected * (1 - expected)
+        margin = z * 400 / math.log(10) / math.sqrt(information) if information else math.inf
+        ratings[name] = (400 * math.log10(strengths[name]), margin)
+    return ratings
+
+
+def _play_task(task):
+    """
+    Play one tournament game; returns (pairing index, game index, score of
+    the pairing's first agent, record). Both agents are built for this game
+    and closed after it, so no search state carries over between games.
+    """
+    pair_index, game_index, first_spec, second_spec, seed, opening_plies, max_plies = task
+    first_moves_first = game_index % 2 == 0
+    agents = [AgentFactory.parse(first_spec)(), AgentFactory.parse(second_spec)()]
+    try:
+        record = play_game(agents if first_moves_first else agents[::-1], seed, opening_plies, max_plies)
+    finally:
+        for agent in agents:
+            close = getattr(agent, "close", None)
+            if close is not None:
+                close()
+    first_player = 1 if first_moves_first else 2
+    if record["winner"] is None:
+        score = 0.5
+    else:
+        score = 1.0 if record["winner"] == first_player else 0.0
+    return pair_index, game_index, score, record
+
+
+class Tournament:
+    """
+    Matches between named agents. `entrants` maps names to agent specs
+    (as `AgentFactory.parse` reads them) and `pairs` lists the (first,
+    second) names to match, e.g. from `round_robin` or `gauntlet`. Each
+    pairing plays up to `games_per_pair` games; game `2k` and `2k + 1` share
+    the opening drawn from seed `seed + k` and swap colors.
+    """
+
+    def __init__(self, entrants, pairs, games_per_pair=100, workers=None, seed=0, opening_plies=2,
+                 max_plies=400, sprt=None, checkpoint_path=None, confidence=0.95):
+        for pair in pairs:
+            for name in pair:
+                if name not in entrants:
+                    raise ValueError(f"Unknown entrant {name!r}")
+        for spec in entrants.values():
+            AgentFactory.parse(spec)
+        self.entrants = dict(entrants)
+        self.pairs = [tuple(pair) for pair in pairs]
+        self.games_per_pair = games_per_pair
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.opening_plies = opening_plies
+        self.max_plies = max_plies
+        self.sprt = sprt
+        self.checkpoint_path = checkpoint_path
+        self.confidence = confidence
+        self.matches = [MatchStats(first, second) for first, second in self.pairs]
+        self.games_played = 0  # Games played by this run, not loaded from the checkpoint
+        self.elapsed_seconds = 0.0
+        self._done = [set() for _ in self.pairs]
+
+    def _config(self) -> dict:
+        """What a checkpoint must agree on to be resumed; the game count and SPRT can change."""
+        return {
+            "version": CHECKPOINT_VERSION,
+            "entrants": self.entrants,
+            "pairs": [list(pair) for pair in self.pairs],
+            "seed": self.seed,
+            "opening_plies": self.opening_plies,
+            "max_plies": self.max_plies,
+        }
+
+    def _load_checkpoint(self):
+        """
+        Replay the games in the checkpoint file, if any, and check it belongs
+        to this tournament. A last line cut short by an interrupted write is
+        dropped from the file, so appending carries on from a clean line.
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+        with open(self.checkpoint_path) as file:
+            text = file.read()
+        raw_lines = text.splitlines()
+        lines = []
+        for index, raw_line in enumerate(raw_lines):
+            if not raw_line.strip():
+                continue
+            try:
+                lines.append(json.loads(raw_line))
+            except json.JSONDecodeError:
+                if index < len(raw_lines) - 1:
+                    raise ValueError(f"Checkpoint {self.checkpoint_path} is corrupt at line {index + 1}") from None
+                raw_lines.pop()
+        clean_text = "".join(raw_line + "\n" for raw_line in raw_lines)
+        if clean_text != text:
+            with open(self.checkpoint_path, "w") as file:
+                file.write(clean_text)
+        if not lines:
+            return
+        if lines[0].get("tournament") != self._config():
+            raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a different tournament")
+        for line in lines[1:]:
+            self._add_result(line["pair"], line["game"], line["score"])
+
+    def _add_result(self, pair_index, game_index, score):
+        if game_index in self._done[pair_index]:
+            return
+        self._done[pair_index].add(game_index)
+        match = self.matches[pair_index]
+        match.add(score)
+        if self.sprt is not None and match.decision is None:
+            match.decision = self.sprt.decide(match.wins, match.draws, match.losses)
+
+    def _tasks(self):
+        """Unplayed games, one round over all pairings at a time, skipping pairings the SPRT decided."""
+        for game_index in range(self.games_per_pair):
+            for pair_index, (first, second) in enumerate(self.pairs):
+                if self.matches[pair_index].decision is not None or game_index in self._done[pair_index]:
+                    continue
+                yield (pair_index, game_index, self.entrants[first], self.entrants[second],
+                       self.seed + game_index // 2, self.opening_plies, self.max_plies)
+
+    def run(self, progress=None) -> "Tournament":
+        """
+        Play the remaining games and return self. At most two games per
+        worker are queued at a time, so an SPRT decision stops its pairing
+        promptly. `progress`, if given, is called after every game.
+        """
+        self._load_checkpoint()
+        start_time = time.perf_counter()
+        output = None
+        if self.checkpoint_path:
+            is_new = not os.path.exists(self.checkpoint_path) or os.path.getsize(self.checkpoint_path) == 0
+            output = open(self.checkpoint_path, "a")
+            if is_new:
+                output.write(json.dumps({"tournament": self._config()}) + "\n")
+        try:
+            if self.workers == 1:
+                for task in self._tasks():
+                    self._finish_game(_play_task(task), output, start_time, progress)
+            else:
+                self._run_pool(output, start_time, progress)
+        finally:
+            if output is not None:
+                output.close()
+        self.elapsed_seconds += time.perf_counter() - start_time
+        return self
+
+    def _run_pool(self, output, start_time, progress):
+        tasks = self._tasks()  # Lazy, so each game is checked against the SPRT just before it is queued
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending = set()
+            while True:
+                for task in tasks:
+                    pending.add(pool.submit(_play_task, task))
+                    if len(pending) >= 2 * self.workers:
+                        break
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._finish_game(future.result(), output, start_time, progress)
+
+    def _finish_game(self, result, output, start_time, progress):
+        pair_index, game_index, score, record = result
+        self._add_result(pair_index, game_index, score)
+        self.games_played += 1
+        if output is not None:
+            line = {"pair": pair_index, "game": game_index, "score": score,
+                    "winner": record["winner"], "length": record["length"], "seconds": record["seconds"]}
+            output.write(json.dumps(line, separators=(",", ":")) + "\n")
+            output.flush()
+        if progress is not None:
+            progress(self, time.perf_counter() - start_time)
+
+    def ratings(self) -> dict:
+        return fit_ratings(self.matches, self.confidence)
+
+    def to_dict(self) -> dict:
+        return {
+            "matches": [match.to_dict(self.confidence) for match in self.matches],
+            "ratings": {name: {"elo": elo, "margin": margin} for name, (elo, margin) in self.ratings().items()},
+            "sprt": self.sprt.to_dict() if self.sprt else None,
+            "games_played": self.games_played,
+            "seconds": round(self.elapsed_seconds, 3),
+        }
+
+    def table(self) -> str:
+        """Ratings, best first, then every pairing with its Elo difference and interval."""
+        percent = f"{self.confidence:.0%}"
+        lines = [f"{'agent':20} {'elo':>8} {percent + ' +/-':>9}"]
+        for name, (elo, margin) in sorted(self.ratings().items(), key=lambda item: -item[1][0]):
+            lines.append(f"{name:20} {elo:8.1f} {margin:9.1f}")
+        lines.append("")
+        lines.append(f"{'pairing':41} {'games':>6} {'+':>5} {'=':>5} {'-':>5} {'elo':>8} {percent + ' interval':>20} sprt")
+        for match in self.matches:
+            low, high = match.elo_interval(self.confidence)
+            lines.append(
+                f"{match.first + ' vs ' + match.second:41} {match.games:6} {match.wins:5} {match.draws:5} "
+                f"{match.losses:5} {match.elo():8.1f} {f'[{low:.1f}, {high:.1f}]':>20} {match.decision or ''}"
+            )
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a tournament between Quoridor agents.")
+    parser.add_argument("--agent", action="append", default=[], required=True,
+                        help='Entrant as "name=spec", e.g. "ab2=alphabeta:max_depth=2"; give two or more')
+    parser.add_argument("--gauntlet", metavar="NAME", help="Match this entrant against each other one only")
+    parser.add_argument("--games", type=int, default=100, help="Games per pairing")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--opening-plies", type=int, default=2)
+    parser.add_argument("--max-plies", type=int, default=400)
+    parser.add_argument("--sprt", metavar="ELO0,ELO1", help="Stop each pairing once an SPRT of these bounds decides")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--checkpoint", help="Append finished games here and resume from it")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    entrants = {}
+    for entry in args.agent:
+        name, separator, spec = entry.partition("=")
+        if not separator:
+            parser.error(f"Expected name=spec, got {entry!r}")
+        entrants[name] = spec
+    if len(entrants) < 2:
+        parser.error("Give at least two --agent entrants")
+    if args.gauntlet:
+        if args.gauntlet not in entrants:
+            parser.error(f"Unknown entrant {args.gauntlet!r}")
+        pairs = gauntlet(args.gauntlet, list(entrants))
+    else:
+        pairs = round_robin(list(entrants))
+    sprt = None
+    if args.sprt:
+        elo0, elo1 = (float(bound) for bound in args.sprt.split(","))
+        sprt = SPRT(elo0, elo1, args.alpha, args.beta)
+
+    tournament = Tournament(
+        entrants, pairs, args.games, workers=args.workers, seed=args.seed, opening_plies=args.opening_plies,
+        max_plies=args.max_plies, sprt=sprt, checkpoint_path=args.checkpoint,
+    )
+    tournament.run()
+    print(json.dumps(tournament.to_dict()) if args.json else tournament.table())
+
+
+if __name__ == "__main__":
+    main()
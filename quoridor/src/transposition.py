@@ -0,0 +1,125 @@
+from array import array
+
+from quoridor.src.utils.helpers import decode_move, encode_move
+
+# Bound types
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Each entry is two unsigned 64-bit words (key and packed data), so the
+# table's size is exactly `ENTRY_BYTES` times its number of entries.
+ENTRY_BYTES = 16
+
+# Packed data layout, low bits first:
+#   32 bits score + SCORE_OFFSET, 8 bits depth, 2 bits bound,
+#    8 bits move code + 1 (0 = no move), 6 bits search generation,
+#    1 bit "entry in use"
+SCORE_OFFSET = 1 << 31
+_SCORE_MASK = (1 << 32) - 1
+_DEPTH_SHIFT = 32
+_BOUND_SHIFT = 40
+_MOVE_SHIFT = 42
+_GENERATION_SHIFT = 50
+_GENERATION_MASK = 0x3F
+_USED = 1 << 63
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results, keyed by `Game.hash_key`.
+
+    Entries live in two-slot buckets. The first slot is depth-preferred: it
+    keeps the deepest result seen for its bucket unless that result comes from
+    an earlier search. The second slot is always replaced, so recent shallow
+    results are still available. The table never grows beyond `memory_mb`.
+
+    Scores are stored as integers in [-2**31, 2**31); `store` truncates a
+    float score to an integer and raises ValueError for one out of range.
+    """
+
+    def __init__(self, memory_mb=16):
+        entries = max(2, int(memory_mb * 1024 * 1024) // ENTRY_BYTES)
+        # Power-of-two bucket count so a bucket index is a mask of the key
+        bucket_count = 1
+        while bucket_count * 4 <= entries:
+            bucket_count *= 2
+        self.bucket_count = bucket_count
+        self._mask = bucket_count - 1
+        self._keys = array("Q", bytes(8 * 2 * bucket_count))
+        self._data = array("Q", bytes(8 * 2 * bucket_count))
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._keys) * self._keys.itemsize + len(self._data) * self._data.itemsize
+
+    def new_search(self):
+        """Mark existing entries as coming from an earlier search, so they are replaced first."""
+        self.generation = (self.generation + 1) & _GENERATION_MASK
+
+    def clear(self):
+        """Drop every entry."""
+        for index in range(len(self._data)):
+            self._keys[index] = 0
+            self._data[index] = 0
+        self.probes = self.hits = self.stores = 0
+
+    def probe(self, key):
+        """
+        Look up a position. Returns (depth, bound, score, best_move) or None if the
+        position is not in the table; best_move may be None.
+        """
+        self.probes += 1
+        slot = (key & self._mask) << 1
+        keys = self._keys
+        if keys[slot] == key:
+            data = self._data[slot]
+        elif keys[slot + 1] == key:
+            data = self._data[slot + 1]
+        else:
+            return None
+        if not data & _USED:
+            return None
+        self.hits += 1
+        move_code = (data >> _MOVE_SHIFT) & 0xFF
+        return (
+            (data >> _DEPTH_SHIFT) & 0xFF,
+            (data >> _BOUND_SHIFT) & 0x3,
+            (data & _SCORE_MASK) - SCORE_OFFSET,
+            decode_move(move_code - 1) if move_code else None,
+        )
+
+    def store(self, key, depth, bound, score, best_move=None):
+        """Record a search result for a position."""
+        score = int(score)
+        if not -SCORE_OFFSET <= score < SCORE_OFFSET:
+            raise ValueError(f"Score {score} does not fit in a table entry")
+        self.stores += 1
+        data = (
+            _USED
+            | (self.generation << _GENERATION_SHIFT)
+            | ((encode_move(best_move) + 1 if best_move is not None else 0) << _MOVE_SHIFT)
+            | (bound << _BOUND_SHIFT)
+            | (min(depth, 0xFF) << _DEPTH_SHIFT)
+            | (score + SCORE_OFFSET)
+        )
+        slot = (key & self._mask) << 1
+        keys = self._keys
+        preferred = self._data[slot]
+        if (
+            keys[slot] == key
+            or not preferred & _USED
+            or depth >= (preferred >> _DEPTH_SHIFT) & 0xFF
+            or (preferred >> _GENERATION_SHIFT) & _GENERATION_MASK != self.generation
+        ):
+            keys[slot] = key
+            self._data[slot] = data
+        else:
+            keys[slot + 1] = key
+            self._data[slot + 1] = data
+
+    def __len__(self):
+        """Number of entries in use."""
+        return sum(1 for data in self._data if data & _USED)
@@ -0,0 +1,244 @@
+from quoridor.src.utils.types import INTERNED_POSITIONS, Move, WallOrientation
+
+# Cell indexing
+#
+# Hot paths address fields by a flat cell index, cell = row * 9 + col, instead
+# of by `Position`. Directions are numbered in `Direction` declaration order
+# and each has one bit in a cell's 4-bit "open edges" mask.
+
+BOARD_WIDTH = 9
+WALL_GRID_WIDTH = BOARD_WIDTH - 1
+CELL_COUNT = BOARD_WIDTH * BOARD_WIDTH
+
+# Goal row of each player's pawn
+GOAL_ROWS = {1: BOARD_WIDTH - 1, 2: 0}
+
+UP, DOWN, LEFT, RIGHT = range(4)
+DIRECTION_BITS = (1, 2, 4, 8)
+DELTAS = (-BOARD_WIDTH, BOARD_WIDTH, -1, 1)
+OPPOSITES = (DOWN, UP, RIGHT, LEFT)
+PERPENDICULARS = ((LEFT, RIGHT), (LEFT, RIGHT), (UP, DOWN), (UP, DOWN))
+ALL_EDGES = 0b1111
+
+# Shared, never mutated Position for every cell, so queries do not allocate.
+POSITIONS = INTERNED_POSITIONS
+
+
+def cell_index(position) -> int:
+    """Return the flat cell index of an on-board position."""
+    return position.row * BOARD_WIDTH + position.col
+
+
+def is_cell_position(position) -> bool:
+    """Check if a position lies on the 9x9 board."""
+    return 0 <= position.row < BOARD_WIDTH and 0 <= position.col < BOARD_WIDTH
+
+
+def initial_open_edges() -> list[int]:
+    """Open-edge masks of an empty board: every edge is open except the board border."""
+    open_edges = []
+    for row in range(BOARD_WIDTH):
+        for col in range(BOARD_WIDTH):
+            mask = ALL_EDGES
+            if row == 0:
+                mask &= ~DIRECTION_BITS[UP]
+            if row == BOARD_WIDTH - 1:
+                mask &= ~DIRECTION_BITS[DOWN]
+            if col == 0:
+                mask &= ~DIRECTION_BITS[LEFT]
+            if col == BOARD_WIDTH - 1:
+                mask &= ~DIRECTION_BITS[RIGHT]
+            open_edges.append(mask)
+    return open_edges
+
+
+def _wall_edge_cuts(orientation, row, col):
+    """List the (cell, direction bit) edges a wall anchored at (row, col) closes."""
+    top_left = row * BOARD_WIDTH + col
+    if orientation == WallOrientation.HORIZONTAL:
+        # Separates rows `row` and `row + 1` in columns `col` and `col + 1`
+        return (
+            (top_left, DIRECTION_BITS[DOWN]),
+            (top_left + 1, DIRECTION_BITS[DOWN]),
+            (top_left + BOARD_WIDTH, DIRECTION_BITS[UP]),
+            (top_left + BOARD_WIDTH + 1, DIRECTION_BITS[UP]),
+        )
+    # Separates columns `col` and `col + 1` in rows `row` and `row + 1`
+    return (
+        (top_left, DIRECTION_BITS[RIGHT]),
+        (top_left + BOARD_WIDTH, DIRECTION_BITS[RIGHT]),
+        (top_left + 1, DIRECTION_BITS[LEFT]),
+        (top_left + BOARD_WIDTH + 1, DIRECTION_BITS[LEFT]),
+    )
+
+
+# WALL_EDGE_CUTS[orientation][row * 8 + col] -> edges closed by that wall
+WALL_EDGE_CUTS = {
+    orientation: tuple(
+        _wall_edge_cuts(orientation, row, col)
+        for row in range(WALL_GRID_WIDTH)
+        for col in range(WALL_GRID_WIDTH)
+    )
+    for orientation in WallOrientation
+}
+
+
+def _wall_bits(row_offsets, col_offsets):
+    """Build, for every anchor, the mask of anchors at the given offsets (clipped to the grid)."""
+    masks = []
+    for row in range(WALL_GRID_WIDTH):
+        for col in range(WALL_GRID_WIDTH):
+            mask = 0
+            for d_row, d_col in zip(row_offsets, col_offsets):
+                r, c = row + d_row, col + d_col
+                if 0 <= r < WALL_GRID_WIDTH and 0 <= c < WALL_GRID_WIDTH:
+                    mask |= 1 << (r * WALL_GRID_WIDTH + c)
+            masks.append(mask)
+    return masks
+
+
+# Wall masks use bit row * 8 + col per anchor. A wall can't be placed over a
+# wall of the same orientation in these anchors, nor over the crossing wall
+# of the other orientation at its own anchor.
+ALL_WALLS = (1 << (WALL_GRID_WIDTH * WALL_GRID_WIDTH)) - 1
+HORIZONTAL_CONFLICTS = _wall_bits((0, 0, 0), (-1, 0, 1))
+VERTICAL_CONFLICTS = _wall_bits((-1, 0, 1), (0, 0, 0))
+
+
+def wall_vertices(orientation, row, col):
+    """
+    Ids of the three grid-line crossings a wall runs through, numbering the
+    10x10 crossings of the board's grid lines as i * 10 + j.
+    """
+    vertex_width = BOARD_WIDTH + 1
+    if orientation == WallOrientation.HORIZONTAL:
+        return tuple((row + 1) * vertex_width + col + offset for offset in range(3))
+    return tuple((row + offset) * vertex_width + col + 1 for offset in range(3))
+
+
+# WALL_VERTICES[orientation][row * 8 + col] -> crossings the wall runs through
+WALL_VERTICES = {
+    orientation: tuple(
+        wall_vertices(orientation, row, col)
+        for row in range(WALL_GRID_WIDTH)
+        for col in range(WALL_GRID_WIDTH)
+    )
+    for orientation in WallOrientation
+}
+
+# Crossings on the board's outer edge
+BORDER_VERTICES = frozenset(
+    i * (BOARD_WIDTH + 1) + j
+    for i in range(BOARD_WIDTH + 1)
+    for j in range(BOARD_WIDTH + 1)
+    if i in (0, BOARD_WIDTH) or j in (0, BOARD_WIDTH)
+)
+
+
+def iter_wall_anchors(mask):
+    """Yield the anchor index of every set bit of a wall mask, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+# Called with (search name, cells visited) after every path search while
+# `instrumentation` is recording, None otherwise
+search_observer = None
+
+
+def reaches_row(open_edges, start, target_row) -> bool:
+    """Check if a depth-first search from cell `start` reaches `target_row`."""
+    first_target, last_target = target_row * BOARD_WIDTH, target_row * BOARD_WIDTH + BOARD_WIDTH - 1
+    visited = 1 << start
+    stack = [start]
+    reached = False
+    while stack:
+        cell = stack.pop()
+        if first_target <= cell <= last_target:
+            reached = True
+            break
+        edges = open_edges[cell]
+        # Try the steps towards the target row last, so they are popped first
+        for direction in (_SEARCH_ORDER_DOWN if cell < first_target else _SEARCH_ORDER_UP):
+            if edges & DIRECTION_BITS[direction]:
+                neighbour = cell + DELTAS[direction]
+                if not visited >> neighbour & 1:
+                    visited |= 1 << neighbour
+                    stack.append(neighbour)
+    if search_observer is not None:
+        search_observer("reaches_row", bin(visited).count("1"))
+    return reached
+
+
+def path_edges(path) -> set:
+    """The (cell, direction bit) pairs, both ways, of every step along a path of cells."""
+    edges = set()
+    for cell, next_cell in zip(path, path[1:]):
+        direction = DELTAS.index(next_cell - cell)
+        edges.add((cell, DIRECTION_BITS[direction]))
+        edges.add((next_cell, DIRECTION_BITS[OPPOSITES[direction]]))
+    return edges
+
+
+_SEARCH_ORDER_DOWN = (UP, LEFT, RIGHT, DOWN)
+_SEARCH_ORDER_UP = (DOWN, LEFT, RIGHT, UP)
+
+
+def pawn_move_cells(open_edges, cell, other_cell) -> list[int]:
+    """
+    Get the cells a pawn on `cell` can move to, given the open-edge table and
+    the cell of the other pawn. Results follow `Direction` order, with jumps
+    and sideways steps around the other pawn in place of the blocked step.
+    """
+    moves = []
+    edges = open_edges[cell]
+    for direction in range(4):
+        if not edges & DIRECTION_BITS[direction]:
+            continue
+        neighbour = cell + DELTAS[direction]
+        if neighbour != other_cell:
+            moves.append(neighbour)
+            continue
+        neighbour_edges = open_edges[neighbour]
+        if neighbour_edges & DIRECTION_BITS[direction]:
+            moves.append(neighbour + DELTAS[direction])
+        else:
+            # Can't jump over the other pawn, so try stepping around it
+            for side in PERPENDICULARS[direction]:
+                if neighbour_edges & DIRECTION_BITS[side]:
+                    moves.append(neighbour + DELTAS[side])
+    return moves
+
+
+# Move codes
+#
+# Every move fits in a small integer: pawn moves are the target cell (0-80),
+# walls are 81 + orientation * 64 + anchor, with anchor = row * 8 + col and
+# horizontal before vertical (209 codes in total).
+
+WALL_CODE_BASE = CELL_COUNT
+WALL_ORIENTATIONS = (WallOrientation.HORIZONTAL, WallOrientation.VERTICAL)
+MOVE_CODE_COUNT = WALL_CODE_BASE + 2 * WALL_GRID_WIDTH * WALL_GRID_WIDTH
+WALL_POSITIONS = tuple(
+    POSITIONS[(anchor // WALL_GRID_WIDTH) * BOARD_WIDTH + anchor % WALL_GRID_WIDTH]
+    for anchor in range(WALL_GRID_WIDTH * WALL_GRID_WIDTH)
+)
+
+
+def encode_move(move) -> int:
+    """Return the integer code of a move."""
+    position = move.position
+    if not move.is_wall():
+        return position.row * BOARD_WIDTH + position.col
+    anchor = position.row * WALL_GRID_WIDTH + position.col
+    return WALL_CODE_BASE + WALL_ORIENTATIONS.index(move.orientation) * WALL_GRID_WIDTH * WALL_GRID_WIDTH + anchor
+
+
+def decode_move(code):
+    """Return the move with a given integer code."""
+    if code < WALL_CODE_BASE:
+        return Move.pawn(POSITIONS[code])
+    orientation_index, anchor = divmod(code - WALL_CODE_BASE, WALL_GRID_WIDTH * WALL_GRID_WIDTH)
+    return Move.wall(WALL_ORIENTATIONS[orientation_index], WALL_POSITIONS[anchor])
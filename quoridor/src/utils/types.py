@@ -1,7 +1,13 @@
 from enum import Enum
     
 class Position:
-    
+    """
+    A (row, col) pair. Positions are never mutated after construction, which
+    lets the board share one interned instance per cell (see `position_at`).
+    """
+
+    __slots__ = ("row", "col")
+
     def __init__(self, row, col):
         self.row = row
         self.col = col
@@ -10,6 +16,8 @@ class Position:
         return iter((self.row, self.col))
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Position):
             return False
         return self.row == other.row and self.col == other.col
@@ -19,12 +27,12 @@ class Position:
     
     def __add__(self, other):
         if isinstance(other, Position):
-            return Position(self.row + other.row, self.col + other.col)
+            return position_at(self.row + other.row, self.col + other.col)
         return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, Position):
-            return Position(self.row - other.row, self.col - other.col)
+            return position_at(self.row - other.row, self.col - other.col)
         return NotImplemented
 
     def __hash__(self):
@@ -33,6 +41,16 @@ class Position:
     def __str__(self):
         return f"Position(row={self.row}, col={self.col})"
 
+# One shared Position per cell of the 9x9 board, indexed by row * 9 + col
+INTERNED_POSITIONS = tuple(Position(cell // 9, cell % 9) for cell in range(81))
+
+
+def position_at(row, col):
+    """Return the interned Position of an on-board cell, or a new one off the board."""
+    if 0 <= row < 9 and 0 <= col < 9:
+        return INTERNED_POSITIONS[row * 9 + col]
+    return Position(row, col)
+
 class WallOrientation(Enum):
     HORIZONTAL = 1
     VERTICAL = 2
@@ -105,6 +123,8 @@ class Direction(Enum):
     
 
 class Matrix:
+    __slots__ = ("rows", "cols", "data")
+
     def __init__(self, rows, cols, default_factory=None):
         self.rows = rows
         self.cols = cols
@@ -134,3 +154,47 @@ class Matrix:
         self.data[new_row][new_col] = self.data[current_row][current_col]
         self.data[current_row][current_col] = None
 
+
+
+class MoveType(Enum):
+    PAWN = "pawn"
+    WALL = "wall"
+
+
+class Move:
+    """A turn: a pawn step to `position`, or a wall of `orientation` anchored at `position`."""
+
+    __slots__ = ("move_type", "position", "orientation")
+
+    def __init__(self, move_type, position, orientation=None):
+        self.move_type = move_type
+        self.position = position
+        self.orientation = orientation
+
+    @staticmethod
+    def pawn(position):
+        return Move(MoveType.PAWN, position)
+
+    @staticmethod
+    def wall(orientation, position):
+        return Move(MoveType.WALL, position, orientation)
+
+    def is_wall(self):
+        return self.move_type == MoveType.WALL
+
+    def __eq__(self, other):
+        if not isinstance(other, Move):
+            return False
+        return (
+            self.move_type == other.move_type
+            and self.position == other.position
+            and self.orientation == other.orientation
+        )
+
+    def __hash__(self):
+        return hash((self.move_type, self.position, self.orientation))
+
+    def __repr__(self):
+        if self.move_type == MoveType.PAWN:
+            return f"Move.pawn({self.position!r})"
+        return f"Move.wall({self.orientation}, {self.position!r})"
@@ -0,0 +1,55 @@
+import random
+
+from quoridor.src.utils.helpers import BOARD_WIDTH, CELL_COUNT, WALL_GRID_WIDTH
+from quoridor.src.utils.types import WallOrientation
+
+# Zobrist keys
+#
+# A position's key is the XOR of one random 64-bit number per feature it has:
+# each pawn's cell, each placed wall, each player's walls remaining, and
+# whether player 2 is to move. The tables come from a fixed seed so keys are
+# identical across processes and runs, and can be stored on disk.
+
+MAX_WALLS = 10
+_SEED = 0x5A17
+
+_rng = random.Random(_SEED)
+
+
+def _random_keys(count):
+    return [_rng.getrandbits(64) for _ in range(count)]
+
+
+PAWN_KEYS = {player_id: _random_keys(CELL_COUNT) for player_id in (1, 2)}
+WALL_KEYS = {orientation: _random_keys(WALL_GRID_WIDTH * WALL_GRID_WIDTH) for orientation in WallOrientation}
+WALLS_REMAINING_KEYS = {player_id: _random_keys(MAX_WALLS + 1) for player_id in (1, 2)}
+PLAYER2_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def pawn_key(player_id, position):
+    """Key of a player's pawn standing on a position."""
+    return PAWN_KEYS[player_id][position.row * BOARD_WIDTH + position.col]
+
+
+def wall_key(orientation, position):
+    """Key of a wall anchored at a position."""
+    return WALL_KEYS[orientation][position.row * WALL_GRID_WIDTH + position.col]
+
+
+def compute_hash(game) -> int:
+    """Compute a game's Zobrist key from scratch."""
+    board = game.board
+    key = pawn_key(1, board.pawn1.position) ^ pawn_key(2, board.pawn2.position)
+    for orientation, slots in (
+        (WallOrientation.HORIZONTAL, board.horizontal_wall_slots),
+        (WallOrientation.VERTICAL, board.vertical_wall_slots),
+    ):
+        for row in range(WALL_GRID_WIDTH):
+            for col in range(WALL_GRID_WIDTH):
+                if slots[(row, col)].occupied:
+                    key ^= WALL_KEYS[orientation][row * WALL_GRID_WIDTH + col]
+    for player_id in (1, 2):
+        key ^= WALLS_REMAINING_KEYS[player_id][game.walls_remaining[player_id]]
+    if game.current_player_id == 2:
+        key ^= PLAYER2_TO_MOVE_KEY
+    return key
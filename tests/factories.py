@@ -0,0 +1,19 @@
+import random
+
+from quoridor.src.game import Game
+
+def random_game(seed, plies=30, keep_winning_move=False):
+    """
+    A game of up to `plies` random legal moves from `seed`. If a move wins,
+    play stops there and, unless `keep_winning_move`, that move is undone
+    so the game is still in progress.
+    """
+    rng = random.Random(seed)
+    game = Game()
+    for _ in range(plies):
+        game.apply(rng.choice(game.get_legal_moves()))
+        if game.is_game_over():
+            if not keep_winning_move:
+                game.undo()
+            break
+    return game
@@ -0,0 +1,65 @@
+import pytest
+from quoridor.src.ai_agents import WIN_SCORE, AlphaBetaAgent, shortest_path_evaluation
+from quoridor.src.game import Game
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def play(game, moves):
+    for move in moves:
+        assert game.apply(move)
+
+def race_position():
+    """Player 1 one step from goal, player 2 far from theirs, player 1 to move."""
+    game = Game()
+    moves = []
+    for row in range(1, 8):
+        moves.append(Move.pawn(Position(row, 4)))
+        moves.append(Move.pawn(Position(8, 3) if row % 2 else Position(8, 4)))
+    play(game, moves)
+    return game
+
+def test_evaluation_is_antisymmetric():
+    game = Game()
+    play(game, [Move.pawn(Position(1, 4))])
+    assert shortest_path_evaluation(game, 1) == -shortest_path_evaluation(game, 2)
+    assert shortest_path_evaluation(game, 1) == 10
+
+def test_agent_takes_immediate_win():
+    game = race_position()
+    agent = AlphaBetaAgent(time_budget_ms=2000, max_depth=2)
+    assert agent.select_move(game) == Move.pawn(Position(8, 4))
+    assert agent.last_stats.score == WIN_SCORE - 1
+
+def test_agent_blocks_opponent_about_to_win():
+    """Player 2 to move must wall off player 1's winning step."""
+    game = race_position()
+    play(game, [Move.wall(WallOrientation.HORIZONTAL, Position(0, 0))])
+    agent = AlphaBetaAgent(time_budget_ms=5000, max_depth=2)
+    move = agent.select_move(game)
+    assert move.is_wall()
+    game.apply(move)
+    assert game.board.distance_to_goal(1, game.board.pawn1.position) > 1
+
+def test_search_leaves_game_unchanged():
+    game = Game()
+    play(game, [Move.pawn(Position(1, 4)), Move.wall(WallOrientation.VERTICAL, Position(6, 4))])
+    hash_key, history = game.hash_key, game.get_move_history()
+    agent = AlphaBetaAgent(time_budget_ms=200)
+    move = agent.select_move(game)
+    assert move in game.get_legal_moves()
+    assert game.hash_key == hash_key
+    assert game.get_move_history() == history
+
+def test_search_respects_time_budget():
+    # max_depth is far beyond reach, so returning at all means the clock ended the search
+    agent = AlphaBetaAgent(time_budget_ms=300)
+    agent.select_move(Game())
+    stats = agent.last_stats
+    assert stats.depth >= 1
+    assert stats.nodes > 0
+    assert stats.nodes_per_second > 0
+
+def test_no_legal_moves_raises():
+    game = race_position()
+    play(game, [Move.pawn(Position(8, 4))])
+    with pytest.raises(ValueError):
+        AlphaBetaAgent().select_move(game)
@@ -0,0 +1,80 @@
+
+import pytest
+from quoridor.src.archive import ArchiveWriter, GameArchive
+from quoridor.src.game import Game
+from quoridor.src.serialization import POSITION_SIZE, decode_position, encode_position
+from quoridor.src.utils.types import Move, Position
+from tests.factories import random_game
+
+def won_game():
+    game = Game()
+    for row, col in zip(range(1, 8), [3, 2, 1, 0, 1, 0, 1]):
+        game.apply(Move.pawn(Position(row, 4)))
+        game.apply(Move.pawn(Position(8, col)))
+    game.apply(Move.pawn(Position(8, 4)))
+    return game
+
+@pytest.fixture
+def games():
+    return [random_game(seed, plies=50, keep_winning_move=True) for seed in range(8)] + [won_game()]
+
+@pytest.fixture
+def archive(tmp_path, games):
+    path = tmp_path / "games.qarc"
+    with ArchiveWriter(path) as writer:
+        for game in games:
+            writer.add(game)
+    archive = GameArchive(path)
+    yield archive
+    archive.close()
+
+def test_counts(archive, games):
+    assert len(archive) == len(games)
+    assert archive.position_count == sum(len(game.get_move_history()) + 1 for game in games)
+
+def test_games_round_trip(archive, games):
+    for game_id, game in enumerate(games):
+        assert archive.game(game_id).snapshot() == game.snapshot()
+        assert archive.moves(game_id) == game.get_move_history()
+        assert archive.winner(game_id) == game.get_winner()
+    assert [game.hash_key for game in archive] == [game.hash_key for game in games]
+
+def test_positions_follow_each_game(archive, games):
+    for game_id, game in enumerate(games):
+        positions = archive.position_range(game_id)
+        assert bytes(archive.position_bytes(positions[-1])) == encode_position(game)
+        assert archive.position(positions[0]).hash_key == Game().hash_key
+        # Replaying visits exactly the archived positions
+        replayed = [encode_position(state) for state in archive.replay(game_id)]
+        assert replayed == [bytes(archive.position_bytes(index)) for index in positions]
+
+def test_bulk_position_access(archive):
+    run = archive.positions(2, 5)
+    assert len(run) == 3 * POSITION_SIZE
+    assert bytes(run[:POSITION_SIZE]) == bytes(archive.position_bytes(2))
+    fields = list(archive.iter_position_fields())
+    assert len(fields) == archive.position_count
+    assert fields[0][:2] == (4, 76)
+    del run
+
+def test_position_array(archive):
+    pytest.importorskip("numpy")
+    array = archive.position_array()
+    assert len(array) == archive.position_count
+    index = archive.position_range(3)[-1]
+    position = decode_position(bytes(archive.position_bytes(index)))
+    assert array["walls1"][index] == position.walls_remaining[1]
+    assert array["pawn2"][index] == position.board.pawn2.position.row * 9 + position.board.pawn2.position.col
+    del array
+
+def test_lookups_are_bounds_checked(archive):
+    with pytest.raises(IndexError):
+        archive.record(len(archive))
+    with pytest.raises(IndexError):
+        archive.position_bytes(archive.position_count)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        GameArchive(path)
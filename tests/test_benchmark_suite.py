@@ -0,0 +1,39 @@
+import json
+
+from benchmarks.positions import build_positions
+from benchmarks.suite import compare, main, run_suite
+
+def test_positions_are_reproducible():
+    first, second = build_positions(3), build_positions(3)
+    for name in first:
+        assert first[name].hash_key == second[name].hash_key
+    assert build_positions(3)["mid_game"].hash_key != build_positions(4)["mid_game"].hash_key
+    maze = first["maze"]
+    assert maze.walls_remaining == {1: 0, 2: 0}
+    assert not maze.is_game_over()
+
+def test_run_reports_every_position():
+    run = run_suite(names=["can_place_wall_at_position"], min_seconds=0.01)
+    assert set(run["results"]) == {
+        "can_place_wall_at_position/empty", "can_place_wall_at_position/mid_game", "can_place_wall_at_position/maze",
+    }
+    for result in run["results"].values():
+        assert result["ops_per_second"] > 0
+        assert result["peak_bytes_per_op"] >= 0
+    json.dumps(run)
+
+def test_compare_flags_changes_beyond_threshold():
+    baseline = {"results": {"a/empty": {"ops_per_second": 100.0}, "b/empty": {"ops_per_second": 100.0},
+                            "c/empty": {"ops_per_second": 100.0}}}
+    current = {"results": {"a/empty": {"ops_per_second": 150.0}, "b/empty": {"ops_per_second": 95.0},
+                           "c/empty": {"ops_per_second": 50.0}, "d/empty": {"ops_per_second": 1.0}}}
+    verdicts = {key: verdict for key, _, _, _, verdict in compare(current, baseline, threshold=0.1)}
+    assert verdicts == {"a/empty": "faster", "b/empty": "same", "c/empty": "slower"}
+
+def test_command_line_saves_and_compares(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--only", "get_all_valid_pawn_moves", "--min-seconds", "0.01"]
+    assert main(args + ["--output", str(baseline)]) == 0
+    assert json.loads(baseline.read_text())["results"]
+    assert main(args + ["--baseline", str(baseline), "--threshold", "100"]) == 0
+    assert "baseline" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.utils.types import Position, WallOrientation
+
+WALL_ANCHORS = [
+    (orientation, Position(row, col))
+    for orientation in WallOrientation
+    for row in range(8)
+    for col in range(8)
+]
+
+def assert_same_board(board, bitboard):
+    """Compare every query both implementations answer."""
+    for pawn, bit_pawn in ((board.pawn1, bitboard.pawn1), (board.pawn2, bitboard.pawn2)):
+        assert bit_pawn.position == pawn.position
+        assert bitboard.get_all_valid_pawn_moves(bit_pawn) == board.get_all_valid_pawn_moves(pawn)
+    for orientation, position in WALL_ANCHORS:
+        assert (bitboard.can_place_wall_at_position(orientation, position)
+                == board.can_place_wall_at_position(orientation, position))
+        slots = board.horizontal_wall_slots if orientation == WallOrientation.HORIZONTAL else board.vertical_wall_slots
+        bit_slots = bitboard.horizontal_wall_slots if orientation == WallOrientation.HORIZONTAL else bitboard.vertical_wall_slots
+        assert bit_slots[position].occupied == slots[position].occupied
+        assert bit_slots[position].can_be_occupied == slots[position].can_be_occupied
+        anchor_bit = 1 << (position.row * 8 + position.col)
+        assert bool(board.placeable_walls[orientation] & anchor_bit) == board.can_place_wall_at_position(orientation, position)
+    assert bitboard.placeable_walls == board.placeable_walls
+    assert bitboard.placed_walls == board.placed_walls
+    for row in range(9):
+        for col in range(9):
+            for target_row in (0, 8):
+                assert (bitboard.is_path_blocked(Position(row, col), target_row)
+                        == board.is_path_blocked(Position(row, col), target_row))
+    assert bitboard.get_occupied_fields() == board.get_occupied_fields()
+    assert bitboard.open_edges == board.open_edges
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_board_on_random_games(seed):
+    """Play the same random moves and walls on both boards and compare every answer."""
+    rng = random.Random(seed)
+    board = Board()
+    bitboard = BitBoard()
+    placed = []
+    for turn in range(40):
+        pawn, bit_pawn = (board.pawn1, bitboard.pawn1) if turn % 2 == 0 else (board.pawn2, bitboard.pawn2)
+        moves = board.get_all_valid_pawn_moves(pawn)
+        if placed and rng.random() < 0.1:
+            orientation, position = placed.pop(rng.randrange(len(placed)))
+            board.remove_wall(orientation, position)
+            bitboard.remove_wall(orientation, position)
+        elif moves and rng.random() < 0.5:
+            target = rng.choice(moves)
+            board.move_pawn(pawn, target)
+            bitboard.move_pawn(bit_pawn, target)
+        else:
+            orientation, position = rng.choice(WALL_ANCHORS)
+            if board.can_place_wall_at_position(orientation, position):
+                board.place_wall(orientation, position)
+                bitboard.place_wall(orientation, position)
+                placed.append((orientation, position))
+            else:
+                with pytest.raises(ValueError):
+                    bitboard.place_wall(orientation, position)
+        assert_same_board(board, bitboard)
+
+def test_flood_fill_detects_enclosed_pawn():
+    """A pawn boxed into the top-left corner has no path to the far row."""
+    bitboard = BitBoard()
+    bitboard.place_wall(WallOrientation.HORIZONTAL, Position(1, 0))
+    bitboard.place_wall(WallOrientation.VERTICAL, Position(0, 1))
+    assert bitboard.is_path_blocked(Position(0, 0), 8)
+    assert not bitboard.is_path_blocked(Position(0, 0), 1)
+    assert not bitboard.is_path_blocked(Position(0, 4), 8)
+
+def test_wall_anchor_out_of_grid_raises_index_error():
+    """Anchors outside the 8x8 wall grid are rejected the same way `Board` rejects them."""
+    bitboard = BitBoard()
+    with pytest.raises(IndexError):
+        bitboard.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(0, 8))
+    with pytest.raises(IndexError):
+        bitboard.place_wall(WallOrientation.VERTICAL, Position(8, 0))
@@ -1,11 +1,13 @@
+import pickle
 import pytest
+from quoridor.src.bitboard import BitBoard
 from quoridor.src.board import Board
 from quoridor.src.utils.types import Position, WallOrientation
 
-@pytest.fixture
-def board():
-    """Create a new board instance for each test."""
-    board = Board()
+@pytest.fixture(params=[Board, BitBoard])
+def board(request):
+    """Create a new board instance for each test, once per board implementation."""
+    board = request.param()
     # Ensure pawns are properly initialized
     assert board.fields[board.pawn1.position].pawn == board.pawn1
     assert board.fields[board.pawn2.position].pawn == board.pawn2
@@ -120,3 +122,92 @@ def test_diagonal_moves_prohibited(board):
     with pytest.raises(ValueError):
         board.move_pawn(board.pawn1, Position(1, 5))  # Diagonal move
 
+
+def test_remove_wall_restores_passage_and_slots(board):
+    """Removing a wall reopens the edges it blocked and frees the slots it disabled."""
+    position = Position(4, 4)
+    board.place_wall(WallOrientation.HORIZONTAL, position)
+    assert not board.can_pass_between_adjacent_positions(Position(4, 5), Position(5, 5))
+    assert not board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(4, 5))
+    assert not board.can_place_wall_at_position(WallOrientation.VERTICAL, position)
+
+    board.remove_wall(WallOrientation.HORIZONTAL, position)
+    assert board.can_pass_between_adjacent_positions(Position(4, 5), Position(5, 5))
+    assert board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(4, 5))
+    assert board.can_place_wall_at_position(WallOrientation.VERTICAL, position)
+    assert board.horizontal_wall_slots[Position(4, 5)].can_be_occupied
+    assert board.vertical_wall_slots[position].can_be_occupied
+
+def test_remove_missing_wall(board):
+    """Removing a wall that was never placed is an error."""
+    with pytest.raises(ValueError):
+        board.remove_wall(WallOrientation.VERTICAL, Position(2, 2))
+
+def slot_states(board):
+    return [
+        (slots[Position(row, col)].occupied, slots[Position(row, col)].can_be_occupied)
+        for slots, rows, cols in ((board.horizontal_wall_slots, 8, 9), (board.vertical_wall_slots, 9, 8))
+        for row in range(rows)
+        for col in range(cols)
+    ]
+
+def crowded(board):
+    board.move_pawn(board.pawn1, Position(1, 4))
+    board.move_pawn(board.pawn2, Position(7, 4))
+    for orientation, position in [
+        (WallOrientation.HORIZONTAL, Position(3, 3)),
+        (WallOrientation.VERTICAL, Position(3, 5)),
+        (WallOrientation.HORIZONTAL, Position(6, 7)),
+        (WallOrientation.VERTICAL, Position(0, 0)),
+    ]:
+        board.place_wall(orientation, position)
+    return board
+
+def test_clone_copies_state(board):
+    """A clone has the same pawns, slots, edges, distance maps and wall masks."""
+    original = crowded(board)
+    clone = original.clone()
+    assert type(clone) is type(original)
+    assert clone.snapshot() == original.snapshot()
+    assert slot_states(clone) == slot_states(original)
+    assert clone.fields[Position(1, 4)].pawn is clone.pawn1
+    assert clone.get_occupied_fields() == original.get_occupied_fields()
+
+def test_clone_is_independent(board):
+    """Changing a clone leaves the original untouched, and the other way round."""
+    original = crowded(board)
+    snapshot = original.snapshot()
+    slots = slot_states(original)
+    clone = original.clone()
+    clone.move_pawn(clone.pawn1, Position(2, 4))
+    clone.place_wall(WallOrientation.HORIZONTAL, Position(1, 4))
+    clone.remove_wall(WallOrientation.VERTICAL, Position(3, 5))
+    assert original.snapshot() == snapshot
+    assert slot_states(original) == slots
+    assert original.fields[Position(2, 4)].pawn is None
+
+    original.place_wall(WallOrientation.VERTICAL, Position(5, 5))
+    assert not clone.vertical_wall_slots[Position(5, 5)].occupied
+    assert not clone.placed_walls[WallOrientation.VERTICAL] >> (5 * 8 + 5) & 1
+
+def test_snapshot_survives_pickling(board):
+    """A snapshot sent through pickle rebuilds an equal board of either kind."""
+    snapshot = crowded(board).snapshot()
+    copied = pickle.loads(pickle.dumps(snapshot))
+    for board_class in (Board, BitBoard):
+        rebuilt = board_class.from_snapshot(copied)
+        assert rebuilt.snapshot() == snapshot
+        assert rebuilt.is_path_blocked(rebuilt.pawn1.position, 8) is False
+        assert rebuilt.distance_to_goal(2, rebuilt.pawn2.position) == board.distance_to_goal(2, board.pawn2.position)
+
+def test_shortest_path_and_distance_to_row(board):
+    board.place_wall(WallOrientation.HORIZONTAL, Position(3, 3))
+    board.place_wall(WallOrientation.HORIZONTAL, Position(3, 5))
+    start = Position(0, 4)
+    # Goal rows come from the distance maps, other rows from A*
+    for target_row in (8, 5):
+        path = board.shortest_path(start, target_row)
+        assert path[0] == start and path[-1].row == target_row
+        assert board.distance_to_row(start, target_row) == len(path) - 1
+    assert board.distance_to_row(start, 8) == board.distance_to_goal(1, start) == 10
+    assert board.distance_to_row(start, 0) == 0
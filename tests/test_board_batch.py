@@ -0,0 +1,104 @@
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from quoridor.src.board_batch import BoardBatch
+from quoridor.src.distance_map import UNREACHABLE
+from quoridor.src.game import Game
+from quoridor.src.utils.helpers import WALL_ORIENTATIONS, encode_move
+from tests.factories import random_game
+
+@pytest.fixture(scope="module")
+def games():
+    # Games of varying length, from 0 to 29 plies
+    return [random_game(seed, plies=seed % 30) for seed in range(40)]
+
+@pytest.fixture(scope="module")
+def batch(games):
+    return BoardBatch.from_boards([game.board for game in games])
+
+def test_empty_batch_matches_new_board():
+    batch = BoardBatch.empty(3)
+    reference = BoardBatch.from_boards([Game().board])
+    assert len(batch) == 3
+    assert (batch.pawns == reference.pawns).all()
+    assert not batch.horizontal_walls.any() and not batch.vertical_walls.any()
+    assert (batch.pawn_distances() == 8).all()
+
+def test_from_boards_copies_walls(games, batch):
+    for k, game in enumerate(games):
+        for orientation, grid in zip(WALL_ORIENTATIONS, (batch.horizontal_walls[k], batch.vertical_walls[k])):
+            placed = game.board.placed_walls[orientation]
+            assert [bool(placed >> anchor & 1) for anchor in range(64)] == grid.ravel().tolist()
+
+def test_distances_match_distance_maps(games, batch):
+    for player_id in (1, 2):
+        distances = batch.distances_to_goal(player_id)
+        for k, game in enumerate(games):
+            assert distances[k].ravel().tolist() == game.board.distance_maps[player_id].distances
+
+def test_pawn_distances(games, batch):
+    distances = batch.pawn_distances()
+    for k, game in enumerate(games):
+        board = game.board
+        assert distances[k, 0] == board.distance_to_goal(1, board.pawn1.position)
+        assert distances[k, 1] == board.distance_to_goal(2, board.pawn2.position)
+
+
+def test_unreachable_cells_are_marked():
+    batch = BoardBatch.empty(1)
+    # Fence off the bottom-left corner cell
+    batch.horizontal_walls[0, 7, 0] = True
+    batch.vertical_walls[0, 7, 0] = True
+    distances = batch.distances_to_goal(2)
+    assert distances[0, 8, 0] == UNREACHABLE
+    assert distances[0, 8, 2] == 8
+
+
+@pytest.mark.parametrize("player_id", [1, 2])
+def test_pawn_move_masks_match_board(games, batch, player_id):
+    masks = batch.pawn_move_masks(player_id)
+    for k, game in enumerate(games):
+        board = game.board
+        pawn = board.pawn1 if player_id == 1 else board.pawn2
+        expected = {(position.row, position.col) for position in board.get_all_valid_pawn_moves(pawn)}
+        assert set(zip(*np.nonzero(masks[k]))) == expected
+
+def test_jump_and_sidestep_moves():
+    batch = BoardBatch.empty(2)
+    batch.pawns[:, 0] = (4, 4)
+    batch.pawns[:, 1] = (5, 4)
+    batch.horizontal_walls[1, 5, 4] = True  # Behind pawn 2: no straight jump
+    masks = batch.pawn_move_masks(1)
+    assert masks[0, 6, 4] and not masks[0, 5, 4]
+    assert not masks[1, 6, 4] and masks[1, 5, 3] and masks[1, 5, 5]
+
+def test_wall_masks_match_placeable_walls(games, batch):
+    masks = batch.wall_masks()
+    for k, game in enumerate(games):
+        for orientation, mask in zip(WALL_ORIENTATIONS, masks):
+            placeable = game.board.placeable_walls[orientation]
+            assert [bool(placeable >> anchor & 1) for anchor in range(64)] == mask[k].ravel().tolist()
+
+def test_legal_wall_masks_match_game(games, batch):
+    masks = batch.legal_wall_masks()
+    for k, game in enumerate(games):
+        if not game.walls_remaining[game.current_player_id]:
+            continue
+        expected = {encode_move(move) for move in game.generate_legal_walls()}
+        found = {
+            81 + orientation_index * 64 + anchor
+            for orientation_index, mask in enumerate(masks)
+            for anchor in np.flatnonzero(mask[k])
+        }
+        assert found == expected
+
+def test_legal_wall_masks_reject_sealing_wall():
+    batch = BoardBatch.empty(1)
+    # Walls along the bottom edge leave pawn 2 a single way out, through column 0
+    batch.horizontal_walls[0, 7, [1, 3, 5, 7]] = True
+    assert batch.wall_masks()[1][0, 7, 0]
+    horizontal, vertical = batch.legal_wall_masks()
+    assert not vertical[0, 7, 0]
+    assert vertical[0, 6, 0]
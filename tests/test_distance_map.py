@@ -0,0 +1,53 @@
+import random
+
+import pytest
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.distance_map import DistanceMap
+from quoridor.src.utils.types import Position, WallOrientation
+
+@pytest.fixture(params=[Board, BitBoard])
+def board(request):
+    return request.param()
+
+def test_distance_on_empty_board(board):
+    """Without walls the distance is the number of rows to the goal row."""
+    assert board.distance_to_goal(1, Position(0, 4)) == 8
+    assert board.distance_to_goal(2, Position(8, 4)) == 8
+    assert board.distance_to_goal(1, Position(8, 0)) == 0
+    assert board.distance_to_goal(2, Position(3, 7)) == 3
+
+def test_distance_grows_around_walls(board):
+    """A wall in front of a cell forces a detour."""
+    board.place_wall(WallOrientation.HORIZONTAL, Position(7, 3))
+    assert board.distance_to_goal(1, Position(7, 4)) == 2
+    board.remove_wall(WallOrientation.HORIZONTAL, Position(7, 3))
+    assert board.distance_to_goal(1, Position(7, 4)) == 1
+
+def test_enclosed_cell_is_unreachable(board):
+    """Cells walled off from the goal row have no distance."""
+    board.place_wall(WallOrientation.HORIZONTAL, Position(1, 0))
+    board.place_wall(WallOrientation.VERTICAL, Position(0, 1))
+    assert board.distance_to_goal(1, Position(0, 0)) is None
+    assert board.is_path_blocked(Position(1, 1), 8)
+    assert board.distance_to_goal(2, Position(0, 0)) == 0
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_updates_match_full_rebuild(board, seed):
+    """After any sequence of wall placements and removals the maps equal a fresh flood fill."""
+    rng = random.Random(seed)
+    placed = []
+    for _ in range(60):
+        if placed and rng.random() < 0.3:
+            orientation, position = placed.pop(rng.randrange(len(placed)))
+            board.remove_wall(orientation, position)
+        else:
+            orientation = rng.choice(list(WallOrientation))
+            position = Position(rng.randrange(8), rng.randrange(8))
+            if not board.can_place_wall_at_position(orientation, position):
+                continue
+            board.place_wall(orientation, position)
+            placed.append((orientation, position))
+        for distance_map in board.distance_maps.values():
+            expected = DistanceMap(list(board.open_edges), distance_map.goal_row)
+            assert distance_map.distances == expected.distances
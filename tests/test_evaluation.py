@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from quoridor.src.ai_agents import AlphaBetaAgent, shortest_path_evaluation
+from quoridor.src.evaluation import (
+    Evaluator, Feature, GoalRowProgress, Mobility, PathDifference, WallDifference, feature_breakdown,
+)
+from quoridor.src.game import Game
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def all_features():
+    return [(PathDifference(), 10), (WallDifference(), 1), (Mobility(), 3), (GoalRowProgress(), 2)]
+
+def test_initial_position_is_level():
+    game = Game()
+    assert feature_breakdown(game) == {"path_difference": 0, "wall_difference": 0, "mobility": 0}
+    assert Evaluator()(game, 1) == Evaluator()(game, 2) == 0
+
+def test_scores_are_antisymmetric():
+    game = Game()
+    game.apply(Move.pawn(Position(1, 4)))
+    game.apply(Move.wall(WallOrientation.HORIZONTAL, Position(0, 3)))
+    evaluator = Evaluator(all_features())
+    assert evaluator(game, 1) == -evaluator(game, 2) != 0
+
+def test_path_and_walls_match_shortest_path_evaluation():
+    game = Game()
+    game.apply(Move.pawn(Position(1, 4)))
+    game.apply(Move.wall(WallOrientation.VERTICAL, Position(6, 4)))
+    evaluator = Evaluator.from_weights({"path_difference": 10, "wall_difference": 1})
+    assert evaluator(game, 1) == shortest_path_evaluation(game, 1)
+    assert evaluator(game, 2) == shortest_path_evaluation(game, 2)
+
+def test_mobility_counts_pawn_moves():
+    game = Game()
+    game.apply(Move.wall(WallOrientation.HORIZONTAL, Position(0, 4)))  # Below player 1's pawn
+    values = feature_breakdown(game, Evaluator(all_features()))
+    assert values["mobility"] == 2 - 3
+    assert values["goal_row_progress"] == 0
+
+def test_incremental_values_match_recomputation():
+    rng = random.Random(5)
+    incremental = Evaluator(all_features())
+    fresh = Evaluator(all_features(), incremental=False)
+    game = Game()
+    for _ in range(400):
+        moves = game.get_legal_moves()
+        if game.undo_stack and (not moves or rng.random() < 0.4):
+            game.undo()
+        else:
+            game.apply(rng.choice(moves))
+        assert incremental.feature_values(game) == fresh.feature_values(game)
+    # Other games too
+    other = Game()
+    other.apply(Move.pawn(Position(0, 3)))
+    assert incremental.feature_values(other) == fresh.feature_values(other)
+
+def test_mobility_carries_over_walls_away_from_pawns(monkeypatch):
+    game = Game()
+    mobility = Mobility()
+    value = mobility.compute(game)
+    game.apply(Move.wall(WallOrientation.HORIZONTAL, Position(4, 0)))
+    monkeypatch.setattr(mobility, "compute", lambda game: pytest.fail("recomputed"))
+    assert mobility.update(game, value) == value
+
+def test_evaluator_drives_alpha_beta_search():
+    game = Game()
+    agent = AlphaBetaAgent(time_budget_ms=2000, max_depth=2, evaluate=Evaluator())
+    assert agent.select_move(game) in game.get_legal_moves()
+
+def test_feature_without_compute_cannot_be_created():
+    class Unfinished(Feature):
+        name = "unfinished"
+
+    with pytest.raises(TypeError):
+        Unfinished()
+
+def test_weights_must_be_integers():
+    with pytest.raises(ValueError):
+        Evaluator.from_weights({"path_difference": 1.5})
+
+def test_evaluator_drives_a_search_with_a_transposition_table():
+    evaluator = Evaluator.from_weights({"path_difference": 3, "wall_difference": 2, "goal_row_progress": 1})
+    agent = AlphaBetaAgent(time_budget_ms=5000, max_depth=2, evaluate=evaluator, tt_memory_mb=1)
+    game = Game()
+    move = agent.select_move(game)
+    assert move in game.get_legal_moves()
+    assert isinstance(agent.last_stats.score, int)
+    assert agent.transposition_table.stores > 0
@@ -1,6 +1,13 @@
+import copy
+import pickle
+import random
+import timeit
 import pytest
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
 from quoridor.src.game import Game, GameState
-from quoridor.src.utils.types import Position, WallOrientation
+from quoridor.src.utils.types import Move, Position, WallOrientation
+from tests.factories import random_game
 
 def test_game_initialization():
     game = Game()
@@ -120,3 +127,169 @@ def test_wall_placement_when_out_of_walls():
 
     # Try to place one more wall for player 2
     assert not game.place_wall(WallOrientation.HORIZONTAL, Position(7, 1))  # Should fail
+
+def test_undo_pawn_move():
+    game = Game()
+    assert game.apply(Move.pawn(Position(1, 4)))
+    assert game.undo()
+    assert game.board.pawn1.position == Position(0, 4)
+    assert game.board.fields[Position(0, 4)].pawn == game.board.pawn1
+    assert game.board.fields[Position(1, 4)].pawn is None
+    assert game.get_current_player() == 1
+
+def test_undo_wall_placement():
+    game = Game()
+    assert game.apply(Move.wall(WallOrientation.HORIZONTAL, Position(4, 4)))
+    assert game.undo()
+    assert game.get_walls_remaining(1) == 10
+    assert game.get_current_player() == 1
+    assert not game.board.horizontal_wall_slots[Position(4, 4)].occupied
+    # Slots the wall disabled are available again
+    assert game.board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(4, 5))
+    assert game.board.can_place_wall_at_position(WallOrientation.VERTICAL, Position(4, 4))
+    assert game.board.distance_to_goal(1, Position(4, 4)) == 4
+
+def test_undo_winning_move():
+    game = Game()
+    for row in range(1, 9):
+        assert game.move_pawn(Position(row, 4))
+        if row < 8:
+            assert game.move_pawn(Position(7, 3) if row % 2 == 0 else Position(8, 3))
+    assert game.is_game_over()
+    assert game.undo()
+    assert not game.is_game_over()
+    assert game.get_current_player() == 1
+    assert game.board.pawn1.position == Position(7, 4)
+
+def test_undo_sideways_jump():
+    """A sidestep around a walled-in pawn is taken back even though the reverse step is not a legal move."""
+    game = Game()
+    for position in (Position(1, 4), Position(7, 4), Position(2, 4), Position(6, 4),
+                     Position(3, 4), Position(5, 4), Position(4, 4)):
+        assert game.move_pawn(position)
+    assert game.place_wall(WallOrientation.HORIZONTAL, Position(3, 4))  # Behind player 1's pawn
+    assert game.place_wall(WallOrientation.HORIZONTAL, Position(0, 0))
+    assert Position(3, 4) not in game.get_valid_moves()
+    assert game.move_pawn(Position(4, 5))  # Player 2 steps around player 1's pawn
+    assert game.undo()
+    assert game.board.pawn2.position == Position(5, 4)
+    assert game.get_current_player() == 2
+
+def test_undo_with_empty_history():
+    game = Game()
+    assert not game.undo()
+
+def test_apply_and_undo_restore_initial_state():
+    game = Game()
+    moves = [
+        Move.pawn(Position(1, 4)),
+        Move.wall(WallOrientation.VERTICAL, Position(6, 3)),
+        Move.wall(WallOrientation.HORIZONTAL, Position(2, 2)),
+        Move.pawn(Position(7, 4)),
+    ]
+    for move in moves:
+        assert game.apply(move)
+    assert game.get_move_history() == moves
+    while game.undo():
+        pass
+    assert game.get_move_history() == []
+    assert game.get_walls_remaining(1) == 10
+    assert game.get_walls_remaining(2) == 10
+    assert game.board.open_edges == Game().board.open_edges
+
+def test_rejected_wall_keeps_neighbouring_slots_available():
+    """A wall refused for blocking a path must not leave its neighbours disabled."""
+    game = Game()
+    # Pawn 1 is boxed in on the left and right, so H(1,4) would close it in
+    assert game.place_wall(WallOrientation.VERTICAL, Position(0, 3))
+    assert game.place_wall(WallOrientation.VERTICAL, Position(0, 4))
+    assert not game.place_wall(WallOrientation.HORIZONTAL, Position(1, 4))
+    assert game.path_blocked
+    board = game.board
+    assert board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(1, 4))
+    assert board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(1, 3))
+    assert board.can_place_wall_at_position(WallOrientation.HORIZONTAL, Position(1, 5))
+
+def test_legal_moves_at_start():
+    """Three pawn steps and all 128 walls are legal in the opening position."""
+    game = Game()
+    moves = game.get_legal_moves()
+    assert len(moves) == 131
+    assert moves[:3] == [Move.pawn(Position(1, 4)), Move.pawn(Position(0, 3)), Move.pawn(Position(0, 5))]
+
+def test_legal_walls_exclude_blocking_walls():
+    game = Game()
+    assert game.place_wall(WallOrientation.HORIZONTAL, Position(1, 3))
+    assert game.place_wall(WallOrientation.VERTICAL, Position(0, 3))
+    assert game.place_wall(WallOrientation.VERTICAL, Position(0, 5))
+    walls = game.generate_legal_walls()
+    assert Move.wall(WallOrientation.HORIZONTAL, Position(1, 4)) not in walls
+    assert Move.wall(WallOrientation.HORIZONTAL, Position(1, 5)) not in walls  # Seals the pocket too
+    assert Move.wall(WallOrientation.HORIZONTAL, Position(6, 6)) in walls
+    for wall in walls:
+        assert game.apply(wall)
+        assert game.undo()
+
+def reference_legal_walls(game):
+    """Legal walls found the slow way: try every anchor and search both paths."""
+    board = game.board
+    walls = []
+    for orientation in WallOrientation:
+        for row in range(8):
+            for col in range(8):
+                position = Position(row, col)
+                if not board.can_place_wall_at_position(orientation, position):
+                    continue
+                board.place_wall(orientation, position)
+                blocked = (board.is_path_blocked(board.pawn1.position, 8)
+                           or board.is_path_blocked(board.pawn2.position, 0))
+                board.remove_wall(orientation, position)
+                if not blocked:
+                    walls.append(Move.wall(orientation, position))
+    return walls
+
+@pytest.mark.parametrize("seed", range(4))
+def test_generate_legal_walls_matches_exhaustive_check(seed):
+    """The filtered generator agrees with trying every anchor, through a wall-heavy game."""
+    rng = random.Random(seed)
+    game = Game()
+    while not game.is_game_over() and len(game.get_move_history()) < 60:
+        walls = game.generate_legal_walls()
+        if game.get_walls_remaining(game.get_current_player()):
+            assert walls == reference_legal_walls(game)
+        else:
+            assert walls == []
+        if walls and rng.random() < 0.7:
+            assert game.apply(rng.choice(walls))
+        else:
+            assert game.move_pawn(rng.choice(game.get_valid_moves()))
+
+@pytest.mark.parametrize("seed", range(3))
+def test_clone_is_independent(seed):
+    game = random_game(seed)
+    snapshot = game.snapshot()
+    clone = game.clone()
+    assert clone.snapshot() == snapshot
+    clone.apply(clone.get_legal_moves()[-1])
+    assert game.snapshot() == snapshot
+    # The clone's history is its own, and undoing all of it returns to the start
+    while clone.undo():
+        pass
+    assert clone.hash_key == Game().hash_key
+    assert game.snapshot() == snapshot
+
+def test_snapshot_round_trip_through_pickle():
+    game = random_game(7)
+    snapshot = game.snapshot()
+    for board_class in (Board, BitBoard):
+        rebuilt = Game.from_snapshot(pickle.loads(pickle.dumps(snapshot)), board_class)
+        assert isinstance(rebuilt.board, board_class)
+        assert rebuilt.snapshot() == snapshot
+        assert rebuilt.get_legal_moves() == game.get_legal_moves()
+        assert rebuilt.get_move_history() == game.get_move_history()
+
+def test_clone_is_much_faster_than_deepcopy():
+    game = random_game(3)
+    deepcopy_seconds = min(timeit.repeat(lambda: copy.deepcopy(game), number=20, repeat=3))
+    clone_seconds = min(timeit.repeat(game.clone, number=20, repeat=3))
+    assert clone_seconds * 5 < deepcopy_seconds
@@ -0,0 +1,58 @@
+import pytest
+from quoridor.src.utils.helpers import (
+    ALL_EDGES, DIRECTION_BITS, DOWN, LEFT, MOVE_CODE_COUNT, RIGHT, UP, WALL_EDGE_CUTS,
+    cell_index, decode_move, encode_move, initial_open_edges, pawn_move_cells, reaches_row,
+)
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def test_initial_open_edges_close_the_border():
+    """Only the board border is closed on an empty board."""
+    open_edges = initial_open_edges()
+    assert open_edges[cell_index(Position(4, 4))] == ALL_EDGES
+    assert not open_edges[cell_index(Position(0, 4))] & DIRECTION_BITS[UP]
+    assert not open_edges[cell_index(Position(8, 4))] & DIRECTION_BITS[DOWN]
+    assert not open_edges[cell_index(Position(4, 0))] & DIRECTION_BITS[LEFT]
+    assert not open_edges[cell_index(Position(4, 8))] & DIRECTION_BITS[RIGHT]
+
+@pytest.mark.parametrize("orientation, expected", [
+    (WallOrientation.HORIZONTAL, {((2, 3), DOWN), ((2, 4), DOWN), ((3, 3), UP), ((3, 4), UP)}),
+    (WallOrientation.VERTICAL, {((2, 3), RIGHT), ((3, 3), RIGHT), ((2, 4), LEFT), ((3, 4), LEFT)}),
+])
+def test_wall_edge_cuts(orientation, expected):
+    """A wall closes the two edges on each side of it."""
+    cuts = WALL_EDGE_CUTS[orientation][2 * 8 + 3]
+    assert {(cell, bit) for cell, bit in cuts} == {
+        (cell_index(Position(*position)), DIRECTION_BITS[direction]) for position, direction in expected
+    }
+
+def test_pawn_move_cells_jump_and_sidestep():
+    """Pawns jump the other pawn, or step around it when a wall is behind it."""
+    open_edges = initial_open_edges()
+    own, other = cell_index(Position(4, 4)), cell_index(Position(5, 4))
+    assert cell_index(Position(6, 4)) in pawn_move_cells(open_edges, own, other)
+
+    for cell, bit in WALL_EDGE_CUTS[WallOrientation.HORIZONTAL][5 * 8 + 4]:
+        open_edges[cell] &= ~bit
+    moves = pawn_move_cells(open_edges, own, other)
+    assert cell_index(Position(6, 4)) not in moves
+    assert cell_index(Position(5, 3)) in moves
+    assert cell_index(Position(5, 5)) in moves
+
+def test_move_codes_round_trip():
+    """Every pawn target and wall anchor has its own code, and decoding restores the move."""
+    moves = [Move.pawn(Position(row, col)) for row in range(9) for col in range(9)] + [
+        Move.wall(orientation, Position(row, col))
+        for orientation in WallOrientation for row in range(8) for col in range(8)
+    ]
+    codes = [encode_move(move) for move in moves]
+    assert codes == list(range(MOVE_CODE_COUNT))
+    assert [decode_move(code) for code in codes] == moves
+
+def test_reaches_row_follows_open_edges():
+    open_edges = initial_open_edges()
+    start = cell_index(Position(8, 0))
+    assert reaches_row(open_edges, start, 0)
+    # Close the corner cell in
+    open_edges[start] &= ~(DIRECTION_BITS[UP] | DIRECTION_BITS[RIGHT])
+    assert not reaches_row(open_edges, start, 0)
+    assert reaches_row(open_edges, start, 8)
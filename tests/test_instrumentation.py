@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from quoridor.src import instrumentation
+from quoridor.src.board import Board
+from quoridor.src.game import Game
+from quoridor.src.instrumentation import profiling
+from quoridor.src.utils import helpers
+from quoridor.src.utils.types import Position, WallOrientation
+
+def nearly_boxed_game():
+    """Player 2's pawn walled in above and on both sides; one more wall would seal it."""
+    game = Game()
+    assert game.place_wall(WallOrientation.HORIZONTAL, Position(7, 3))
+    assert game.place_wall(WallOrientation.HORIZONTAL, Position(7, 5))
+    assert game.place_wall(WallOrientation.VERTICAL, Position(7, 2))
+    return game
+
+def test_code_is_untouched_when_not_recording():
+    originals = [owner.__dict__[attribute] for owner, attribute, _ in instrumentation.TARGETS]
+    place_wall = Game.__dict__["place_wall"]
+    with profiling():
+        assert Game.__dict__["place_wall"] is not place_wall
+        assert instrumentation.is_recording()
+    assert [owner.__dict__[attribute] for owner, attribute, _ in instrumentation.TARGETS] == originals
+    assert helpers.search_observer is None
+    assert not instrumentation.is_recording()
+
+def test_counts_calls_and_rejected_walls():
+    game = nearly_boxed_game()
+    with profiling() as profile:
+        game.get_legal_moves()
+        assert not game.place_wall(WallOrientation.VERTICAL, Position(7, 6))
+        game.board.is_path_blocked(game.board.pawn1.position, 4)
+    data = profile.to_dict()
+    assert data["targets"]["move.Game.place_wall"]["calls"] == 1
+    assert data["targets"]["move_generation.Game.get_legal_moves"]["calls"] == 1
+    assert data["targets"]["move_generation.Game.generate_legal_walls"]["calls"] == 1
+    assert data["counts"]["move.Game.place_wall.rejected_path_blocked"] == 1
+    assert data["counts"]["wall_check.Game._keeps_paths.rejected_path_blocked"] >= 1
+    assert data["counts"]["path_search.find_path.cells_visited"] >= 5
+    assert data["counts"]["path_search.reaches_row.cells_visited"] > 0
+
+def test_profiles_dump_as_table_and_json():
+    with profiling() as profile:
+        Board().get_all_valid_pawn_moves(Board().pawn1)
+    assert "move_generation.Board.get_all_valid_pawn_moves" in profile.table()
+    data = json.loads(profile.to_json())
+    assert data["targets"]["move_generation.Board.get_all_valid_pawn_moves"]["calls"] == 1
+    assert data["seconds"] > 0
+
+def test_only_one_profile_records_at_a_time():
+    with profiling():
+        with pytest.raises(RuntimeError):
+            instrumentation.start()
+    with pytest.raises(RuntimeError):
+        instrumentation.stop()
+
+def test_profile_stops_when_the_block_raises():
+    with pytest.raises(ValueError):
+        with profiling():
+            raise ValueError()
+    assert not instrumentation.is_recording()
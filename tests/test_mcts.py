@@ -0,0 +1,97 @@
+import random
+
+import pytest
+from quoridor.src.game import Game
+from quoridor.src.mcts import MCTSAgent, MCTSNode, _worker_search, rollout, search
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def play(game, moves):
+    for move in moves:
+        assert game.apply(move)
+
+def race_position():
+    """Player 1 one step from goal, player 2 far from theirs, player 1 to move."""
+    game = Game()
+    moves = []
+    for row in range(1, 8):
+        moves.append(Move.pawn(Position(row, 4)))
+        moves.append(Move.pawn(Position(8, 3) if row % 2 else Position(8, 4)))
+    play(game, moves)
+    return game
+
+def test_agent_needs_a_budget():
+    with pytest.raises(ValueError):
+        MCTSAgent()
+
+def test_rollout_restores_game():
+    game = Game()
+    play(game, [Move.pawn(Position(1, 4)), Move.wall(WallOrientation.VERTICAL, Position(6, 4))])
+    hash_key, history = game.hash_key, game.get_move_history()
+    rng = random.Random(3)
+    for _ in range(20):
+        assert rollout(game, rng, wall_probability=0.3) in (1, 2)
+    assert game.hash_key == hash_key
+    assert game.get_move_history() == history
+
+def test_rollout_is_scored_by_distance_when_cut_short():
+    game = race_position()
+    assert rollout(game, random.Random(0), max_plies=0) == 1
+
+def test_search_counts_playouts_and_leaves_game_unchanged():
+    game = Game()
+    hash_key = game.hash_key
+    root = MCTSNode(None, None, 2)
+    assert search(game, root, random.Random(1), iterations=50) == 50
+    assert root.visits == 50
+    assert sum(child.visits for child in root.children) == 50
+    assert game.hash_key == hash_key
+    assert game.get_move_history() == []
+
+def test_agent_takes_immediate_win():
+    game = race_position()
+    agent = MCTSAgent(iterations=400, seed=0)
+    assert agent.select_move(game) == Move.pawn(Position(8, 4))
+    assert agent.last_stats.playouts == 400
+    assert agent.last_stats.playouts_per_second_per_worker[0] > 0
+
+def test_agent_reuses_tree_between_moves():
+    game = Game()
+    agent = MCTSAgent(iterations=300, seed=2)
+    move = agent.select_move(game)
+    play(game, [move])
+    # Answer with the reply the agent explored most, so its subtree is in the tree
+    subtree = agent._root.find_child(move)
+    reply = max(subtree.children, key=lambda child: child.visits)
+    reply_visits = reply.visits
+    play(game, [reply.move])
+    agent.select_move(game)
+    assert agent.last_stats.reused_visits == reply_visits > 0
+    assert agent._root is reply
+    assert reply.parent is None
+
+def test_time_budget_alone_stops_the_search():
+    # No iteration budget, so returning at all means the clock ended the search
+    agent = MCTSAgent(time_budget_ms=50, seed=0)
+    agent.select_move(Game())
+    assert agent.last_stats.playouts > 0
+    assert agent.last_stats.elapsed_seconds > 0
+
+def test_root_parallel_search_merges_workers():
+    game = race_position()
+    with MCTSAgent(iterations=400, workers=2, seed=0) as agent:
+        assert agent.select_move(game) == Move.pawn(Position(8, 4))
+        stats = agent.last_stats
+        assert len(stats.worker_playouts) == 2
+        assert stats.playouts == 400
+    assert agent._pool is None
+
+def test_worker_trees_are_kept_per_slot():
+    # One process running two tasks of the same batch must not grow one tree twice
+    snapshot = Game().snapshot()
+    options = {"max_plies": 200, "wall_probability": 0.05, "greedy": True}
+    for slot in (0, 1):
+        children, _, reused_visits, playouts, _ = _worker_search(snapshot, 50, None, 1.4, options, slot, True, slot)
+        assert reused_visits == 0
+        assert sum(visits for visits, _ in children.values()) == playouts
+    children, _, reused_visits, playouts, _ = _worker_search(snapshot, 50, None, 1.4, options, 2, True, 0)
+    assert reused_visits > 0  # The same slot reuses its tree on the next move
@@ -0,0 +1,47 @@
+from quoridor.src.ai_agents import AlphaBetaAgent
+from quoridor.src.game import Game
+from quoridor.src.move_ordering import MoveOrderer
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def test_promising_moves_come_first():
+    game = Game()
+    moves = game.get_legal_moves()
+    ordered = MoveOrderer().order(game, moves, 0)
+    assert sorted(map(repr, ordered)) == sorted(map(repr, moves))
+    # Stepping towards the goal, then walls across player 2's straight path down column 4
+    assert ordered[0] == Move.pawn(Position(1, 4))
+    crossing = {Move.wall(WallOrientation.HORIZONTAL, Position(row, col)) for row in range(8) for col in (3, 4)}
+    assert set(ordered[1:17]) == crossing
+
+def test_table_move_and_killers_lead():
+    game = Game()
+    orderer = MoveOrderer()
+    quiet_wall = Move.wall(WallOrientation.VERTICAL, Position(7, 0))
+    killer = Move.wall(WallOrientation.VERTICAL, Position(0, 7))
+    orderer.record_cutoff(killer, 3, 2, 1)
+    ordered = orderer.order(game, game.get_legal_moves(), 3, first_move=quiet_wall)
+    assert ordered[:2] == [quiet_wall, killer]
+    # Killers belong to their ply, history to the player
+    assert orderer.order(game, game.get_legal_moves(), 4)[0] == Move.pawn(Position(1, 4))
+
+def test_history_breaks_ties_and_ages():
+    game = Game()
+    orderer = MoveOrderer(killers_per_ply=0)
+    wall = Move.wall(WallOrientation.VERTICAL, Position(7, 0))
+    orderer.record_cutoff(wall, 0, 3, 1)
+    other = Move.wall(WallOrientation.VERTICAL, Position(6, 0))  # Generated before `wall`
+    ordered = orderer.order(game, game.get_legal_moves(), 0)
+    assert ordered.index(wall) < ordered.index(other)
+    orderer.new_search()
+    assert orderer.history[1][81 + 64 + 7 * 8] == 4
+
+def test_ordering_keeps_search_result():
+    game = Game()
+    for move in (Move.pawn(Position(1, 4)), Move.pawn(Position(7, 4)),
+                 Move.wall(WallOrientation.HORIZONTAL, Position(6, 4))):
+        assert game.apply(move)
+    plain = AlphaBetaAgent(time_budget_ms=10 ** 6, max_depth=2)
+    ordered = AlphaBetaAgent(time_budget_ms=10 ** 6, max_depth=2, move_orderer=MoveOrderer())
+    plain.select_move(game)
+    ordered.select_move(game)
+    assert ordered.last_stats.score == plain.last_stats.score
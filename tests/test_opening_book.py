@@ -0,0 +1,89 @@
+import random
+
+import pytest
+from quoridor.src.ai_agents import Agent
+from quoridor.src.game import Game
+from quoridor.src.opening_book import BookAgent, OpeningBook, OpeningBookBuilder
+from quoridor.src.utils.helpers import encode_move
+from quoridor.src.utils.types import Move, Position
+
+UP_THE_MIDDLE = [Move.pawn(Position(1, 4)), Move.pawn(Position(7, 4)), Move.pawn(Position(2, 4))]
+FROM_THE_SIDE = [Move.pawn(Position(0, 3)), Move.pawn(Position(7, 4)), Move.pawn(Position(1, 3))]
+
+def codes(moves):
+    return [encode_move(move) for move in moves]
+
+@pytest.fixture
+def book():
+    builder = OpeningBookBuilder(max_plies=2)
+    for _ in range(3):
+        builder.add_moves(codes(UP_THE_MIDDLE), winner=1)
+    builder.add_moves(codes(FROM_THE_SIDE), winner=2)
+    return builder.build()
+
+class FixedAgent(Agent):
+    def __init__(self, move):
+        self.move = move
+        self.calls = 0
+
+    def select_move(self, game):
+        self.calls += 1
+        return self.move
+
+def test_lookup_counts_games_and_wins(book):
+    entries = book.lookup(Game())
+    assert entries == [(UP_THE_MIDDLE[0], 3, 3), (FROM_THE_SIDE[0], 1, 0)]
+    game = Game()
+    game.apply(UP_THE_MIDDLE[0])
+    # Only the first two plies were recorded
+    assert book.lookup(game) == [(UP_THE_MIDDLE[1], 3, 0)]
+    game.apply(UP_THE_MIDDLE[1])
+    assert game not in book
+    assert book.lookup(game) == []
+
+def test_min_games_drops_rare_moves():
+    builder = OpeningBookBuilder(max_plies=1)
+    builder.add_moves(codes(UP_THE_MIDDLE))
+    builder.add_moves(codes(UP_THE_MIDDLE))
+    builder.add_moves(codes(FROM_THE_SIDE))
+    assert [entry[0] for entry in builder.build(min_games=2).lookup(Game())] == [UP_THE_MIDDLE[0]]
+
+def test_transpositions_share_an_entry():
+    builder = OpeningBookBuilder(max_plies=4)
+    first = [Move.pawn(Position(1, 4)), Move.pawn(Position(7, 4)), Move.pawn(Position(1, 3)), Move.pawn(Position(6, 4))]
+    second = [Move.pawn(Position(0, 3)), Move.pawn(Position(7, 4)), Move.pawn(Position(1, 3)), Move.pawn(Position(6, 4))]
+    builder.add_moves(codes(first))
+    builder.add_moves(codes(second))
+    game = Game()
+    for move in first[:3]:
+        game.apply(move)
+    assert builder.build().lookup(game) == [(first[3], 2, 0)]
+
+def test_save_and_load(tmp_path, book):
+    path = tmp_path / "book.bin"
+    book.save(path)
+    assert path.stat().st_size == 4 + 4 + len(book) * (8 + 1 + 4 + 4)
+    loaded = OpeningBook.load(path)
+    assert list(loaded.keys) == list(book.keys)
+    assert loaded.lookup(Game()) == book.lookup(Game())
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        OpeningBook.load(path)
+
+def test_choose_prefers_the_most_played_move(book):
+    game = Game()
+    assert book.choose(game) == UP_THE_MIDDLE[0]
+    assert game.get_move_history() == []
+    picks = {book.choose(game, random.Random(seed)) for seed in range(30)}
+    assert picks == {UP_THE_MIDDLE[0], FROM_THE_SIDE[0]}
+    assert book.choose(game, min_games=5) is None
+
+def test_book_agent_falls_back_outside_the_book(book):
+    fallback = FixedAgent(Move.pawn(Position(1, 4)))
+    agent = BookAgent(book, fallback)
+    game = Game()
+    assert agent.select_move(game) == UP_THE_MIDDLE[0]
+    assert agent.last_from_book and fallback.calls == 0
+    game.apply(Move.pawn(Position(0, 5)))
+    agent.select_move(game)
+    assert not agent.last_from_book and fallback.calls == 1
@@ -0,0 +1,66 @@
+import random
+
+from quoridor.src.board import Board
+from quoridor.src.distance_map import UNREACHABLE, DistanceMap
+from quoridor.src.game import Game
+from quoridor.src.pathfinding import find_path, path_length
+from quoridor.src.utils.helpers import (
+    BOARD_WIDTH, DELTAS, DIRECTION_BITS, RIGHT, UP, cell_index, initial_open_edges,
+)
+from quoridor.src.utils.types import Position, WallOrientation
+
+def is_route(open_edges, path):
+    """Check that every step of a path crosses an open edge."""
+    for cell, next_cell in zip(path, path[1:]):
+        direction = DELTAS.index(next_cell - cell)
+        if not open_edges[cell] & DIRECTION_BITS[direction]:
+            return False
+    return True
+
+def test_open_board_path_is_straight():
+    open_edges = initial_open_edges()
+    path = find_path(open_edges, cell_index(Position(0, 4)), 8)
+    assert path == [cell_index(Position(row, 4)) for row in range(9)]
+    assert path_length(open_edges, cell_index(Position(5, 2)), 1) == 4
+
+def test_start_on_target_row():
+    open_edges = initial_open_edges()
+    assert find_path(open_edges, 40, 4) == [40]
+    assert path_length(open_edges, 40, 4) == 0
+
+def test_unreachable_row():
+    open_edges = initial_open_edges()
+    start = cell_index(Position(8, 0))
+    open_edges[start] &= ~(DIRECTION_BITS[UP] | DIRECTION_BITS[RIGHT])
+    assert find_path(open_edges, start, 0) == []
+    assert path_length(open_edges, start, 0) is None
+
+def test_path_goes_around_walls():
+    board = Board()
+    for col in (0, 2, 4, 6):
+        board.place_wall(WallOrientation.HORIZONTAL, Position(3, col))
+    path = find_path(board.open_edges, cell_index(Position(0, 0)), 8)
+    assert is_route(board.open_edges, path)
+    assert path[-1] // BOARD_WIDTH == 8
+    assert len(path) - 1 == 16  # 8 steps down plus 8 across to the gap in column 8
+
+def test_lengths_match_breadth_first_distances():
+    rng = random.Random(7)
+    for _ in range(10):
+        game = Game()
+        for _ in range(30):
+            walls = game.generate_legal_walls()
+            if not walls:
+                break
+            game.apply(rng.choice(walls))
+            game.walls_remaining = {1: 10, 2: 10}
+        open_edges = game.board.open_edges
+        for target_row in (0, 3, 8):
+            distances = DistanceMap(open_edges, target_row).distances
+            for cell in range(81):
+                path = find_path(open_edges, cell, target_row)
+                if distances[cell] == UNREACHABLE:
+                    assert path == []
+                else:
+                    assert len(path) - 1 == distances[cell]
+                    assert path[0] == cell and is_route(open_edges, path)
@@ -0,0 +1,68 @@
+import pytest
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.perft import STANDARD_POSITIONS, divide, main, perft, standard_position
+from quoridor.src.serialization import POSITION_FORMAT, decode_position
+from quoridor.src.utils.helpers import MOVE_CODE_COUNT, decode_move
+
+# Reference counts; depth-3 counts of the positions with walls take several
+# seconds each and are checked with `python -m quoridor.src.perft` instead
+REFERENCE_COUNTS = {
+    "start": {1: 131, 2: 16677, 3: 2062264},
+    "face_to_face": {1: 124, 2: 14935, 3: 1745763},
+    "walled": {1: 108, 2: 11402, 3: 1154498},
+    "no_walls_left": {1: 3, 2: 9, 3: 30, 4: 100, 5: 350, 6: 1225, 7: 4375, 8: 15375},
+}
+SLOW_NODES = 200000
+
+CASES = [
+    (name, depth, count)
+    for name, counts in REFERENCE_COUNTS.items() for depth, count in counts.items()
+]
+
+def brute_force_perft(game, depth):
+    """Count sequences by trying every move code on the game, without the move generator."""
+    if depth == 0:
+        return 1
+    nodes = 0
+    for code in range(MOVE_CODE_COUNT):
+        if game.apply(decode_move(code)):
+            nodes += brute_force_perft(game, depth - 1)
+            game.undo()
+    return nodes
+
+def test_every_standard_position_has_references():
+    assert set(REFERENCE_COUNTS) == set(STANDARD_POSITIONS)
+
+@pytest.mark.parametrize("name, depth, count", CASES)
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_reference_counts(name, depth, count, board_class):
+    if count > SLOW_NODES:
+        pytest.skip("slow; run python -m quoridor.src.perft")
+    assert perft(standard_position(name, board_class), depth) == count
+
+@pytest.mark.parametrize("name", STANDARD_POSITIONS)
+def test_generator_matches_brute_force(name):
+    game = standard_position(name)
+    assert perft(game, 1) == brute_force_perft(game, 1)
+
+def test_divide_sums_to_perft_and_leaves_game_unchanged():
+    game = standard_position("face_to_face")
+    hash_key = game.hash_key
+    counts = divide(game, 2)
+    assert len(counts) == 124
+    assert sum(count for _, count in counts) == 14935
+    assert game.hash_key == hash_key
+
+def test_perft_stops_at_finished_games():
+    # Player 1 one step from goal, player 2 in a corner, no walls left
+    game = decode_position(POSITION_FORMAT.pack(7 * 9 + 4, 8 * 9 + 0, 0, 0, 0, 0, 1))
+    assert perft(game, 0) == 1
+    assert perft(game, 1) == 4
+    assert perft(game, 2) == 3 * 2  # The winning step has no replies
+
+def test_command_line(capsys):
+    main(["--position", "no_walls_left", "--depth", "4", "--divide"])
+    output = capsys.readouterr().out
+    assert "perft(no_walls_left, 4) = 100" in output
+    assert "nodes/s" in output
@@ -0,0 +1,50 @@
+import json
+
+import pytest
+from quoridor.src.game import Game
+from quoridor.src.self_play import AgentFactory, play_game, run_self_play
+from quoridor.src.utils.helpers import decode_move
+
+FAST_AGENT = AgentFactory("alphabeta", time_budget_ms=50, max_depth=1)
+
+def test_play_game_record_replays_to_the_winner():
+    record = play_game([FAST_AGENT(), FAST_AGENT()], seed=1, opening_plies=2)
+    assert record["length"] == len(record["moves"]) == len(record["move_times_ms"])
+    game = Game()
+    for code in record["moves"]:
+        assert game.apply(decode_move(code))
+    assert game.get_winner() == record["winner"]
+
+def test_play_game_stops_at_max_plies():
+    record = play_game([FAST_AGENT(), FAST_AGENT()], max_plies=3)
+    assert record["length"] == 3
+    assert record["winner"] is None
+
+def test_opening_plies_depend_on_seed():
+    first = [play_game([FAST_AGENT(), FAST_AGENT()], seed=seed, opening_plies=4, max_plies=4)["moves"]
+             for seed in range(6)]
+    assert len({tuple(moves) for moves in first}) > 1
+    assert play_game([FAST_AGENT(), FAST_AGENT()], seed=3, opening_plies=4, max_plies=4)["moves"] == first[3]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_self_play_streams_one_line_per_game(tmp_path, workers):
+    output_path = tmp_path / "games.jsonl"
+    seen = []
+    stats = run_self_play([FAST_AGENT, FAST_AGENT], 4, output_path, workers=workers, opening_plies=2,
+                          progress=lambda stats: seen.append(stats.games))
+    records = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert sorted(record["game"] for record in records) == [0, 1, 2, 3]
+    assert [record["player1_agent"] for record in sorted(records, key=lambda r: r["game"])] == [0, 1, 0, 1]
+    assert seen == [1, 2, 3, 4]
+    assert stats.games == 4
+    assert sum(stats.wins.values()) == 4
+    assert stats.games_per_second > 0
+    assert stats.games_per_second_per_core > 0
+
+def test_agent_factory_parses_specs():
+    factory = AgentFactory.parse("mcts:iterations=50,exploration=0.5")
+    agent = factory()
+    assert agent.iterations == 50
+    assert agent.exploration == 0.5
+    with pytest.raises(ValueError):
+        AgentFactory.parse("nope")
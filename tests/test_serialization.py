@@ -0,0 +1,118 @@
+import io
+
+import pytest
+from quoridor.src.bitboard import BitBoard
+from quoridor.src.board import Board
+from quoridor.src.game import Game, GameState
+from quoridor.src.serialization import (
+    POSITION_SIZE, RECORD_FROM_POSITION, RECORD_FROM_START, RecordReader, RecordWriter,
+    decode_moves, decode_position, decode_varint, encode_position, encode_varint,
+)
+from quoridor.src.utils.helpers import encode_move
+from quoridor.src.utils.types import Move, Position
+from tests.factories import random_game
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**32, 2**64 - 1])
+def test_varint_round_trip(value):
+    data = b"\x05" + encode_varint(value) + b"\x07"
+    assert decode_varint(data, 1) == (value, len(data) - 1)
+
+def test_varint_sizes_and_errors():
+    assert len(encode_varint(127)) == 1
+    assert len(encode_varint(128)) == 2
+    with pytest.raises(ValueError):
+        encode_varint(-1)
+    with pytest.raises(ValueError):
+        decode_varint(b"\x80")
+
+@pytest.mark.parametrize("seed", range(4))
+def test_position_round_trip(seed):
+    game = random_game(seed)
+    data = encode_position(game)
+    assert len(data) == POSITION_SIZE <= 24
+    for board_class in (Board, BitBoard):
+        decoded = decode_position(data, board_class=board_class)
+        assert decoded.snapshot().board == game.snapshot().board
+        assert decoded.hash_key == game.hash_key
+        assert decoded.walls_remaining == game.walls_remaining
+        assert decoded.current_player_id == game.current_player_id
+        assert decoded.get_move_history() == []
+        assert decoded.get_legal_moves() == game.get_legal_moves()
+
+def test_position_with_swapped_pawns():
+    game = Game()
+    game.board.set_pawn_position(game.board.pawn1, Position(8, 4))
+    game.board.set_pawn_position(game.board.pawn2, Position(0, 4))
+    decoded = decode_position(encode_position(game))
+    assert decoded.board.pawn1.position == Position(8, 4)
+    assert decoded.board.fields[Position(8, 4)].pawn is decoded.board.pawn1
+    assert decoded.board.fields[Position(0, 4)].pawn is decoded.board.pawn2
+
+def test_finished_game_keeps_its_state():
+    game = Game()
+    for row, col in zip(range(1, 8), [3, 2, 1, 0, 1, 0, 1]):
+        assert game.apply(Move.pawn(Position(row, 4)))
+        assert game.apply(Move.pawn(Position(8, col)))
+    assert game.apply(Move.pawn(Position(8, 4)))
+    assert game.game_state == GameState.PLAYER1_WIN
+    assert decode_position(encode_position(game)).game_state == game.game_state
+    decoded = Game.from_bytes(game.to_bytes())
+    assert decoded.game_state == game.game_state
+    assert decoded.get_move_history() == game.get_move_history()
+
+@pytest.mark.parametrize("seed", range(4))
+def test_game_record_round_trip(seed):
+    game = random_game(seed)
+    data = game.to_bytes()
+    assert data[0] == RECORD_FROM_START
+    assert len(data) <= 2 + len(game.get_move_history())
+    decoded = Game.from_bytes(data)
+    assert decoded.snapshot() == game.snapshot()
+    assert decode_moves(data) == (None, bytes(encode_move(move) for move in game.get_move_history()))
+
+def test_game_record_from_a_position():
+    start = random_game(5, plies=10)
+    game = decode_position(encode_position(start))
+    game.apply(game.get_legal_moves()[0])
+    data = game.to_bytes()
+    assert data[0] == RECORD_FROM_POSITION
+    decoded = Game.from_bytes(data)
+    assert decoded.hash_key == game.hash_key
+    assert decoded.get_move_history() == game.get_move_history()
+    decoded.undo()
+    assert decoded.hash_key == start.hash_key
+
+def test_corrupt_records_are_rejected():
+    data = random_game(2).to_bytes()
+    with pytest.raises(ValueError):
+        Game.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        Game.from_bytes(b"\x09" + data[1:])
+    with pytest.raises(ValueError):
+        Game.from_bytes(bytes((RECORD_FROM_START, 2, 4, 4)))  # Pawn 1 can't move twice in place
+
+def test_stream_round_trip():
+    games = [random_game(seed) for seed in range(20)]
+    stream = io.BytesIO()
+    writer = RecordWriter(stream)
+    for game in games:
+        writer.write(game)
+    assert writer.count == 20
+
+    stream.seek(0)
+    # A tiny chunk size makes records straddle chunk boundaries
+    decoded = list(RecordReader(stream, chunk_size=7).games())
+    assert [game.snapshot() for game in decoded] == [game.snapshot() for game in games]
+
+def test_stream_appends_and_detects_truncation():
+    stream = io.BytesIO()
+    RecordWriter(stream).write(random_game(0))
+    RecordWriter(stream).write(random_game(1))
+    stream.seek(0)
+    assert len(list(RecordReader(stream))) == 2
+
+    truncated = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        list(RecordReader(truncated))
+    with pytest.raises(ValueError):
+        RecordReader(io.BytesIO(b"nope"))
@@ -0,0 +1,281 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from quoridor.src.game import Game
+from quoridor.src.load_generator import run_load
+from quoridor.src.server import GameServer
+from quoridor.src.utils.helpers import decode_move, encode_move
+
+FAST_AGENT = "alphabeta:time_budget_ms=20,max_depth=1"
+
+
+async def open_client(socket_path):
+    """Connect to the server; returns (request, writer), where `request` sends one JSON line."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+
+    async def request(message):
+        writer.write((message if isinstance(message, str) else json.dumps(message)).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+    return request, writer
+
+
+def serve(test, executor_class=ThreadPoolExecutor, **kwargs):
+    """Run `test(server, request)` against a server on a Unix socket."""
+    async def main(socket_path):
+        with executor_class(2) as executor:
+            server = GameServer(executor=executor, **kwargs)
+            await server.start_unix(socket_path)
+            request, writer = await open_client(socket_path)
+            try:
+                return await test(server, request)
+            finally:
+                writer.close()
+                await server.close()
+    return main
+
+
+def run(tmp_path, test, **kwargs):
+    return asyncio.run(serve(test, **kwargs)(str(tmp_path / "server.sock")))
+
+
+def test_hot_seat_game_is_validated_and_recorded(tmp_path):
+    async def test(server, request):
+        created = await request({"id": 7, "op": "new_game"})
+        assert created["ok"] and created["id"] == 7
+        game_id = created["game"]["game_id"]
+        assert created["game"]["pawns"] == [4, 76]
+        assert created["game"]["to_move"] == 1
+
+        moved = await request({"op": "move", "game_id": game_id, "move": 13})
+        assert moved["ok"]
+        assert moved["played"] == [13]
+        assert moved["game"]["pawns"] == [13, 76]
+        assert moved["game"]["to_move"] == 2
+
+        illegal = await request({"op": "move", "game_id": game_id, "move": 40})
+        assert illegal == {"ok": False, "error": "Illegal move 40"}
+        state = await request({"op": "state", "game_id": game_id})
+        assert state["game"]["moves"] == [13]
+
+        legal = await request({"op": "legal_moves", "game_id": game_id})
+        game = Game()
+        game.apply(decode_move(13))
+        assert sorted(legal["moves"]) == sorted(encode_move(move) for move in game.get_legal_moves())
+
+        assert (await request({"op": "close", "game_id": game_id}))["ok"]
+        assert game_id not in server.sessions
+    run(tmp_path, test)
+
+
+def test_bad_requests_get_errors(tmp_path):
+    async def test(server, request):
+        assert (await request("not json")) == {"ok": False, "error": "Invalid JSON"}
+        assert (await request({"op": "dance"}))["error"] == "Unknown op 'dance'"
+        assert (await request({"op": "state", "game_id": 99}))["error"] == "Unknown game 99"
+        assert not (await request({"op": "new_game", "opponent": "nope"}))["ok"]
+        game_id = (await request({"op": "new_game"}))["game"]["game_id"]
+        assert not (await request({"op": "move", "game_id": game_id, "move": 500}))["ok"]
+        assert not (await request({"op": "move", "game_id": game_id, "move": "e2"}))["ok"]
+    run(tmp_path, test)
+
+
+def test_ai_opponent_replies_in_the_executor(tmp_path):
+    async def test(server, request):
+        created = await request({"op": "new_game", "opponent": FAST_AGENT, "ai_player": 1})
+        assert len(created["played"]) == 1  # The AI opened
+        game_id = created["game"]["game_id"]
+        assert created["game"]["to_move"] == 2
+
+        legal = (await request({"op": "legal_moves", "game_id": game_id}))["moves"]
+        moved = await request({"op": "move", "game_id": game_id, "move": legal[0]})
+        assert moved["played"][0] == legal[0]
+        assert len(moved["played"]) == 2
+        assert moved["game"]["moves"] == created["played"] + moved["played"]
+
+        resigned = await request({"op": "resign", "game_id": game_id})
+        assert resigned["game"]["status"] == "resign"
+        assert resigned["game"]["winner"] == 1
+    run(tmp_path, test)
+
+
+def test_clock_runs_out(tmp_path):
+    async def test(server, request):
+        game_id = (await request({"op": "new_game", "clock_ms": 30, "increment_ms": 0}))["game"]["game_id"]
+        await asyncio.sleep(0.05)
+        state = (await request({"op": "state", "game_id": game_id}))["game"]
+        assert state["status"] == "time"
+        assert state["winner"] == 2
+        assert state["clocks_ms"][0] == 0
+        assert (await request({"op": "move", "game_id": game_id, "move": 13}))["error"] == "Game is over"
+    run(tmp_path, test)
+
+
+def test_clock_is_charged_and_incremented(tmp_path):
+    async def test(server, request):
+        game_id = (await request({"op": "new_game", "clock_ms": 10000, "increment_ms": 1000}))["game"]["game_id"]
+        state = (await request({"op": "move", "game_id": game_id, "move": 13}))["game"]
+        assert 10000 < state["clocks_ms"][0] <= 11000
+        assert state["clocks_ms"][1] <= 10000
+    run(tmp_path, test)
+
+
+def test_server_limits_games(tmp_path):
+    async def test(server, request):
+        assert (await request({"op": "new_game"}))["ok"]
+        assert (await request({"op": "new_game"}))["error"] == "Server is full"
+    run(tmp_path, test, max_games=1)
+
+
+def test_load_generator_plays_concurrent_games(tmp_path):
+    socket_path = str(tmp_path / "server.sock")
+
+    async def main():
+        server = GameServer(executor=ThreadPoolExecutor(1))
+        await server.start_unix(socket_path)
+        try:
+            return await run_load(lambda: asyncio.open_unix_connection(socket_path), clients=20, seconds=0.5)
+        finally:
+            await server.close()
+            server.executor.shutdown()
+
+    report = asyncio.run(main()).to_dict()
+    assert report["errors"] == 0
+    assert report["moves"] > 20
+    assert report["moves_per_second"] > 0
+    assert report["p50_ms"] <= report["p99_ms"] <= report["max_ms"]
+
+
+def test_ai_search_is_capped_by_its_clock(tmp_path):
+    # The spec allows 5 s a move, but the AI only has 300 ms on its clock
+    slow_agent = "alphabeta:time_budget_ms=5000"
+
+    async def test(server, request):
+        created = await request({"op": "new_game", "opponent": slow_agent, "clock_ms": 300})
+        moved = await request({"op": "move", "game_id": created["game"]["game_id"], "move": 13})
+        assert moved["ok"]
+        assert len(moved["played"]) == 2
+        assert moved["game"]["status"] == "ongoing"
+        assert 0 < moved["game"]["clocks_ms"][1] <= 300
+    run(tmp_path, test)
+
+
+def test_ai_out_of_time_ends_the_game_cleanly(tmp_path):
+    async def test(server, request):
+        opened = await request({"op": "new_game", "opponent": FAST_AGENT, "ai_player": 1, "clock_ms": 0})
+        assert opened["ok"]
+        assert opened["played"] == []
+        assert opened["game"]["status"] == "time"
+        assert opened["game"]["winner"] == 2
+        assert opened["game"]["game_id"] in server.sessions
+    run(tmp_path, test)
+
+
+def test_opponent_options_are_limited(tmp_path):
+    async def test(server, request):
+        for spec, error in [
+            ("alphabeta:tt_memory_mb=8192", "Option 'tt_memory_mb' is not allowed for alphabeta opponents"),
+            ("mcts:iterations=100,workers=16", "Option 'workers' is not allowed for mcts opponents"),
+            ("alphabeta:time_budget_ms=600000", "time_budget_ms must be an integer from 1 to 10000"),
+            ("alphabeta:max_depth=deep", "max_depth must be an integer from 1 to 64"),
+        ]:
+            assert (await request({"op": "new_game", "opponent": spec}))["error"] == error
+        # mcts needs a budget, caught when the game is created rather than inside the executor
+        assert (await request({"op": "new_game", "opponent": "mcts"}))["error"].startswith("Invalid opponent")
+        assert not (await request({"op": "new_game", "opponent": 3}))["ok"]
+        assert server.sessions == {}
+        assert (await request({"op": "new_game", "opponent": "mcts:iterations=20"}))["ok"]
+    run(tmp_path, test)
+
+
+def test_games_are_private_to_their_connection(tmp_path):
+    socket_path = str(tmp_path / "server.sock")
+
+    async def main():
+        server = GameServer(executor=ThreadPoolExecutor(1))
+        await server.start_unix(socket_path)
+        owner, owner_writer = await open_client(socket_path)
+        other, other_writer = await open_client(socket_path)
+        try:
+            game_id = (await owner({"op": "new_game"}))["game"]["game_id"]
+            for message in [
+                {"op": "move", "game_id": game_id, "move": 13},
+                {"op": "state", "game_id": game_id},
+                {"op": "legal_moves", "game_id": game_id},
+                {"op": "resign", "game_id": game_id},
+                {"op": "close", "game_id": game_id},
+            ]:
+                assert (await other(message))["error"] == f"Unknown game {game_id}"
+            state = (await owner({"op": "state", "game_id": game_id}))["game"]
+            assert state["moves"] == [] and state["status"] == "ongoing"
+        finally:
+            owner_writer.close()
+            other_writer.close()
+            await server.close()
+            server.executor.shutdown()
+    asyncio.run(main())
+
+
+def test_games_starting_with_an_ai_move_count_against_the_limit(tmp_path):
+    socket_path = str(tmp_path / "server.sock")
+
+    async def main():
+        server = GameServer(executor=ThreadPoolExecutor(2), max_games=1)
+        await server.start_unix(socket_path)
+        clients = [await open_client(socket_path) for _ in range(3)]
+        try:
+            message = {"op": "new_game", "opponent": "alphabeta:time_budget_ms=100", "ai_player": 1}
+            responses = await asyncio.gather(*(request(message) for request, _ in clients))
+            assert sum(response["ok"] for response in responses) == 1
+            assert [response.get("error") for response in responses].count("Server is full") == 2
+            assert len(server.sessions) == 1
+        finally:
+            for _, writer in clients:
+                writer.close()
+            await server.close()
+            server.executor.shutdown()
+    asyncio.run(main())
+
+
+class BrokenExecutor(ThreadPoolExecutor):
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("executor is down")
+
+
+def test_failed_requests_keep_the_connection_and_leave_no_game(tmp_path):
+    async def test(server, request):
+        failed = await request({"op": "new_game", "opponent": FAST_AGENT, "ai_player": 1})
+        assert failed == {"ok": False, "error": "Internal error: RuntimeError: executor is down"}
+        assert server.sessions == {}
+        assert (await request({"op": "new_game", "clock_ms": "x"}))["error"] == "clock_ms must be a non-negative integer"
+        assert not (await request({"op": "new_game", "increment_ms": -1}))["ok"]
+        assert (await request({"op": "state", "game_id": [1]}))["error"] == "Unknown game [1]"
+        assert (await request({"op": "new_game"}))["ok"]
+    run(tmp_path, test, executor_class=BrokenExecutor)
+
+
+def test_games_are_dropped_when_their_connection_closes(tmp_path):
+    socket_path = str(tmp_path / "server.sock")
+
+    async def main():
+        server = GameServer(executor=ThreadPoolExecutor(1), max_games=2)
+        await server.start_unix(socket_path)
+        try:
+            for _ in range(3):
+                reader, writer = await asyncio.open_unix_connection(socket_path)
+                for _ in range(2):
+                    writer.write(b'{"op": "new_game"}\n')
+                    await writer.drain()
+                    assert json.loads(await reader.readline())["ok"]
+                writer.close()
+                await writer.wait_closed()
+                for _ in range(100):
+                    if not server.sessions:
+                        break
+                    await asyncio.sleep(0.01)
+                assert server.sessions == {}
+        finally:
+            await server.close()
+            server.executor.shutdown()
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+import random
+
+from quoridor.src.ai_agents import WIN_SCORE, AlphaBetaAgent
+from quoridor.src.serialization import POSITION_FORMAT, decode_position
+from quoridor.src.tablebase import DRAW, LOSS, WIN, EndgameTablebase, solve_layout
+from quoridor.src.utils.helpers import initial_open_edges
+from quoridor.src.utils.types import Move, Position
+
+def endgame(cell1, cell2, player_id=1, horizontal=0, vertical=0):
+    """A position with no walls left on either side."""
+    return decode_position(POSITION_FORMAT.pack(cell1, cell2, horizontal, vertical, 0, 0, player_id))
+
+def test_open_board_race_goes_to_side_to_move_when_level():
+    tablebase = EndgameTablebase()
+    # Both pawns on their start rows in different columns: 8 steps each, player 1 first
+    assert tablebase.probe(endgame(0 * 9 + 2, 8 * 9 + 6, 1)) == (WIN, 15)
+    assert tablebase.probe(endgame(0 * 9 + 2, 8 * 9 + 6, 2)) == (WIN, 15)
+
+def test_one_step_from_goal_is_a_win_in_one():
+    tablebase = EndgameTablebase()
+    assert tablebase.probe(endgame(7 * 9 + 4, 8 * 9 + 0, 1)) == (WIN, 1)
+    assert tablebase.best_move(endgame(7 * 9 + 4, 8 * 9 + 0, 1)) == Move.pawn(Position(8, 4))
+
+def test_behind_in_the_race_is_a_loss():
+    tablebase = EndgameTablebase()
+    result, distance = tablebase.probe(endgame(0 * 9 + 0, 2 * 9 + 8, 1))
+    assert result == LOSS
+    assert distance == 4
+
+def test_only_positions_without_walls_are_covered():
+    tablebase = EndgameTablebase()
+    game = endgame(0 * 9 + 0, 8 * 9 + 8)
+    game.walls_remaining[2] = 1
+    assert tablebase.probe(game) is None
+    assert tablebase.best_move(game) is None
+
+def test_tables_are_cached_per_wall_layout():
+    tablebase = EndgameTablebase(max_layouts=1)
+    tablebase.probe(endgame(0, 80))
+    tablebase.probe(endgame(1, 79))
+    assert (tablebase.solves, tablebase.hits) == (1, 1)
+    tablebase.probe(endgame(0, 80, horizontal=1))
+    tablebase.probe(endgame(0, 80))
+    assert tablebase.solves == 3
+
+def test_results_are_consistent_with_successors():
+    table = solve_layout(initial_open_edges())
+    rng = random.Random(3)
+    for _ in range(200):
+        cell1, cell2 = rng.sample(range(9, 72), 2)
+        for player_id in (1, 2):
+            result, distance = table.probe(player_id, (cell1, cell2))
+            assert result in (WIN, LOSS, DRAW)
+            game = endgame(cell1, cell2, player_id)
+            move = EndgameTablebase().best_move(game)
+            assert game.apply(move)
+            if game.is_game_over():
+                assert (result, distance) == (WIN, 1)
+                continue
+            reply_result, reply_distance = EndgameTablebase().probe(game)
+            if result == WIN:
+                assert (reply_result, reply_distance) == (LOSS, distance - 1)
+            elif result == LOSS:
+                assert (reply_result, reply_distance) == (WIN, distance - 1)
+
+def test_alpha_beta_agent_plays_tablebase_moves():
+    game = endgame(0 * 9 + 0, 2 * 9 + 8, 2)
+    agent = AlphaBetaAgent(time_budget_ms=1000, tablebase=EndgameTablebase())
+    move = agent.select_move(game)
+    assert move == Move.pawn(Position(1, 8))
+    assert agent.last_stats.score == WIN_SCORE - 3
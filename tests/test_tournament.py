@@ -0,0 +1,148 @@
+import json
+import math
+
+import pytest
+from quoridor.src import tournament as tournament_module
+from quoridor.src.mcts import MCTSAgent
+from quoridor.src.tournament import (
+    SPRT, MatchStats, Tournament, elo_from_score, fit_ratings, gauntlet, round_robin, score_from_elo,
+)
+
+ENTRANTS = {
+    "ab1": "alphabeta:time_budget_ms=20,max_depth=1",
+    "ab1b": "alphabeta:time_budget_ms=20,max_depth=1",
+    "ab2": "alphabeta:time_budget_ms=50,max_depth=2",
+}
+
+
+def match(first, second, wins, draws, losses):
+    stats = MatchStats(first, second)
+    stats.wins, stats.draws, stats.losses = wins, draws, losses
+    return stats
+
+
+def test_elo_and_score_are_inverse():
+    assert score_from_elo(0) == 0.5
+    for elo in (-300, -50, 0, 120, 400):
+        assert elo_from_score(score_from_elo(elo)) == pytest.approx(elo)
+    assert elo_from_score(1) == math.inf
+    assert elo_from_score(0) == -math.inf
+
+
+def test_pairings():
+    assert round_robin(["a", "b", "c"]) == [("a", "b"), ("a", "c"), ("b", "c")]
+    assert gauntlet("b", ["a", "b", "c"]) == [("b", "a"), ("b", "c")]
+
+
+def test_match_interval_contains_estimate_and_narrows():
+    small = match("a", "b", 6, 2, 4)
+    large = match("a", "b", 60, 20, 40)
+    assert small.elo() == pytest.approx(large.elo())
+    low, high = small.elo_interval()
+    assert low < small.elo() < high
+    large_low, large_high = large.elo_interval()
+    assert large_high - large_low < high - low
+
+
+def test_sprt_accepts_the_right_hypothesis():
+    sprt = SPRT(0, 50)
+    assert sprt.decide(0, 0, 0) is None
+    assert sprt.decide(3, 0, 1) is None  # Too few games for either
+    assert sprt.decide(140, 20, 40) == "H1"
+    assert sprt.decide(50, 20, 130) == "H0"
+    with pytest.raises(ValueError):
+        SPRT(10, 0)
+
+
+def test_fit_ratings_orders_agents_and_averages_zero():
+    ratings = fit_ratings([match("a", "b", 30, 0, 10), match("b", "c", 30, 0, 10), match("a", "c", 35, 0, 5)])
+    assert ratings["a"][0] > ratings["b"][0] > ratings["c"][0]
+    assert sum(elo for elo, _ in ratings.values()) == pytest.approx(0, abs=1e-6)
+    assert all(0 < margin < math.inf for _, margin in ratings.values())
+    unbeaten = fit_ratings([match("a", "b", 10, 0, 0)])
+    assert math.isfinite(unbeaten["a"][0])
+
+
+def test_tournament_alternates_colors_and_checkpoints(tmp_path):
+    checkpoint = tmp_path / "run.jsonl"
+    tournament = Tournament(ENTRANTS, round_robin(["ab1", "ab2"]), games_per_pair=4, workers=1,
+                            checkpoint_path=str(checkpoint), max_plies=200)
+    tournament.run()
+    assert tournament.games_played == 4
+    assert tournament.matches[0].games == 4
+    lines = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+    assert lines[0]["tournament"]["entrants"] == ENTRANTS
+    assert sorted(line["game"] for line in lines[1:]) == [0, 1, 2, 3]
+    # Even games have the first agent as player 1, odd games as player 2
+    for line in lines[1:]:
+        first_player = 1 if line["game"] % 2 == 0 else 2
+        if line["winner"] is not None:
+            assert line["score"] == (1.0 if line["winner"] == first_player else 0.0)
+    assert "ab1 vs ab2" in tournament.table()
+
+    resumed = Tournament(ENTRANTS, round_robin(["ab1", "ab2"]), games_per_pair=6, workers=1,
+                         checkpoint_path=str(checkpoint), max_plies=200).run()
+    assert resumed.games_played == 2
+    assert resumed.matches[0].games == 6
+    assert resumed.matches[0].wins >= tournament.matches[0].wins
+
+    with pytest.raises(ValueError):
+        Tournament(ENTRANTS, round_robin(["ab1", "ab2"]), games_per_pair=6, workers=1,
+                   checkpoint_path=str(checkpoint), seed=5).run()
+
+
+def test_sprt_stops_a_decided_pairing(tmp_path):
+    loose = SPRT(-400, 400, alpha=0.3, beta=0.3)
+    tournament = Tournament(ENTRANTS, gauntlet("ab2", ["ab1", "ab1b"]), games_per_pair=40, workers=2,
+                            sprt=loose, max_plies=200).run()
+    for stats in tournament.matches:
+        assert stats.decision in ("H0", "H1")
+        assert stats.games < 40
+
+
+def test_unknown_entrant_is_rejected():
+    with pytest.raises(ValueError):
+        Tournament(ENTRANTS, [("ab1", "nobody")])
+    with pytest.raises(ValueError):
+        Tournament({"x": "nope", "y": "nope"}, [("x", "y")])
+
+
+def test_clean_sweep_keeps_a_finite_lower_bound():
+    low, high = match("a", "b", 7, 0, 0).elo_interval()
+    assert 0 < low < math.inf
+    assert high == math.inf
+
+
+def test_resume_drops_a_line_cut_short(tmp_path):
+    checkpoint = tmp_path / "run.jsonl"
+    pairs = round_robin(["ab1", "ab2"])
+    Tournament(ENTRANTS, pairs, games_per_pair=2, workers=1, checkpoint_path=str(checkpoint), max_plies=200).run()
+    complete = checkpoint.read_text()
+    checkpoint.write_text(complete + '{"pair":0,"game":2,"sco')  # Killed mid-write
+
+    resumed = Tournament(ENTRANTS, pairs, games_per_pair=3, workers=1, checkpoint_path=str(checkpoint),
+                         max_plies=200).run()
+    assert resumed.games_played == 1
+    assert resumed.matches[0].games == 3
+    lines = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+    assert sorted(line["game"] for line in lines[1:]) == [0, 1, 2]
+
+    checkpoint.write_text('{"tournament": {}}\nnot json\n{"pair":0}\n')
+    with pytest.raises(ValueError):
+        Tournament(ENTRANTS, pairs, workers=1, checkpoint_path=str(checkpoint)).run()
+
+
+def test_every_game_gets_fresh_agents_that_are_closed(monkeypatch):
+    played, closed = [], []
+    monkeypatch.setattr(MCTSAgent, "close", lambda agent: closed.append(agent))
+
+    def fake_play_game(agents, *args):
+        played.append(agents)
+        return {"winner": 1}
+
+    monkeypatch.setattr(tournament_module, "play_game", fake_play_game)
+    for game_index in range(2):
+        tournament_module._play_task((0, game_index, "mcts:iterations=10", "mcts:iterations=10", 0, 2, 200))
+    agents = [agent for pair in played for agent in pair]
+    assert len({id(agent) for agent in agents}) == 4
+    assert sorted(map(id, closed)) == sorted(map(id, agents))
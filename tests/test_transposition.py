@@ -0,0 +1,66 @@
+import pytest
+from quoridor.src.ai_agents import AlphaBetaAgent
+from quoridor.src.game import Game
+from quoridor.src.transposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def test_store_and_probe_round_trip():
+    table = TranspositionTable(memory_mb=1)
+    move = Move.wall(WallOrientation.VERTICAL, Position(3, 6))
+    table.store(0xDEADBEEFCAFEF00D, 5, LOWER_BOUND, -1234, move)
+    assert table.probe(0xDEADBEEFCAFEF00D) == (5, LOWER_BOUND, -1234, move)
+    table.store(42, 0, EXACT, 7)
+    assert table.probe(42) == (0, EXACT, 7, None)
+    assert table.probe(43) is None
+
+def test_scores_must_fit_an_entry():
+    table = TranspositionTable(memory_mb=1)
+    table.store(1, 3, EXACT, 12.75, None)
+    assert table.probe(1) == (3, EXACT, 12, None)
+    for score in (2**31, -2**31 - 1):
+        with pytest.raises(ValueError):
+            table.store(2, 3, EXACT, score)
+    # A rejected store leaves the depth, bound and move of other entries alone
+    assert table.probe(1) == (3, EXACT, 12, None)
+    assert table.probe(2) is None
+
+def test_memory_is_capped():
+    table = TranspositionTable(memory_mb=2)
+    assert table.memory_bytes <= 2 * 1024 * 1024
+    assert table.memory_bytes > 1024 * 1024
+    for key in range(100000):
+        table.store(key * 0x9E3779B97F4A7C15 & (2**64 - 1), 1, EXACT, key)
+    assert table.memory_bytes <= 2 * 1024 * 1024
+    assert len(table) <= 2 * table.bucket_count
+
+def test_depth_preferred_and_always_replace_slots():
+    table = TranspositionTable(memory_mb=1)
+    same_bucket = [1, 1 + table.bucket_count, 1 + 2 * table.bucket_count]
+    table.store(same_bucket[0], 8, EXACT, 1)
+    table.store(same_bucket[1], 2, EXACT, 2)  # Shallower: goes to the always-replace slot
+    assert table.probe(same_bucket[0])[0] == 8
+    assert table.probe(same_bucket[1])[0] == 2
+    table.store(same_bucket[2], 3, UPPER_BOUND, 3)  # Replaces the shallow entry only
+    assert table.probe(same_bucket[0]) is not None
+    assert table.probe(same_bucket[1]) is None
+    table.new_search()
+    table.store(same_bucket[1], 1, EXACT, 4)  # Deep entry is from an old search now
+    assert table.probe(same_bucket[0]) is None
+    assert table.probe(same_bucket[1]) == (1, EXACT, 4, None)
+
+def pawn_race():
+    """Both players out of walls, so the search only sees pawn moves."""
+    game = Game()
+    for row in range(5):
+        for col in (0, 2, 4, 6):
+            assert game.apply(Move.wall(WallOrientation.HORIZONTAL, Position(row, col)))
+    return game
+
+def test_agent_with_table_agrees_and_searches_fewer_nodes():
+    game = pawn_race()
+    plain = AlphaBetaAgent(time_budget_ms=60000, max_depth=5)
+    cached = AlphaBetaAgent(time_budget_ms=60000, max_depth=5, tt_memory_mb=4)
+    assert cached.select_move(game) == plain.select_move(game)
+    assert cached.last_stats.score == plain.last_stats.score
+    assert cached.last_stats.nodes < plain.last_stats.nodes
+    assert cached.last_stats.tt_cutoffs > 0
@@ -0,0 +1,28 @@
+import pytest
+from quoridor.src.board import Field, Pawn, WallSlot
+from quoridor.src.utils.types import INTERNED_POSITIONS, Direction, Move, Position, position_at
+
+def test_position_at_returns_interned_positions():
+    assert position_at(3, 5) is INTERNED_POSITIONS[3 * 9 + 5]
+    assert position_at(3, 5) == Position(3, 5)
+    assert position_at(-1, 5) == Position(-1, 5)
+
+def test_position_arithmetic_does_not_allocate_on_board():
+    position = position_at(4, 4)
+    assert position + Direction.UP.value is position_at(3, 4)
+    assert position - Direction.LEFT.value is position_at(4, 5)
+    assert position_at(0, 0) + Direction.UP.value == Position(-1, 0)
+
+@pytest.mark.parametrize("value", [
+    Position(1, 2), Move.pawn(Position(1, 2)), Pawn(1, Position(0, 4)), Field(), WallSlot(),
+])
+def test_core_types_have_no_instance_dict(value):
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.unexpected = 1
+
+def test_position_equality_and_hash():
+    assert Position(2, 3) == position_at(2, 3)
+    assert hash(Position(2, 3)) == hash(position_at(2, 3))
+    assert Position(2, 3) != (2, 3)
+    assert tuple(position_at(2, 3)) == (2, 3)
@@ -0,0 +1,57 @@
+import random
+
+from quoridor.src import zobrist
+from quoridor.src.game import Game
+from quoridor.src.utils.types import Move, Position, WallOrientation
+
+def random_move(game, rng):
+    if rng.random() < 0.5 and game.get_walls_remaining(game.get_current_player()) > 0:
+        return Move.wall(rng.choice(list(WallOrientation)), Position(rng.randrange(8), rng.randrange(8)))
+    return Move.pawn(rng.choice(game.get_valid_moves()))
+
+def test_incremental_hash_matches_full_computation():
+    """The key kept up to date by moves and undos always equals a from-scratch computation."""
+    rng = random.Random(7)
+    game = Game()
+    for _ in range(200):
+        if game.is_game_over() or (game.undo_stack and rng.random() < 0.3):
+            assert game.undo()
+        else:
+            game.apply(random_move(game, rng))
+        assert game.hash_key == zobrist.compute_hash(game)
+
+def test_transpositions_share_a_key():
+    """The same position reached through different move orders has the same key."""
+    first = Game()
+    for move in (Move.wall(WallOrientation.HORIZONTAL, Position(5, 5)), Move.pawn(Position(7, 4)),
+                 Move.pawn(Position(1, 4))):
+        assert first.apply(move)
+    second = Game()
+    for move in (Move.pawn(Position(1, 4)), Move.pawn(Position(7, 4)),
+                 Move.wall(WallOrientation.HORIZONTAL, Position(5, 5))):
+        assert second.apply(move)
+    assert first.hash_key == second.hash_key
+
+    third = Game()
+    for move in (Move.wall(WallOrientation.HORIZONTAL, Position(5, 5)), Move.pawn(Position(7, 4)),
+                 Move.pawn(Position(1, 4)), Move.pawn(Position(6, 4)), Move.pawn(Position(2, 4)),
+                 Move.pawn(Position(7, 4)), Move.pawn(Position(1, 4))):
+        assert third.apply(move)
+    assert third.hash_key == first.hash_key
+
+    fourth = Game()
+    for move in (Move.pawn(Position(1, 4)), Move.wall(WallOrientation.HORIZONTAL, Position(5, 5)),
+                 Move.pawn(Position(2, 4)), Move.pawn(Position(7, 4)), Move.pawn(Position(1, 4))):
+        assert fourth.apply(move)
+    # Same pawns and wall, but the wall came from the other player's supply
+    assert fourth.hash_key != first.hash_key
+
+def test_side_to_move_changes_key():
+    game = Game()
+    initial_key = game.hash_key
+    game.apply(Move.pawn(Position(1, 4)))
+    game.apply(Move.pawn(Position(7, 4)))
+    game.apply(Move.pawn(Position(0, 4)))
+    assert game.hash_key != initial_key
+    game.apply(Move.pawn(Position(8, 4)))
+    assert game.hash_key == initial_key